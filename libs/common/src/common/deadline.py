@@ -0,0 +1,182 @@
+import contextlib
+import logging
+import time
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Iterator, Optional
+
+from aiohttp import ClientTimeout
+from aioprometheus import Counter, Histogram
+from quart import Quart, request, g
+from quart.typing import ResponseReturnValue
+
+from common.metrics import get_or_create_metric
+from common.metrics.quart import get_registry
+
+DEADLINE_HEADER = "x-rh-timeout-ms"
+
+_DEADLINE_EXCEEDED_METRIC_NAME = "deadline_exceeded_total"
+_DEADLINE_WASTED_METRIC_NAME = "deadline_wasted_seconds"
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class Deadline:
+    """Point in time (monotonic clock) after which the current work is no longer useful."""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @staticmethod
+    def after(seconds: float) -> "Deadline":
+        return Deadline(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+def get_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+def set_deadline(deadline: Optional[Deadline]):
+    return _current_deadline.set(deadline)
+
+
+@contextlib.contextmanager
+def deadline_scope(seconds: float) -> Iterator[Deadline]:
+    """
+    Narrows the current deadline to at most `seconds` from now for the enclosed block.
+    An already shorter deadline is kept.
+    """
+    current = get_deadline()
+    deadline = Deadline.after(seconds)
+    if current is not None and current.expires_at < deadline.expires_at:
+        deadline = current
+
+    token = set_deadline(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def apply_deadline(kwargs: Dict) -> Dict:
+    """
+    Caps the `timeout` of an aiohttp request with the time left in the current deadline.
+    Raises DeadlineExceeded if the deadline already passed, so we don't start work nobody will wait for.
+    """
+    deadline = get_deadline()
+    if deadline is None:
+        return kwargs
+
+    if deadline.expired():
+        raise DeadlineExceeded("Deadline exceeded before sending the request")
+
+    remaining = deadline.remaining()
+    timeout: Optional[ClientTimeout] = kwargs.get("timeout")
+    if timeout is None or timeout.total is None or timeout.total > remaining:
+        kwargs["timeout"] = ClientTimeout(total=remaining)
+
+    return kwargs
+
+
+def _parse_deadline_header(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+
+    try:
+        milliseconds = float(value)
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            f"Ignoring invalid {DEADLINE_HEADER} header: {value}"
+        )
+        return None
+
+    if milliseconds <= 0:
+        return None
+
+    return milliseconds / 1000
+
+
+def register_deadline(
+    app: Quart,
+    app_name: str,
+    default_timeout: Optional[float] = None,
+    route_timeouts: Optional[Dict[str, float]] = None,
+    on_deadline_exceeded: Optional[Callable[[], Awaitable[ResponseReturnValue]]] = None,
+):
+    """
+    Sets a deadline for every request from the `x-rh-timeout-ms` header (remaining budget in milliseconds),
+    falling back to the endpoint timeout in `route_timeouts` or `default_timeout`. The shorter wins when
+    both the header and a default are present.
+
+    When the deadline is exceeded, `on_deadline_exceeded` is used to build the response, otherwise a 504 is returned.
+    """
+    registry = get_registry(app)
+    deadline_exceeded_total = get_or_create_metric(
+        registry,
+        _DEADLINE_EXCEEDED_METRIC_NAME,
+        Counter,
+        "Total number of requests that ran out of their deadline",
+        const_labels={"app": app_name},
+    )
+    deadline_wasted = get_or_create_metric(
+        registry,
+        _DEADLINE_WASTED_METRIC_NAME,
+        Histogram,
+        "Time spent in seconds on requests that ran out of their deadline",
+        const_labels={"app": app_name},
+        buckets=[0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0],
+    )
+    route_timeouts = route_timeouts or {}
+
+    @app.before_request
+    async def set_request_deadline():
+        g.deadline_request_start_time = time.monotonic()
+        timeouts = [
+            timeout
+            for timeout in (
+                _parse_deadline_header(request.headers.get(DEADLINE_HEADER)),
+                route_timeouts.get(request.endpoint, default_timeout),
+            )
+            if timeout is not None
+        ]
+
+        set_deadline(Deadline.after(min(timeouts)) if timeouts else None)
+
+    @app.errorhandler(TimeoutError)
+    async def handle_deadline_exceeded(error: TimeoutError):
+        deadline = get_deadline()
+        if not isinstance(error, DeadlineExceeded) and (
+            deadline is None or not deadline.expired()
+        ):
+            # A timeout unrelated to the deadline
+            raise error
+
+        try:
+            labels = {
+                "path": request.url_rule.rule
+                if request.url_rule is not None
+                else "<unknown>",
+            }
+            deadline_exceeded_total.inc(labels)
+            deadline_wasted.observe(
+                labels, time.monotonic() - g.deadline_request_start_time
+            )
+        except Exception as e:
+            logging.getLogger(__name__).error("Failed to send deadline metrics", e)
+
+        if on_deadline_exceeded is not None:
+            return await on_deadline_exceeded()
+
+        return "Deadline exceeded", 504
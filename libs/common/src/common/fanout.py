@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Generic, Optional, TypeVar
+
+from aioprometheus import Histogram, Registry
+
+from common.deadline import deadline_scope
+from common.metrics import get_or_create_metric
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class BranchResult(Generic[T]):
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+    timed_out: bool = False
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+class FanOut:
+    """
+    Runs independent calls (branches) concurrently and waits for all of them, each one bounded by its own timeout.
+    A branch that fails or times out does not affect the others, its `BranchResult` tells what happened so the caller
+    can answer with partial data.
+
+    Timeouts are looked up by `"<fan out>.<branch>"` in `timeouts`, falling back to `default_timeout`. The timeout also
+    narrows the deadline of the branch, so platform requests inside it give up in time.
+    """
+
+    def __init__(
+        self,
+        metrics_registry: Optional[Registry] = None,
+        app_name: str = "",
+        timeouts: Optional[Dict[str, float]] = None,
+        default_timeout: Optional[float] = None,
+    ):
+        self.timeouts = timeouts or {}
+        self.default_timeout = default_timeout
+
+        self._branch_duration: Optional[Histogram] = None
+        if metrics_registry is not None:
+            self._branch_duration = get_or_create_metric(
+                metrics_registry,
+                "fanout_branch_duration_seconds",
+                Histogram,
+                "Time spent in seconds on each branch of a fan out by result: ok, error or timeout",
+                const_labels={"app": app_name},
+                buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+            )
+
+    async def run(
+        self, name: str, branches: Dict[str, Callable[[], Awaitable[T]]]
+    ) -> Dict[str, BranchResult[T]]:
+        results = await asyncio.gather(
+            *[self._run_branch(name, branch, call) for branch, call in branches.items()]
+        )
+        return dict(zip(branches, results))
+
+    def timeout_for(self, name: str, branch: str) -> Optional[float]:
+        return self.timeouts.get(f"{name}.{branch}", self.default_timeout)
+
+    async def _run_branch(
+        self, name: str, branch: str, call: Callable[[], Awaitable[T]]
+    ) -> BranchResult[T]:
+        timeout = self.timeout_for(name, branch)
+        start = time.monotonic()
+        try:
+            if timeout is None:
+                value = await call()
+            else:
+                with deadline_scope(timeout):
+                    async with asyncio.timeout(timeout):
+                        value = await call()
+        except TimeoutError:
+            result = BranchResult(timed_out=True, duration=time.monotonic() - start)
+            logger.warning(f"{name}: {branch} timed out after {result.duration:.2f}s")
+        except Exception as e:
+            result = BranchResult(error=e, duration=time.monotonic() - start)
+            logger.error(f"{name}: {branch} failed: {e}")
+        else:
+            result = BranchResult(value=value, duration=time.monotonic() - start)
+
+        self._record(name, branch, result)
+        return result
+
+    def _record(self, name: str, branch: str, result: BranchResult):
+        if self._branch_duration is None:
+            return
+        try:
+            self._branch_duration.observe(
+                {
+                    "fanout": name,
+                    "branch": branch,
+                    "result": "ok"
+                    if result.ok
+                    else ("timeout" if result.timed_out else "error"),
+                },
+                result.duration,
+            )
+        except Exception as e:
+            logger.error("Failed to send fan out metrics", e)
@@ -0,0 +1,155 @@
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import injector
+import quart
+from quart import Blueprint, Quart, Response, request
+from quart_schema import validate_response
+
+from common.timing import UpstreamCall, ensure_phase_timer, get_phase_timer
+
+QUART_EXTENSION_FLIGHT_RECORDER = "flight_recorder"
+
+
+@dataclass
+class RequestRecord:
+    method: str
+    path: str
+    """Route template of the request"""
+    status: str
+    duration: float
+    """Milliseconds"""
+    timestamp: float
+    """Unix time at which the request finished"""
+    phases: Dict[str, float]
+    calls: List[UpstreamCall]
+    dropped_calls: int
+
+
+class FlightRecorder:
+    """
+    Keeps the phase timings and upstream calls of the `slowest` requests seen since the app started and of the last
+    `errors` failed ones (5xx), so outliers can be looked into after the fact. Memory is bound by
+    the number of records, each holding at most `MAX_UPSTREAM_CALLS` calls.
+    """
+
+    def __init__(self, slowest: int = 20, errors: int = 20):
+        self.slowest_size = slowest
+        self._slowest: List[Tuple[float, int, RequestRecord]] = []
+        self._errors: Deque[RequestRecord] = deque(maxlen=errors)
+        self._sequence = itertools.count()
+
+    def is_slow(self, duration: float) -> bool:
+        """Whether a request that took `duration` would make it to the slowest requests."""
+        return self.slowest_size > 0 and (
+            len(self._slowest) < self.slowest_size or duration > self._slowest[0][0]
+        )
+
+    def record(self, record: RequestRecord, error: bool = False):
+        if error and self._errors.maxlen:
+            self._errors.append(record)
+
+        if self.is_slow(record.duration):
+            entry = (record.duration, next(self._sequence), record)
+            if len(self._slowest) < self.slowest_size:
+                heapq.heappush(self._slowest, entry)
+            else:
+                heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self) -> List[RequestRecord]:
+        return [record for _, _, record in sorted(self._slowest, reverse=True)]
+
+    def errors(self) -> List[RequestRecord]:
+        return list(reversed(self._errors))
+
+
+def register_flight_recorder(
+    app: Quart,
+    recorder: FlightRecorder,
+    accept_paths: Optional[Callable[[quart.Request], bool]] = None,
+):
+    """Feeds the recorder with the requests of the app, see `get_flight_recorder`."""
+    if QUART_EXTENSION_FLIGHT_RECORDER in app.extensions:
+        raise ValueError(
+            "Flight recorder is already registered, only call 'register_flight_recorder' once."
+        )
+    app.extensions[QUART_EXTENSION_FLIGHT_RECORDER] = recorder
+
+    def observe(status: str, error: bool):
+        if accept_paths is not None and not accept_paths(request):
+            return
+
+        timer = get_phase_timer()
+        if timer is None:
+            return
+
+        duration = (time.monotonic() - timer.start) * 1000
+        if not error and not recorder.is_slow(duration):
+            return
+
+        try:
+            recorder.record(
+                RequestRecord(
+                    method=request.method,
+                    path=request.url_rule.rule
+                    if request.url_rule is not None
+                    else "<unknown>",
+                    status=status,
+                    duration=round(duration, 1),
+                    timestamp=time.time(),
+                    phases=timer.breakdown(),
+                    calls=list(timer.calls),
+                    dropped_calls=timer.dropped_calls,
+                ),
+                error=error,
+            )
+        except Exception as e:
+            logging.getLogger(__name__).error("Failed to record the request", e)
+
+    @app.before_request
+    async def start_recording():
+        ensure_phase_timer()
+
+    @app.after_request
+    async def record_response(response: Response) -> Response:
+        # Unhandled exceptions get here as a 500
+        observe(str(response.status_code), response.status_code >= 500)
+        return response
+
+
+def get_flight_recorder(app: Quart) -> FlightRecorder:
+    if QUART_EXTENSION_FLIGHT_RECORDER not in app.extensions:
+        raise KeyError(
+            f"Flight recorder '{QUART_EXTENSION_FLIGHT_RECORDER}' is missing. Please ensure it is registered via 'register_flight_recorder'."
+        )
+    return app.extensions[QUART_EXTENSION_FLIGHT_RECORDER]
+
+
+blueprint = Blueprint("flight_recorder", __name__, url_prefix="/flight_recorder")
+
+
+@dataclass
+class FlightRecorderResponse:
+    slowest: List[RequestRecord]
+    """Slowest requests since the app started, slowest first"""
+
+    errors: List[RequestRecord]
+    """Last failed requests, newest first"""
+
+
+@blueprint.get("/requests")
+@validate_response(FlightRecorderResponse)
+async def requests(
+    flight_recorder: injector.Inject[FlightRecorder],
+) -> FlightRecorderResponse:
+    """
+    Returns the phase timings and upstream calls of the slowest and the last failed requests of this instance
+    """
+    return FlightRecorderResponse(
+        slowest=flight_recorder.slowest(), errors=flight_recorder.errors()
+    )
@@ -0,0 +1,230 @@
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import injector
+import quart
+from aioprometheus import Gauge, Registry
+from quart import Blueprint, Quart, Response, request
+from quart_schema import validate_response
+
+from common.metrics import get_or_create_metric
+
+QUART_EXTENSION_HEAVY_HITTERS = "heavy_hitters"
+_HEAVY_HITTER_METRIC_NAME = "heavy_hitter_requests"
+
+logger = logging.getLogger(__name__)
+
+
+class CountMinSketch:
+    """
+    Approximate counts of an unbounded number of keys in `width * depth` counters. Estimates never undercount, they
+    overcount by at most `2 / width` of the total with a probability of `1 - 0.5 ** depth`.
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self._rows = [[0] * width for _ in range(depth)]
+
+    def _indexes(self, key: str) -> Iterable[Tuple[List[int], int]]:
+        for seed, row in enumerate(self._rows):
+            yield row, hash((seed, key)) % self.width
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Counts `key` and returns its new estimate."""
+        estimate = None
+        for row, index in self._indexes(key):
+            row[index] += count
+            if estimate is None or row[index] < estimate:
+                estimate = row[index]
+        return estimate
+
+    def estimate(self, key: str) -> int:
+        return min(row[index] for row, index in self._indexes(key))
+
+
+class HeavyHitters:
+    """The `k` most frequent keys of a stream, with their estimated counts, in bounded memory."""
+
+    def __init__(self, k: int = 20, width: int = 2048, depth: int = 4):
+        self.k = k
+        self.total = 0
+        self._sketch = CountMinSketch(width, depth)
+        self._top: Dict[str, int] = {}
+
+    def add(self, key: str) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Counts `key`. Returns its estimate if the key is in the top k (`None` otherwise) and the key it replaced, if any.
+        """
+        self.total += 1
+        estimate = self._sketch.add(key)
+
+        if key in self._top or len(self._top) < self.k:
+            self._top[key] = estimate
+            return estimate, None
+
+        smallest = min(self._top, key=self._top.__getitem__)
+        if estimate <= self._top[smallest]:
+            return None, None
+
+        del self._top[smallest]
+        self._top[key] = estimate
+        return estimate, smallest
+
+    def estimate(self, key: str) -> int:
+        return self._sketch.estimate(key)
+
+    def top(self) -> List[Tuple[str, int]]:
+        """Most frequent keys, most frequent first"""
+        return sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+
+
+@dataclass
+class HeavyHitter:
+    key: str
+    count: int
+    """Estimated requests, may overcount"""
+
+
+@dataclass
+class DimensionTop:
+    total: int
+    """Requests counted in the dimension"""
+    top: List[HeavyHitter]
+    """Most frequent keys, most frequent first"""
+
+
+class HeavyHitterTracker:
+    """
+    Finds the heaviest keys of a few dimensions of the traffic (e.g. the orgs or intents with the most requests) without
+    using them as labels of every metric. Only the current top `k` keys of each dimension are exported in
+    `heavy_hitter_requests{dimension, key}`, keys that fall out of the top are removed, so the metric holds at most
+    `k` series per dimension.
+
+    Counts are since the instance started: compare the share of the `total` of each key rather than their rate.
+    """
+
+    def __init__(
+        self,
+        registry: Registry,
+        app_name: str,
+        k: int = 20,
+        width: int = 2048,
+        depth: int = 4,
+    ):
+        self.k = k
+        self._width = width
+        self._depth = depth
+        self._dimensions: Dict[str, HeavyHitters] = {}
+        self.requests = get_or_create_metric(
+            registry,
+            _HEAVY_HITTER_METRIC_NAME,
+            Gauge,
+            "Estimated requests of the most frequent keys (e.g. orgs or intents) by dimension",
+            const_labels={"app": app_name},
+        )
+
+    def add(self, dimension: str, key: str):
+        heavy_hitters = self._dimensions.get(dimension)
+        if heavy_hitters is None:
+            heavy_hitters = HeavyHitters(self.k, self._width, self._depth)
+            self._dimensions[dimension] = heavy_hitters
+
+        estimate, evicted = heavy_hitters.add(key)
+        if estimate is None:
+            return
+
+        try:
+            if evicted is not None:
+                del self.requests.values[{"dimension": dimension, "key": evicted}]
+            self.requests.set({"dimension": dimension, "key": key}, estimate)
+        except Exception as e:
+            logger.error("Failed to send heavy hitter metrics", e)
+
+    def top(self) -> Dict[str, DimensionTop]:
+        return {
+            dimension: DimensionTop(
+                total=heavy_hitters.total,
+                top=[HeavyHitter(key, count) for key, count in heavy_hitters.top()],
+            )
+            for dimension, heavy_hitters in sorted(self._dimensions.items())
+        }
+
+
+_request_keys: ContextVar[Optional[Dict[str, str]]] = ContextVar(
+    "heavy_hitter_request_keys", default=None
+)
+
+
+def record_request_key(dimension: str, key: Optional[str]):
+    """
+    Counts the current request under `key` in `dimension` once it is done. Recording the same dimension twice in a
+    request keeps the last key, so a request is counted once per dimension.
+    """
+    keys = _request_keys.get()
+    if keys is not None and key is not None:
+        keys[dimension] = key
+
+
+def register_heavy_hitters(
+    app: Quart,
+    tracker: HeavyHitterTracker,
+    accept_paths: Optional[Callable[[quart.Request], bool]] = None,
+):
+    """
+    Feeds the route of every request and the keys recorded with `record_request_key` to the tracker, see
+    `get_heavy_hitters`.
+    """
+    if QUART_EXTENSION_HEAVY_HITTERS in app.extensions:
+        raise ValueError(
+            "Heavy hitters are already registered, only call 'register_heavy_hitters' once."
+        )
+    app.extensions[QUART_EXTENSION_HEAVY_HITTERS] = tracker
+
+    @app.before_request
+    async def start_recording():
+        if accept_paths is None or accept_paths(request):
+            _request_keys.set({})
+
+    @app.after_request
+    async def record_keys(response: Response) -> Response:
+        keys = _request_keys.get()
+        if keys is not None:
+            _request_keys.set(None)
+            keys.setdefault(
+                "route",
+                request.url_rule.rule if request.url_rule is not None else "<unknown>",
+            )
+            for dimension, key in keys.items():
+                tracker.add(dimension, key)
+        return response
+
+
+def get_heavy_hitters(app: Quart) -> HeavyHitterTracker:
+    if QUART_EXTENSION_HEAVY_HITTERS not in app.extensions:
+        raise KeyError(
+            f"Heavy hitters '{QUART_EXTENSION_HEAVY_HITTERS}' are missing. Please ensure they are registered via 'register_heavy_hitters'."
+        )
+    return app.extensions[QUART_EXTENSION_HEAVY_HITTERS]
+
+
+blueprint = Blueprint("heavy_hitters", __name__, url_prefix="/heavy_hitters")
+
+
+@dataclass
+class HeavyHittersResponse:
+    dimensions: Dict[str, DimensionTop]
+    """Most frequent keys of each dimension (e.g. route, org or intent) since the app started"""
+
+
+@blueprint.get("")
+@validate_response(HeavyHittersResponse)
+async def heavy_hitters(
+    tracker: injector.Inject[HeavyHitterTracker],
+) -> HeavyHittersResponse:
+    """
+    Returns the routes, orgs (and intents) with the most requests on this instance
+    """
+    return HeavyHittersResponse(dimensions=tracker.top())
@@ -1,11 +1,14 @@
 import abc
+import asyncio
+from typing import Optional
 
 import quart
 from werkzeug.exceptions import BadRequest
 
 import injector
-from common.session_storage import SessionStorage
+from common.session_storage import Session, SessionStorage
 from common.auth import decoded_identity_header
+from common.timing import phase
 
 
 class AbstractUserIdentityProvider(abc.ABC):
@@ -19,19 +22,36 @@ class AbstractUserIdentityProvider(abc.ABC):
 
 
 class QuartWatsonExtensionUserIdentityProvider(AbstractUserIdentityProvider):
+    """
+    Resolves the identity from the session of the `x-rh-session-id` header. Bound per request, the session is looked up
+    once and shared by everything that needs it during the request.
+    """
+
     def __init__(
         self, request: quart.Request, session_storage: injector.Inject[SessionStorage]
     ):
         self.request = request
         self.session_storage = session_storage
+        self._session: Optional[asyncio.Future[Optional[Session]]] = None
 
-    async def get_user_identity(self):
+    async def get_session(self) -> Optional[Session]:
         session_header_name = "x-rh-session-id"
         if session_header_name not in self.request.headers:
             raise BadRequest(f"Missing ${session_header_name}")
 
-        session_id = self.request.headers[session_header_name]
-        return (await self.session_storage.get(session_id)).user_identity
+        if self._session is None:
+            # A task, concurrent callers of the request wait for the same lookup
+            self._session = asyncio.ensure_future(
+                self._load_session(self.request.headers[session_header_name])
+            )
+        return await self._session
+
+    async def _load_session(self, session_id: str) -> Optional[Session]:
+        with phase("session"):
+            return await self.session_storage.get(session_id)
+
+    async def get_user_identity(self):
+        return (await self.get_session()).user_identity
 
 
 class QuartRedHatUserIdentityProvider(AbstractUserIdentityProvider):
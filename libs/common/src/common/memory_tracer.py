@@ -0,0 +1,198 @@
+import asyncio
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Literal, Optional
+
+import injector
+from pydantic import BaseModel, Field
+from quart import Blueprint
+from quart_schema import validate_querystring, validate_response
+from werkzeug.exceptions import Conflict, NotFound
+
+GroupBy = Literal["lineno", "filename"]
+
+_IGNORED_FILES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class MemoryTracingNotStarted(RuntimeError):
+    """Raised when a snapshot is requested while tracemalloc is not tracing."""
+
+
+class MemorySnapshotBusy(RuntimeError):
+    """Raised when a snapshot is requested while another one is being taken."""
+
+
+@dataclass
+class AllocationStat:
+    location: str
+    """`file:line`, or only the file when grouped by filename"""
+    size: int
+    """Bytes"""
+    count: int
+    size_diff: int = 0
+    """Bytes allocated (or freed if negative) since the previous snapshot"""
+    count_diff: int = 0
+
+
+@dataclass
+class MemorySnapshot:
+    traced_memory: int
+    """Bytes currently allocated by python code, as seen by tracemalloc"""
+    peak_traced_memory: int
+    top: List[AllocationStat]
+    """Biggest allocators, biggest first"""
+    growth: Optional[List[AllocationStat]]
+    """Allocators that grew (or shrank) the most since the previous snapshot, `None` for the first snapshot"""
+
+
+def _location(traceback: tracemalloc.Traceback, group_by: GroupBy) -> str:
+    frame = traceback[0]
+    if group_by == "filename":
+        return frame.filename
+    return f"{frame.filename}:{frame.lineno}"
+
+
+class MemoryTracer:
+    """
+    Drives `tracemalloc` on a running instance to find where memory grows: start tracing, take a snapshot, let the
+    instance take traffic and take another one to see the allocators that grew in between.
+
+    Tracing slows allocations down and keeps a traceback per allocated block, it is off until `start` is called.
+    Only the last snapshot is kept, as the baseline of the next one, and only one snapshot is taken at a time.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self):
+        tracemalloc.stop()
+        self._previous = None
+
+    async def snapshot(
+        self, limit: int = 20, group_by: GroupBy = "lineno"
+    ) -> MemorySnapshot:
+        if not tracemalloc.is_tracing():
+            raise MemoryTracingNotStarted("Memory tracing is not started")
+        if self._lock.locked():
+            raise MemorySnapshotBusy("A snapshot is already being taken")
+
+        async with self._lock:
+            # Grouping the traces of a big heap takes a while
+            return await asyncio.to_thread(self._snapshot, limit, group_by)
+
+    def _snapshot(self, limit: int, group_by: GroupBy) -> MemorySnapshot:
+        traced_memory, peak_traced_memory = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_FILES)
+        previous, self._previous = self._previous, snapshot
+
+        top = [
+            AllocationStat(
+                location=_location(stat.traceback, group_by),
+                size=stat.size,
+                count=stat.count,
+            )
+            for stat in snapshot.statistics(group_by)[:limit]
+        ]
+
+        growth = None
+        if previous is not None:
+            growth = [
+                AllocationStat(
+                    location=_location(stat.traceback, group_by),
+                    size=stat.size,
+                    count=stat.count,
+                    size_diff=stat.size_diff,
+                    count_diff=stat.count_diff,
+                )
+                for stat in snapshot.compare_to(previous, group_by)[:limit]
+            ]
+
+        return MemorySnapshot(
+            traced_memory=traced_memory,
+            peak_traced_memory=peak_traced_memory,
+            top=top,
+            growth=growth,
+        )
+
+
+blueprint = Blueprint("memory", __name__, url_prefix="/memory")
+
+
+class StartTracingRequestQuery(BaseModel):
+    frames: int = Field(default=1, ge=1, le=50)
+
+
+class SnapshotRequestQuery(BaseModel):
+    limit: int = Field(default=20, ge=1, le=200)
+    group_by: GroupBy = "lineno"
+
+
+@dataclass
+class MemoryTracingResponse:
+    tracing: bool
+
+
+def _ensure_enabled(memory_tracer: MemoryTracer):
+    if not memory_tracer.enabled:
+        raise NotFound()
+
+
+@blueprint.post("/tracing")
+@validate_querystring(StartTracingRequestQuery)
+@validate_response(MemoryTracingResponse)
+async def start_tracing(
+    query_args: StartTracingRequestQuery,
+    memory_tracer: injector.Inject[MemoryTracer],
+) -> MemoryTracingResponse:
+    """
+    Starts tracing the allocations of this instance, keeping `frames` frames of traceback per allocation
+    """
+    _ensure_enabled(memory_tracer)
+    memory_tracer.start(query_args.frames)
+    return MemoryTracingResponse(tracing=memory_tracer.tracing)
+
+
+@blueprint.delete("/tracing")
+@validate_response(MemoryTracingResponse)
+async def stop_tracing(
+    memory_tracer: injector.Inject[MemoryTracer],
+) -> MemoryTracingResponse:
+    """
+    Stops tracing the allocations and drops the last snapshot
+    """
+    _ensure_enabled(memory_tracer)
+    memory_tracer.stop()
+    return MemoryTracingResponse(tracing=memory_tracer.tracing)
+
+
+@blueprint.post("/snapshots")
+@validate_querystring(SnapshotRequestQuery)
+@validate_response(MemorySnapshot)
+async def snapshot(
+    query_args: SnapshotRequestQuery,
+    memory_tracer: injector.Inject[MemoryTracer],
+) -> MemorySnapshot:
+    """
+    Returns the biggest allocators and the ones that changed the most since the previous snapshot. Only one snapshot is
+    taken at a time, a second request gets a 409.
+    """
+    _ensure_enabled(memory_tracer)
+    try:
+        return await memory_tracer.snapshot(query_args.limit, query_args.group_by)
+    except (MemoryTracingNotStarted, MemorySnapshotBusy) as e:
+        raise Conflict(str(e))
@@ -1,4 +1,4 @@
-from typing import Optional, TypeVar
+from typing import Optional, Set, TypeVar
 
 from aioprometheus import Registry
 from aioprometheus.collectors import Collector, LabelsType
@@ -24,3 +24,27 @@ def get_or_create_metric(
     return collector(
         name=name, doc=doc, const_labels=const_labels, registry=registry, **kwargs
     )
+
+
+OTHER_LABEL_VALUE = "other"
+
+
+class LabelCardinalityGuard:
+    """
+    Limits the number of distinct values a label can take. Once `max_values` distinct values have been seen,
+    any new value is folded into `other`, keeping the registry (and scrape) size bounded.
+    """
+
+    def __init__(self, max_values: int):
+        self.max_values = max_values
+        self._values: Set[str] = set()
+
+    def __call__(self, value: str) -> str:
+        if value in self._values:
+            return value
+
+        if len(self._values) >= self.max_values:
+            return OTHER_LABEL_VALUE
+
+        self._values.add(value)
+        return value
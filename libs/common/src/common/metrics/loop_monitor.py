@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from aioprometheus import Counter, Gauge, Histogram, Registry
+
+from common.metrics import get_or_create_metric
+
+_LAG_METRIC_NAME = "event_loop_lag_seconds"
+_BLOCKED_METRIC_NAME = "event_loop_blocked_total"
+_EXECUTOR_QUEUE_METRIC_NAME = "default_executor_queue_depth"
+_EXECUTOR_WORKERS_METRIC_NAME = "default_executor_workers"
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """
+    Watches the health of the event loop it is started on:
+
+    - how late a timer scheduled every `interval` seconds wakes up (the time callbacks had to wait for the loop)
+    - stalls longer than `blocked_threshold` seconds, detected from a watchdog thread that logs the stack of the code
+      blocking the loop (e.g. sync file I/O or CPU bound work)
+    - queue depth and active workers of the default executor used by `asyncio.to_thread`
+    """
+
+    def __init__(
+        self,
+        registry: Registry,
+        app_name: str,
+        interval: float = 0.5,
+        blocked_threshold: float = 0.25,
+    ):
+        self.interval = interval
+        self.blocked_threshold = blocked_threshold
+
+        self.lag = get_or_create_metric(
+            registry,
+            _LAG_METRIC_NAME,
+            Histogram,
+            "Delay in seconds between when a timer should run in the event loop and when it runs",
+            const_labels={"app": app_name},
+            buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+        )
+        self.blocked_total = get_or_create_metric(
+            registry,
+            _BLOCKED_METRIC_NAME,
+            Counter,
+            "Times the event loop was blocked for longer than the threshold",
+            const_labels={"app": app_name},
+        )
+        self.executor_queue = get_or_create_metric(
+            registry,
+            _EXECUTOR_QUEUE_METRIC_NAME,
+            Gauge,
+            "Work items waiting for a thread of the default executor",
+            const_labels={"app": app_name},
+        )
+        self.executor_workers = get_or_create_metric(
+            registry,
+            _EXECUTOR_WORKERS_METRIC_NAME,
+            Gauge,
+            "Threads of the default executor by state: active or idle",
+            const_labels={"app": app_name},
+        )
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+
+        self._task = asyncio.create_task(self._tick())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self):
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _tick(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self._heartbeat = time.monotonic()
+            self._observe(max(self._heartbeat - expected, 0.0))
+
+    def _observe(self, lag: float):
+        try:
+            self.lag.observe({}, lag)
+
+            executor = getattr(self._loop, "_default_executor", None)
+            if isinstance(executor, ThreadPoolExecutor):
+                # Private attributes of ThreadPoolExecutor, there is no public api for them
+                threads = len(executor._threads)
+                idle = min(executor._idle_semaphore._value, threads)
+                self.executor_queue.set({}, executor._work_queue.qsize())
+                self.executor_workers.set({"state": "active"}, threads - idle)
+                self.executor_workers.set({"state": "idle"}, idle)
+        except Exception as e:
+            logger.error("Failed to send loop monitor metrics", e)
+
+    def _watch(self):
+        reported = False
+        while not self._stopped.wait(self.blocked_threshold / 2):
+            blocked = time.monotonic() - self._heartbeat - self.interval
+            if blocked <= self.blocked_threshold:
+                reported = False
+                continue
+
+            if reported:
+                continue
+
+            reported = True
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<unknown>"
+            logger.warning(
+                f"Event loop blocked for more than {blocked:.3f}s, currently running:\n{stack}"
+            )
+            # Counted from the loop, once it is free again
+            self._loop.call_soon_threadsafe(self.blocked_total.inc, {})
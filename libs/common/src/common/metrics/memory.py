@@ -0,0 +1,91 @@
+import asyncio
+import gc
+import logging
+import os
+from typing import Optional
+
+from aioprometheus import Counter, Gauge, Registry
+
+from common.metrics import get_or_create_metric
+
+_RSS_METRIC_NAME = "process_resident_memory_bytes"
+_GC_COUNT_METRIC_NAME = "python_gc_generation_count"
+_GC_COLLECTIONS_METRIC_NAME = "python_gc_collections_total"
+
+logger = logging.getLogger(__name__)
+
+
+def resident_memory() -> Optional[int]:
+    """Resident set size of the process in bytes, `None` where `/proc` is not available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class MemoryMonitor:
+    """
+    Exports the resident memory of the process and, for each gc generation, the count that triggers its next
+    collection (`gc.get_count`) and the collections done since the start, every `interval` seconds.
+    """
+
+    def __init__(self, registry: Registry, app_name: str, interval: float = 15):
+        self.interval = interval
+
+        self.rss = get_or_create_metric(
+            registry,
+            _RSS_METRIC_NAME,
+            Gauge,
+            "Resident memory of the process in bytes",
+            const_labels={"app": app_name},
+        )
+        self.gc_count = get_or_create_metric(
+            registry,
+            _GC_COUNT_METRIC_NAME,
+            Gauge,
+            "Allocations (for generation 0) or collections of the younger generation since the last collection of the generation",
+            const_labels={"app": app_name},
+        )
+        self.gc_collections = get_or_create_metric(
+            registry,
+            _GC_COLLECTIONS_METRIC_NAME,
+            Counter,
+            "Collections of the gc generation since the process started",
+            const_labels={"app": app_name},
+        )
+
+        self._task: Optional[asyncio.Task] = None
+
+    def observe(self):
+        try:
+            rss = resident_memory()
+            if rss is not None:
+                self.rss.set({}, rss)
+
+            for generation, (count, stats) in enumerate(
+                zip(gc.get_count(), gc.get_stats())
+            ):
+                labels = {"generation": str(generation)}
+                self.gc_count.set(labels, count)
+                # Counted by the interpreter, the counter follows its value
+                self.gc_collections.set(labels, stats["collections"])
+        except Exception as e:
+            logger.error("Failed to send memory metrics", e)
+
+    def start(self):
+        self._task = asyncio.create_task(self._tick())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _tick(self):
+        while True:
+            self.observe()
+            await asyncio.sleep(self.interval)
@@ -4,13 +4,23 @@ from typing import Callable, Optional
 
 import quart
 from quart import Quart, request, g
-from aioprometheus import Registry, Counter, Histogram
+from aioprometheus import Registry, Counter, Gauge, Histogram
 from aioprometheus.service import Service
 
+from common.metrics.loop_monitor import LoopMonitor
+from common.metrics.memory import MemoryMonitor
+
 QUART_EXTENSION_METRIC_REGISTRY = "metric_registry"
 
 
-def register_app(app: Quart, port: int, metrics_path="/metrics"):
+def register_app(
+    app: Quart,
+    port: int,
+    metrics_path="/metrics",
+    app_name: str = "",
+    monitor_loop: bool = True,
+    monitor_memory: bool = True,
+):
     if QUART_EXTENSION_METRIC_REGISTRY in app.extensions:
         raise ValueError(
             "Metrics registry is already registered, only call it 'register_app' once."
@@ -19,15 +29,25 @@ def register_app(app: Quart, port: int, metrics_path="/metrics"):
     registry = Registry()
     app.extensions[QUART_EXTENSION_METRIC_REGISTRY] = registry
     service = Service()
+    loop_monitor = LoopMonitor(registry, app_name) if monitor_loop else None
+    memory_monitor = MemoryMonitor(registry, app_name) if monitor_memory else None
 
     @app.before_serving
     async def start_metric_server():
         await service.start(port=port, metrics_url=metrics_path)
         logging.getLogger(__name__).info(f"Serving metrics on {service.metrics_url}")
         service.registry = registry
+        if loop_monitor is not None:
+            loop_monitor.start()
+        if memory_monitor is not None:
+            memory_monitor.start()
 
     @app.after_serving
     async def spot_metrics_server():
+        if loop_monitor is not None:
+            await loop_monitor.stop()
+        if memory_monitor is not None:
+            await memory_monitor.stop()
         await service.stop()
 
 
@@ -43,7 +63,13 @@ def register_http_metrics(
     app: Quart,
     app_name: str,
     accept_paths: Optional[Callable[[quart.Request], bool]] = None,
+    concurrency_target: Optional[int] = None,
 ):
+    """
+    Exports the count and latency of the requests and the requests in flight per route. When a `concurrency_target`
+    (requests a replica should handle at once) is given, `http_requests_saturation_ratio` reports the requests in
+    flight over that target, as a metric to scale on.
+    """
     registry = get_registry(app)
     http_requests_total = Counter(
         "http_requests_total",
@@ -58,10 +84,49 @@ def register_http_metrics(
         const_labels={"app": app_name},
         registry=registry,
     )
+    http_requests_in_flight = Gauge(
+        "http_requests_in_flight",
+        "HTTP requests being handled",
+        const_labels={"app": app_name},
+        registry=registry,
+    )
+    http_requests_saturation = (
+        Gauge(
+            "http_requests_saturation_ratio",
+            "HTTP requests being handled over the number of requests a replica should handle at once",
+            const_labels={"app": app_name},
+            registry=registry,
+        )
+        if concurrency_target
+        else None
+    )
+    in_flight = 0
+
+    def update_in_flight(path: str, delta: int):
+        nonlocal in_flight
+        in_flight += delta
+        try:
+            http_requests_in_flight.add({"path": path}, delta)
+            if http_requests_saturation is not None:
+                http_requests_saturation.set({}, in_flight / concurrency_target)
+        except Exception as e:
+            logging.getLogger(__name__).error("Failed to send http metrics", e)
 
     @app.before_request
     async def before():
         g.metrics_request_start_time = time.monotonic()
+        if accept_paths is None or accept_paths(request):
+            g.metrics_in_flight_path = (
+                request.url_rule.rule if request.url_rule is not None else "<unknown>"
+            )
+            update_in_flight(g.metrics_in_flight_path, 1)
+
+    @app.teardown_request
+    async def teardown(exc):
+        # Runs for every request, including those that failed before reaching after_request
+        path = g.pop("metrics_in_flight_path", None)
+        if path is not None:
+            update_in_flight(path, -1)
 
     @app.after_request
     async def after(response):
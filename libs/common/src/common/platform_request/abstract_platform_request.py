@@ -1,5 +1,5 @@
 import abc
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from aiohttp import ClientResponse
 
 from aiohttp.hdrs import (
@@ -12,6 +12,8 @@ from aiohttp.hdrs import (
     METH_DELETE,
 )
 
+from common.platform_request.pagination import paginate
+
 
 class AbstractPlatformRequest(abc.ABC):
     @abc.abstractmethod
@@ -96,3 +98,24 @@ class AbstractPlatformRequest(abc.ABC):
         return await self.request(
             METH_DELETE, base_url, api_path, user_identity, **kwargs
         )
+
+    def paginate(
+        self,
+        base_url: str,
+        api_path: str,
+        user_identity: Optional[str] = None,
+        page_size: int = 100,
+        max_items: Optional[int] = None,
+        data_key: str = "data",
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        return paginate(
+            self,
+            base_url,
+            api_path,
+            user_identity,
+            page_size=page_size,
+            max_items=max_items,
+            data_key=data_key,
+            **kwargs,
+        )
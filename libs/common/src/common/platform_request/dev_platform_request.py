@@ -1,5 +1,6 @@
 from typing import Optional
 
+from common.deadline import apply_deadline
 from common.platform_request.abstract_platform_request import AbstractPlatformRequest
 
 from werkzeug.exceptions import InternalServerError
@@ -27,6 +28,7 @@ class DevPlatformRequest(AbstractPlatformRequest):
                 "client_id": "rhsm-api",
                 "refresh_token": self._refresh_token,
             },
+            **apply_deadline({}),
         )
 
         if not result.ok:
@@ -67,5 +69,5 @@ class DevPlatformRequest(AbstractPlatformRequest):
             headers["Authorization"] = "Bearer " + self._dev_token
 
         return await self.session.request(
-            method, f"{base_url}{api_path}", headers=headers, **kwargs
+            method, f"{base_url}{api_path}", headers=headers, **apply_deadline(kwargs)
         )
@@ -0,0 +1,110 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from yarl import URL
+
+if TYPE_CHECKING:
+    from common.platform_request import AbstractPlatformRequest
+
+# (api_path, params) of the next page to fetch
+_PageRequest = Tuple[str, Optional[Dict[str, Any]]]
+
+
+def _next_page(
+    content: Dict[str, Any],
+    items: List[Any],
+    page_request: _PageRequest,
+    page_size: int,
+) -> Optional[_PageRequest]:
+    links = content.get("links")
+    if isinstance(links, dict) and "next" in links:
+        next_link = links["next"]
+        if not next_link:
+            return None
+        # Some services send the full url, we only need the path and query
+        return URL(next_link).path_qs, None
+
+    # limit/offset style, stop on the last (short) page or once we reach the count
+    if len(items) < page_size:
+        return None
+
+    api_path, params = page_request
+    offset = (params or {}).get("offset", 0) + len(items)
+    count = content.get("meta", {}).get("count")
+    if count is not None and offset >= count:
+        return None
+
+    return api_path, {**(params or {}), "offset": offset}
+
+
+async def paginate(
+    platform_request: "AbstractPlatformRequest",
+    base_url: str,
+    api_path: str,
+    user_identity: Optional[str] = None,
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    data_key: str = "data",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Iterates the items of a paginated console API, following `links.next` when the service sends it
+    and `limit`/`offset` otherwise.
+
+    The next page is fetched while the current one is consumed, so at most two pages are held in memory.
+    Iteration stops after `max_items` items.
+
+    The pending prefetch is only cancelled when the generator is closed, so callers that may stop early (a `break`,
+    an exception while consuming an item) iterate it within `contextlib.aclosing`:
+
+        async with contextlib.aclosing(platform_request.paginate(...)) as items:
+            async for item in items:
+                ...
+    """
+    params = kwargs.pop("params", None)
+    if max_items is not None:
+        page_size = min(page_size, max_items)
+
+    async def fetch(page_request: _PageRequest) -> Tuple[Dict[str, Any], List[Any]]:
+        path, page_params = page_request
+        response = await platform_request.get(
+            base_url,
+            path,
+            user_identity=user_identity,
+            params=page_params,
+            **kwargs,
+        )
+        response.raise_for_status()
+        content = await response.json()
+        return content, content[data_key]
+
+    page_request: _PageRequest = (
+        api_path,
+        {**(params or {}), "limit": page_size, "offset": 0},
+    )
+    task: Optional[asyncio.Task] = asyncio.create_task(fetch(page_request))
+    consumed = 0
+
+    try:
+        while task is not None:
+            content, items = await task
+            task = None
+
+            next_request = _next_page(content, items, page_request, page_size)
+            if next_request is not None and (
+                max_items is None or consumed + len(items) < max_items
+            ):
+                page_request = next_request
+                task = asyncio.create_task(fetch(page_request))
+
+            for item in items:
+                yield item
+                consumed += 1
+                if max_items is not None and consumed >= max_items:
+                    return
+    finally:
+        if task is not None:
+            task.cancel()
+            # Prevents "exception was never retrieved" when the prefetch already failed
+            if task.done() and not task.cancelled():
+                task.exception()
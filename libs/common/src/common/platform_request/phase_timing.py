@@ -0,0 +1,83 @@
+import time
+from typing import Optional
+
+from aiohttp import TraceConfig
+
+
+class RequestPhases:
+    """
+    Durations (in seconds) of the phases of a single request, filled by the trace config from `make_phase_trace_config`.
+    Phases that did not happen (i.e. a dns cache hit or a reused connection) are left as `None`.
+
+    aiohttp does not report the TLS handshake on its own, for https upstreams it is part of `connect`.
+    """
+
+    __slots__ = (
+        "dns",
+        "connect",
+        "ttfb",
+        "_dns_start",
+        "_connect_start",
+        "_headers_sent",
+    )
+
+    def __init__(self):
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self._dns_start: Optional[float] = None
+        self._connect_start: Optional[float] = None
+        self._headers_sent: Optional[float] = None
+
+
+def _phases(trace_config_ctx) -> Optional[RequestPhases]:
+    phases = trace_config_ctx.trace_request_ctx
+    return phases if isinstance(phases, RequestPhases) else None
+
+
+async def _on_dns_resolvehost_start(session, trace_config_ctx, params):
+    if phases := _phases(trace_config_ctx):
+        phases._dns_start = time.monotonic()
+
+
+async def _on_dns_resolvehost_end(session, trace_config_ctx, params):
+    if (phases := _phases(trace_config_ctx)) and phases._dns_start is not None:
+        phases.dns = time.monotonic() - phases._dns_start
+
+
+async def _on_connection_create_start(session, trace_config_ctx, params):
+    if phases := _phases(trace_config_ctx):
+        phases._connect_start = time.monotonic()
+
+
+async def _on_connection_create_end(session, trace_config_ctx, params):
+    if (phases := _phases(trace_config_ctx)) and phases._connect_start is not None:
+        phases.connect = time.monotonic() - phases._connect_start
+        # Dns resolution happens while creating the connection
+        if phases.dns is not None:
+            phases.connect -= phases.dns
+
+
+async def _on_request_headers_sent(session, trace_config_ctx, params):
+    if phases := _phases(trace_config_ctx):
+        phases._headers_sent = time.monotonic()
+
+
+async def _on_request_end(session, trace_config_ctx, params):
+    if (phases := _phases(trace_config_ctx)) and phases._headers_sent is not None:
+        phases.ttfb = time.monotonic() - phases._headers_sent
+
+
+def make_phase_trace_config() -> TraceConfig:
+    """
+    Trace config that times dns, connect and time to first byte of requests sent with a `RequestPhases`
+    as `trace_request_ctx`. Requests without it are ignored.
+    """
+    trace_config = TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_request_headers_sent.append(_on_request_headers_sent)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from common.deadline import apply_deadline
 from common.platform_request.abstract_platform_request import AbstractPlatformRequest
 
 from aiohttp import ClientResponse, ClientSession
@@ -22,5 +23,5 @@ class PlatformRequest(AbstractPlatformRequest):
             headers["x-rh-identity"] = user_identity
 
         return await self.session.request(
-            method, f"{base_url}{api_path}", headers=headers, **kwargs
+            method, f"{base_url}{api_path}", headers=headers, **apply_deadline(kwargs)
         )
@@ -2,6 +2,7 @@ from typing import Optional
 
 from aiohttp import ClientResponse, ClientSession
 
+from common.deadline import apply_deadline
 from common.platform_request.abstract_platform_request import AbstractPlatformRequest
 
 
@@ -25,6 +26,7 @@ class ServiceAccountPlatformRequest(AbstractPlatformRequest):
                 "client_id": self._sa_id,
                 "client_secret": self._sa_secret,
             },
+            **apply_deadline({}),
         )
 
         response.raise_for_status()
@@ -48,5 +50,5 @@ class ServiceAccountPlatformRequest(AbstractPlatformRequest):
             headers["Authorization"] = "Bearer " + self._token
 
         return await self.session.request(
-            method, f"{base_url}{api_path}", headers=headers, **kwargs
+            method, f"{base_url}{api_path}", headers=headers, **apply_deadline(kwargs)
         )
@@ -1,14 +1,115 @@
+import functools
 import logging
+import re
 import time
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from common.metrics import get_or_create_metric
+from common.metrics import get_or_create_metric, LabelCardinalityGuard
 from common.platform_request import AbstractPlatformRequest
-from aioprometheus import Counter, Histogram, Registry
+from common.platform_request.phase_timing import RequestPhases
+from common.timing import get_phase_timer
+from common.tracing import inject_traceparent, span
+from aioprometheus import Counter, Gauge, Histogram, Registry
+from aioprometheus.histogram import Histogram as HistogramValue
 from aiohttp import ClientResponse
 
 _REQUEST_TOTAL_METRIC_NAME = "platform_requests_total"
 _REQUEST_DURATION_METRIC_NAME = "platform_request_duration_seconds"
+_REQUEST_PHASE_DURATION_METRIC_NAME = "platform_request_phase_duration_seconds"
+_RESPONSE_SIZE_METRIC_NAME = "platform_response_size_bytes"
+_REQUESTS_IN_FLIGHT_METRIC_NAME = "platform_requests_in_flight"
+
+_ID_PLACEHOLDER = "{id}"
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|(?=.*\d)[\w-]{16,})$"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def template_api_path(api_path: str) -> str:
+    """
+    Maps a raw api path to its route template, e.g. `/api/sources/v3.1/sources/123/pause?x=y`
+    to `/api/sources/v3.1/sources/{id}/pause`. Query strings are dropped and ids (numbers, uuids and long
+    tokens with digits) are replaced with `{id}`.
+    """
+    path = api_path.split("?", 1)[0]
+    return "/".join(
+        _ID_PLACEHOLDER if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+def _bind_histogram(histogram: Histogram, labels: Dict[str, str]) -> HistogramValue:
+    try:
+        return histogram.get_value(labels)
+    except KeyError:
+        value = HistogramValue(*histogram.upper_bounds)
+        histogram.set_value(labels, value)
+        return value
+
+
+class _BoundCounter:
+    """
+    Counter child for a fixed set of labels. Counters keep plain numbers, so it holds the encoded key of the value:
+    the labels are validated and encoded once instead of on every increment.
+    """
+
+    __slots__ = ("_values", "_key")
+
+    def __init__(self, counter: Counter, labels: Dict[str, str]):
+        counter.add(labels, 0)
+        self._values = counter.values
+        self._key = counter.values.__keytransform__(labels)
+
+    def inc(self):
+        self._values[self._key] += 1
+
+
+class _BoundRequestMetrics:
+    """Metrics bound to a fixed set of labels, built once per label combination."""
+
+    __slots__ = ("labels", "_request_total", "_request_duration")
+
+    def __init__(
+        self,
+        request_total: Counter,
+        request_duration: Histogram,
+        labels: Dict[str, str],
+    ):
+        self.labels = labels
+        self._request_total = _BoundCounter(request_total, labels)
+        self._request_duration = _bind_histogram(request_duration, labels)
+
+    def observe(self, duration: float):
+        self._request_total.inc()
+        self._request_duration.observe(duration)
+
+
+class _BoundUpstreamMetrics:
+    """Phase durations and response sizes bound to a single upstream."""
+
+    __slots__ = ("_phases", "_response_size")
+
+    def __init__(
+        self, request_phase_duration: Histogram, response_size: Histogram, service: str
+    ):
+        self._phases = {
+            phase: _bind_histogram(
+                request_phase_duration, {"service": service, "phase": phase}
+            )
+            for phase in ("dns", "connect", "ttfb", "body")
+        }
+        self._response_size = _bind_histogram(response_size, {"service": service})
+
+    def observe_phases(self, phases: RequestPhases):
+        for phase in ("dns", "connect", "ttfb"):
+            duration = getattr(phases, phase)
+            if duration is not None:
+                self._phases[phase].observe(duration)
+
+    def observe_body(self, duration: float, size: int):
+        self._phases["body"].observe(duration)
+        self._response_size.observe(size)
 
 
 class TrackedPlatformRequest(AbstractPlatformRequest):
@@ -17,6 +118,7 @@ class TrackedPlatformRequest(AbstractPlatformRequest):
         platform_request: AbstractPlatformRequest,
         registry: Registry,
         app_name: str,
+        max_paths: int = 100,
     ):
         self.request_total = get_or_create_metric(
             registry,
@@ -35,43 +137,157 @@ class TrackedPlatformRequest(AbstractPlatformRequest):
             buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
         )
 
+        self.request_phase_duration = get_or_create_metric(
+            registry,
+            _REQUEST_PHASE_DURATION_METRIC_NAME,
+            Histogram,
+            "Duration of the phases (dns, connect, ttfb and body) of Platform requests in seconds",
+            const_labels={"app": app_name},
+            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+        )
+
+        self.response_size = get_or_create_metric(
+            registry,
+            _RESPONSE_SIZE_METRIC_NAME,
+            Histogram,
+            "Size of the Platform responses in bytes",
+            const_labels={"app": app_name},
+            buckets=[1_000, 10_000, 100_000, 1_000_000, 5_000_000, 10_000_000],
+        )
+
+        self.requests_in_flight = get_or_create_metric(
+            registry,
+            _REQUESTS_IN_FLIGHT_METRIC_NAME,
+            Gauge,
+            "Platform requests waiting for a response, by upstream",
+            const_labels={"app": app_name},
+        )
+
         self.platform_request = platform_request
+        self._path_guard = LabelCardinalityGuard(max_paths)
+        self._bound_metrics: Dict[
+            Tuple[str, str, str, str, bool], _BoundRequestMetrics
+        ] = {}
+        self._bound_upstream_metrics: Dict[str, _BoundUpstreamMetrics] = {}
 
-    async def request(
+    def _get_bound_metrics(
         self,
-        method: str,
         base_url: str,
+        method: str,
         api_path: str,
-        user_identity: Optional[str] = None,
-        **kwargs,
-    ) -> ClientResponse:
-        start = time.monotonic()
-        status = "unknown"
-        try:
-            response = await self.platform_request.request(
-                method, base_url, api_path, user_identity, **kwargs
-            )
-            status = str(response.status)
-            return response
-        except Exception:
-            status = "exception"
-            raise
-        finally:
-            duration = time.monotonic() - start
+        status: str,
+        authenticated: bool,
+    ) -> _BoundRequestMetrics:
+        path = self._path_guard(template_api_path(api_path))
+        key = (base_url, method, path, status, authenticated)
+
+        bound_metrics = self._bound_metrics.get(key)
+        if bound_metrics is None:
             labels = {
                 "service": base_url,
                 "method": method,
-                "path": api_path,
+                "path": path,
                 "status": status,
             }
 
-            if user_identity is not None:
+            if authenticated:
                 labels["authenticated"] = "true"
 
+            bound_metrics = _BoundRequestMetrics(
+                self.request_total, self.request_duration, labels
+            )
+            self._bound_metrics[key] = bound_metrics
+
+        return bound_metrics
+
+    def _get_bound_upstream_metrics(self, base_url: str) -> _BoundUpstreamMetrics:
+        bound_metrics = self._bound_upstream_metrics.get(base_url)
+        if bound_metrics is None:
+            bound_metrics = _BoundUpstreamMetrics(
+                self.request_phase_duration, self.response_size, base_url
+            )
+            self._bound_upstream_metrics[base_url] = bound_metrics
+
+        return bound_metrics
+
+    def _observe_body(self, base_url: str, duration: float, size: int):
+        try:
+            self._get_bound_upstream_metrics(base_url).observe_body(duration, size)
+        except Exception as e:
+            logging.getLogger(__name__).error(
+                "Failed to send platform_request metrics", e
+            )
+
+    def _observe_body_on_eof(self, base_url: str, response: ClientResponse):
+        """
+        Reports the body phase and the size of the response once the whole body has been received, whether it is
+        read at once (`read`, `text` and `json`) or streamed from `content`.
+        """
+        start = time.monotonic()
+        content = response.content
+        content.on_eof(
+            lambda: self._observe_body(
+                base_url, time.monotonic() - start, content.total_bytes
+            )
+        )
+
+    def _update_in_flight(self, base_url: str, delta: int):
+        try:
+            self.requests_in_flight.add({"service": base_url}, delta)
+        except Exception as e:
+            logging.getLogger(__name__).error(
+                "Failed to send platform_request metrics", e
+            )
+
+    async def request(
+        self,
+        method: str,
+        base_url: str,
+        api_path: str,
+        user_identity: Optional[str] = None,
+        **kwargs,
+    ) -> ClientResponse:
+        phases = RequestPhases()
+        kwargs.setdefault("trace_request_ctx", phases)
+
+        with span(
+            "platform",
+            service=base_url,
+            method=method,
+            path=template_api_path(api_path),
+        ) as platform_span:
+            # Carries the span of the call when the request is sampled
+            kwargs["headers"] = inject_traceparent(dict(kwargs.get("headers") or {}))
+            self._update_in_flight(base_url, 1)
+            start = time.monotonic()
+            status = "unknown"
             try:
-                self.request_total.inc(labels)
-                self.request_duration.observe(labels, duration)
-            except Exception as e:
-                logging.getLogger(__name__).error(
-                    "Failed to send platform_request metrics", e
+                response = await self.platform_request.request(
+                    method, base_url, api_path, user_identity, **kwargs
                 )
+                status = str(response.status)
+                self._observe_body_on_eof(base_url, response)
+                return response
+            except Exception:
+                status = "exception"
+                raise
+            finally:
+                duration = time.monotonic() - start
+                self._update_in_flight(base_url, -1)
+                if platform_span is not None:
+                    platform_span.set_attribute("http.status_code", status)
+                timer = get_phase_timer()
+                if timer is not None:
+                    timer.add_call(
+                        base_url, method, template_api_path(api_path), status, duration
+                    )
+
+                try:
+                    self._get_bound_metrics(
+                        base_url, method, api_path, status, user_identity is not None
+                    ).observe(duration)
+                    self._get_bound_upstream_metrics(base_url).observe_phases(phases)
+                except Exception as e:
+                    logging.getLogger(__name__).error(
+                        "Failed to send platform_request metrics", e
+                    )
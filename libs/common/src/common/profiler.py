@@ -0,0 +1,210 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType, FrameType
+from typing import Dict, List, Literal, Optional
+
+import injector
+from pydantic import BaseModel
+from quart import Blueprint, Response, jsonify
+from quart_schema import hide, validate_querystring
+from werkzeug.exceptions import BadRequest, Conflict, NotFound
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+def _frame_name(code: CodeType) -> str:
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _thread_stack(frame: Optional[FrameType]) -> List[str]:
+    stack = []
+    while frame is not None:
+        stack.append(_frame_name(frame.f_code))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _task_stack(task: asyncio.Task) -> List[str]:
+    """Stack of the coroutines a suspended task is awaiting, outermost first."""
+    stack = []
+    awaitable = task.get_coro()
+    while awaitable is not None:
+        code = getattr(awaitable, "cr_code", None) or getattr(
+            awaitable, "gi_code", None
+        )
+        if code is None:
+            # A future or an object implementing __await__
+            stack.append(type(awaitable).__qualname__)
+            break
+        stack.append(_frame_name(code))
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(
+            awaitable, "gi_yieldfrom", None
+        )
+    return stack
+
+
+@dataclass
+class Profile:
+    duration: float
+    """Seconds"""
+    interval: float
+    """Seconds between samples"""
+    samples: Dict[str, int]
+    """Collapsed stacks (root first, separated by `;`) and the number of times they were seen"""
+
+    def collapsed(self) -> str:
+        """Format read by flamegraph.pl, speedscope and most flame graph tools"""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in sorted(self.samples.items())
+        )
+
+    def speedscope(self, name: str = "profile") -> dict:
+        """Sampled profile in the speedscope file format (https://www.speedscope.app)"""
+        frames: Dict[str, int] = {}
+        samples = []
+        weights = []
+        for stack, count in self.samples.items():
+            samples.append(
+                [frames.setdefault(frame, len(frames)) for frame in stack.split(";")]
+            )
+            weights.append(round(count * self.interval, 6))
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "common.profiler",
+            "shared": {"frames": [{"name": frame} for frame in frames]},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": round(sum(weights), 6),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+class SamplingProfiler:
+    """
+    Wall clock sampling profiler that can be run on a live instance. Every `interval` seconds a thread records the
+    stack of every other thread (`sys._current_frames`) and the event loop records where each of its suspended tasks
+    is waiting. Stacks are rooted at `thread:<name>` or `tasks`, so time spent running on the loop thread and
+    time spent awaiting upstreams can be told apart.
+
+    The sampling thread needs the GIL to look at the other threads: code on the event loop thread shows up when it
+    holds the loop for longer than the switch interval (5ms by default), short callbacks mostly show as the selector.
+    Nothing is sampled between profiles, only one profile runs at a time.
+    """
+
+    def __init__(
+        self, enabled: bool = True, interval: float = 0.01, max_duration: float = 60
+    ):
+        self.enabled = enabled
+        self.interval = interval
+        self.max_duration = max_duration
+        self._lock = asyncio.Lock()
+
+    async def profile(self, duration: float) -> Profile:
+        if self._lock.locked():
+            raise ProfilerBusy("A profile is already running")
+
+        async with self._lock:
+            # Each sampler fills its own counter, they are merged once done
+            thread_samples: Counter[str] = Counter()
+            task_samples: Counter[str] = Counter()
+            stop = threading.Event()
+            sampler = threading.Thread(
+                target=self._sample_threads,
+                args=(thread_samples, stop),
+                name="sampling-profiler",
+                daemon=True,
+            )
+
+            start = time.monotonic()
+            sampler.start()
+            try:
+                while time.monotonic() - start < duration:
+                    self._sample_tasks(task_samples)
+                    await asyncio.sleep(self.interval)
+            finally:
+                stop.set()
+                # Wakes up within an interval, not worth a thread of the (maybe saturated) default executor
+                sampler.join()
+
+            return Profile(
+                duration=round(time.monotonic() - start, 3),
+                interval=self.interval,
+                samples=dict(thread_samples + task_samples),
+            )
+
+    def _sample_threads(self, samples: Counter, stop: threading.Event):
+        own_ident = threading.get_ident()
+        while not stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                root = f"thread:{names.get(ident, ident)}"
+                samples[";".join([root, *_thread_stack(frame)])] += 1
+
+    @staticmethod
+    def _sample_tasks(samples: Counter):
+        current = asyncio.current_task()
+        for task in asyncio.all_tasks():
+            if task is current:
+                continue
+            # Not rooted at the task name, it is unique per task (Task-123) and would split every request
+            samples[";".join(["tasks", *_task_stack(task)])] += 1
+
+
+class ProfileRequestQuery(BaseModel):
+    seconds: float = 10
+    format: Literal["collapsed", "speedscope"] = "collapsed"
+
+
+def make_blueprint(app_name: str) -> Blueprint:
+    """Private `/profiler` routes, speedscope profiles are named after `app_name`."""
+    blueprint = Blueprint("profiler", __name__, url_prefix="/profiler")
+
+    @blueprint.get("/profile")
+    @hide  # Returns plain text or a speedscope file, not part of the API
+    @validate_querystring(ProfileRequestQuery)
+    async def profile(
+        query_args: ProfileRequestQuery,
+        profiler: injector.Inject[SamplingProfiler],
+    ) -> Response:
+        """
+        Samples the stacks of this instance for `seconds` and returns them as collapsed stacks (one `frame;frame count`
+        line per stack) or as a speedscope JSON file. Only available when `PROFILER_ENABLED` is set.
+        """
+        if not profiler.enabled:
+            raise NotFound()
+
+        if not 0 < query_args.seconds <= profiler.max_duration:
+            raise BadRequest(
+                f"seconds must be greater than 0 and at most {profiler.max_duration}"
+            )
+
+        try:
+            result = await profiler.profile(query_args.seconds)
+        except ProfilerBusy as e:
+            raise Conflict(str(e))
+
+        if query_args.format == "speedscope":
+            return jsonify(result.speedscope(name=app_name))
+
+        return Response(result.collapsed(), mimetype="text/plain")
+
+    return blueprint
@@ -12,9 +12,12 @@ from common.platform_request import (
     PlatformRequest,
     AbstractPlatformRequest,
 )
+from common.platform_request.phase_timing import make_phase_trace_config
 from common.platform_request.tracked_platform_request import TrackedPlatformRequest
+from common.session_storage import SessionStorage
 from common.session_storage.file import FileSessionStorage
 from common.session_storage.redis import RedisSessionStorage
+from common.session_storage.tracked import TrackedSessionStorage
 
 
 def make_dev_platform_request_provider(
@@ -78,27 +81,38 @@ def make_client_session_provider(proxy: Optional[str]) -> CallableT:
 
     @provider
     def client_session_provider() -> aiohttp.ClientSession:
-        return aiohttp.ClientSession(proxy=proxy)
+        return aiohttp.ClientSession(
+            proxy=proxy, trace_configs=[make_phase_trace_config()]
+        )
 
     return client_session_provider
 
 
-def make_redis_session_storage_provider(hostname: str, port: int) -> CallableT:
+def make_redis_session_storage_provider(
+    hostname: str, port: int, app_name: str
+) -> CallableT:
     @provider
-    def redis_session_storage_provider() -> RedisSessionStorage:
-        return RedisSessionStorage(
-            StrictRedis(
-                host=hostname,
-                port=port,
-            )
+    def redis_session_storage_provider(app: Inject[Quart]) -> SessionStorage:
+        return TrackedSessionStorage(
+            RedisSessionStorage(
+                StrictRedis(
+                    host=hostname,
+                    port=port,
+                )
+            ),
+            "redis",
+            get_registry(app),
+            app_name,
         )
 
     return redis_session_storage_provider
 
 
-def make_file_session_storage_provider(file: str) -> CallableT:
+def make_file_session_storage_provider(file: str, app_name: str) -> CallableT:
     @provider
-    def file_session_storage_provider() -> FileSessionStorage:
-        return FileSessionStorage(file)
+    def file_session_storage_provider(app: Inject[Quart]) -> SessionStorage:
+        return TrackedSessionStorage(
+            FileSessionStorage(file), "file", get_registry(app), app_name
+        )
 
     return file_session_storage_provider
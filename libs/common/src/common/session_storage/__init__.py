@@ -14,16 +14,29 @@ class SessionStorage(ABC):
     def __init__(self):
         pass
 
-    async def put(self, session: Session):
+    async def put(self, session: Session) -> Optional[int]:
+        """
+        Stores the session, returns its size in bytes as stored by the backend, `None` if unknown
+        """
         return await self.store(session)
 
-    async def get(self, session_key: str) -> Session:
-        return await self.retrieve(session_key)
+    async def get(
+        self, session_key: str, user_id: Optional[str] = None
+    ) -> Optional[Session]:
+        """
+        Retrieves the session, `None` if it does not exist (or expired) or, when `user_id` is given, if it belongs to
+        another user.
+        """
+        session = await self.retrieve(session_key)
+        if session is not None and user_id is not None and session.user_id != user_id:
+            return None
+        return session
 
     @abstractmethod
-    async def store(self, session: Session):
+    async def store(self, session: Session) -> Optional[int]:
         """
-        Stores a session into the storage, replacing if it exists
+        Stores a session into the storage, replacing if it exists. Backends that encode the session return the size of
+        the encoded session.
         """
 
     @abstractmethod
@@ -25,8 +25,8 @@ class RedisSessionStorage(SessionStorage):
         else:
             return None
 
-    async def store(self, session: Session):
+    async def store(self, session: Session) -> Optional[int]:
         """Write the session_id/identity header pair to Redis."""
-        await self.redis_client.set(
-            session.key, json.dumps(vars(session)), ex=SESSION_TTL_20_MINUTES
-        )
+        value = json.dumps(vars(session)).encode()
+        await self.redis_client.set(session.key, value, ex=SESSION_TTL_20_MINUTES)
+        return len(value)
@@ -0,0 +1,110 @@
+import logging
+import time
+from typing import Optional
+
+from aioprometheus import Counter, Histogram, Registry
+
+from common.metrics import get_or_create_metric
+from . import Session, SessionStorage
+
+_REQUEST_DURATION_METRIC_NAME = "session_storage_request_duration_seconds"
+_LOOKUPS_TOTAL_METRIC_NAME = "session_storage_lookups_total"
+_SESSION_SIZE_METRIC_NAME = "session_storage_session_size_bytes"
+
+logger = logging.getLogger(__name__)
+
+
+class TrackedSessionStorage(SessionStorage):
+    """
+    Measures the session storage: duration of `get` and `put`, whether the sessions looked up were found (`hit`),
+    missing or expired (`miss`) or belonged to another user (`mismatch`) and the size of the stored sessions.
+    """
+
+    def __init__(
+        self,
+        session_storage: SessionStorage,
+        backend: str,
+        registry: Registry,
+        app_name: str,
+    ):
+        super().__init__()
+        self.session_storage = session_storage
+        self.backend = backend
+
+        self.request_duration = get_or_create_metric(
+            registry,
+            _REQUEST_DURATION_METRIC_NAME,
+            Histogram,
+            "Duration of session storage requests in seconds",
+            const_labels={"app": app_name},
+            buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+        )
+
+        self.lookups_total = get_or_create_metric(
+            registry,
+            _LOOKUPS_TOTAL_METRIC_NAME,
+            Counter,
+            "Session lookups by result: hit, miss, mismatch or error",
+            const_labels={"app": app_name},
+        )
+
+        self.session_size = get_or_create_metric(
+            registry,
+            _SESSION_SIZE_METRIC_NAME,
+            Histogram,
+            "Size of the stored sessions in bytes",
+            const_labels={"app": app_name},
+            buckets=[256, 512, 1_024, 2_048, 4_096, 8_192, 16_384],
+        )
+
+    async def get(
+        self, session_key: str, user_id: Optional[str] = None
+    ) -> Optional[Session]:
+        start = time.monotonic()
+        result = "error"
+        try:
+            session = await self.session_storage.get(session_key)
+            if session is None:
+                result = "miss"
+            elif user_id is not None and session.user_id != user_id:
+                result = "mismatch"
+                session = None
+            else:
+                result = "hit"
+            return session
+        finally:
+            self._observe("get", time.monotonic() - start, result)
+
+    async def put(self, session: Session) -> Optional[int]:
+        start = time.monotonic()
+        try:
+            size = await self.session_storage.put(session)
+        finally:
+            self._observe("put", time.monotonic() - start)
+        self._observe_size(size)
+        return size
+
+    async def retrieve(self, session_key: str) -> Optional[Session]:
+        return await self.session_storage.retrieve(session_key)
+
+    async def store(self, session: Session) -> Optional[int]:
+        return await self.session_storage.store(session)
+
+    def _observe(self, operation: str, duration: float, result: Optional[str] = None):
+        try:
+            self.request_duration.observe(
+                {"backend": self.backend, "operation": operation}, duration
+            )
+            if result is not None:
+                self.lookups_total.inc({"backend": self.backend, "result": result})
+        except Exception as e:
+            logger.error("Failed to send session storage metrics", e)
+
+    def _observe_size(self, size: Optional[int]):
+        if size is None:
+            # The backend does not encode the session
+            return
+        try:
+            self.session_size.observe({"backend": self.backend}, size)
+        except Exception as e:
+            logger.error("Failed to send session storage metrics", e)
@@ -0,0 +1,150 @@
+import contextlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+from quart import Quart, Response
+from quart.signals import before_render_template, template_rendered
+
+from common.tracing import get_current_span, span
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+# Upstream calls kept per request, the following ones are only counted
+MAX_UPSTREAM_CALLS = 50
+
+_NO_PHASE = contextlib.nullcontext()
+
+
+@dataclass(frozen=True)
+class UpstreamCall:
+    service: str
+    method: str
+    path: str
+    """Route template of the call, without ids or query string"""
+    status: str
+    duration: float
+    """Milliseconds"""
+
+
+class PhaseTimer:
+    """
+    Adds up the time spent in each phase of a request (e.g. session lookup, assistant, template rendering). A phase
+    entered more than once (or concurrently) accumulates its durations.
+    """
+
+    def __init__(self):
+        self.start = time.monotonic()
+        self.phases: Dict[str, float] = {}
+        self.calls: List[UpstreamCall] = []
+        self.dropped_calls = 0
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, time.monotonic() - start)
+
+    def add(self, name: str, duration: float):
+        self.phases[name] = self.phases.get(name, 0.0) + duration
+
+    def add_call(
+        self, service: str, method: str, path: str, status: str, duration: float
+    ):
+        """Records a call to an upstream service, its duration is added to the `platform` phase."""
+        self.add("platform", duration)
+        if len(self.calls) < MAX_UPSTREAM_CALLS:
+            self.calls.append(
+                UpstreamCall(service, method, path, status, round(duration * 1000, 1))
+            )
+        else:
+            self.dropped_calls += 1
+
+    def breakdown(self) -> Dict[str, float]:
+        """Duration of each phase and the whole request so far, in milliseconds."""
+        durations = {name: duration * 1000 for name, duration in self.phases.items()}
+        durations["total"] = (time.monotonic() - self.start) * 1000
+        return {name: round(duration, 1) for name, duration in durations.items()}
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            f"{name};dur={duration}" for name, duration in self.breakdown().items()
+        )
+
+
+_current_timer: ContextVar[Optional[PhaseTimer]] = ContextVar(
+    "current_phase_timer", default=None
+)
+_render_start: ContextVar[Optional[float]] = ContextVar("render_start", default=None)
+
+
+def get_phase_timer() -> Optional[PhaseTimer]:
+    return _current_timer.get()
+
+
+def ensure_phase_timer() -> PhaseTimer:
+    """Returns the timer of the current request, starting one if timing is disabled (e.g. to debug a request)."""
+    timer = _current_timer.get()
+    if timer is None:
+        timer = PhaseTimer()
+        _current_timer.set(timer)
+    return timer
+
+
+@contextlib.contextmanager
+def _timed_span(timer: PhaseTimer, name: str) -> Iterator[None]:
+    with timer.phase(name), span(name):
+        yield
+
+
+def phase(name: str) -> ContextManager[None]:
+    """
+    Times the enclosed block as `name` in the timer of the current request, if any, and traces it as a span of the
+    request (see `common.tracing`).
+    """
+    timer = _current_timer.get()
+    current_span = get_current_span()
+    if current_span is None or not current_span.sampled:
+        return _NO_PHASE if timer is None else timer.phase(name)
+    if timer is None:
+        return span(name)
+    return _timed_span(timer, name)
+
+
+def register_server_timing(app: Quart, enabled: bool = True):
+    """
+    Times the phases of every request and reports them in the `Server-Timing` header of the response. Template
+    rendering is timed as `render`, other phases are added with `phase`.
+
+    When disabled, `phase` does nothing unless a handler starts a timer with `ensure_phase_timer`, and no header is
+    added.
+    """
+
+    @app.before_request
+    async def start_phase_timer():
+        if enabled:
+            _current_timer.set(PhaseTimer())
+
+    @app.after_request
+    async def add_server_timing(response: Response) -> Response:
+        timer = _current_timer.get()
+        if enabled and timer is not None:
+            response.headers[SERVER_TIMING_HEADER] = timer.server_timing()
+        return response
+
+    async def start_render(sender: Quart, **kwargs):
+        if _current_timer.get() is not None:
+            _render_start.set(time.monotonic())
+
+    async def end_render(sender: Quart, **kwargs):
+        timer = _current_timer.get()
+        start = _render_start.get()
+        if timer is not None and start is not None:
+            _render_start.set(None)
+            timer.add("render", time.monotonic() - start)
+
+    before_render_template.connect(start_render, app, weak=False)
+    template_rendered.connect(end_render, app, weak=False)
@@ -0,0 +1,345 @@
+import abc
+import contextlib
+import json
+import logging
+import random
+import re
+import secrets
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import injector
+import quart
+from pydantic import BaseModel
+from quart import Blueprint, Quart, Response, request
+from quart.signals import before_render_template, template_rendered
+from quart_schema import validate_querystring, validate_response
+from werkzeug.exceptions import NotFound
+
+TRACEPARENT_HEADER = "traceparent"
+QUART_EXTENSION_TRACER = "tracer"
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_NO_SPAN = contextlib.nullcontext(None)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    sampled: bool
+    start_time: float
+    """Unix time at which the span started"""
+    duration: Optional[float] = None
+    """Milliseconds, `None` until the span ends"""
+    error: bool = False
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    tracer: Optional["Tracer"] = field(default=None, repr=False, compare=False)
+    _start: float = field(default_factory=time.monotonic, repr=False, compare=False)
+
+    def set_attribute(self, name: str, value: Any):
+        self.attributes[name] = value
+
+    def traceparent(self) -> str:
+        """W3C trace context of the span, to be sent to the services it calls"""
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def child(self, name: str, **attributes) -> "Span":
+        return Span(
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=self.span_id,
+            name=name,
+            sampled=self.sampled,
+            start_time=time.time(),
+            attributes=attributes,
+            tracer=self.tracer,
+        )
+
+    def end(self):
+        self.duration = round((time.monotonic() - self._start) * 1000, 3)
+        if self.sampled and self.tracer is not None:
+            self.tracer.export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class SpanExporter(abc.ABC):
+    @abc.abstractmethod
+    def export(self, span: Span): ...
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the last `max_spans` ended spans, for tests and for looking at the traces of a local instance."""
+
+    def __init__(self, max_spans: int = 10_000):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span):
+        self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        return [
+            span
+            for span in self._spans
+            if trace_id is None or span.trace_id == trace_id
+        ]
+
+
+class FileSpanExporter(SpanExporter):
+    """
+    Appends the ended spans to `path`, one json object per line. Writes are done on the event loop, this is meant for
+    local analysis only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, span: Span):
+        with open(self.path, "a") as file:
+            file.write(json.dumps(span.to_dict(), default=str) + "\n")
+
+
+def make_span_exporter(exporter: str, file_path: str) -> Optional[SpanExporter]:
+    """Builds the exporter selected in the config: `none`, `memory` or `file`."""
+    if exporter == "none":
+        return None
+    if exporter == "memory":
+        return InMemorySpanExporter()
+    if exporter == "file":
+        return FileSpanExporter(file_path)
+    raise ValueError(f"Unknown span exporter '{exporter}'")
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """Trace id, parent span id and sampled flag of a `traceparent` header, `None` if missing or invalid."""
+    if value is None:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None:
+        return None
+    trace_id, parent_id, flags = match.groups()
+    if trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+class Tracer:
+    """
+    Starts the root span of the requests and sends the sampled spans to the `exporter`. Requests that come with a
+    `traceparent` continue the trace of the caller, following its sampling decision if the caller is trusted. The
+    others are sampled with `sample_ratio`. Spans of requests that are not sampled are not created, only the trace
+    context is passed on.
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter], sample_ratio: float = 1.0):
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_trace(
+        self,
+        name: str,
+        traceparent: Optional[str] = None,
+        trust_sampled: bool = True,
+    ) -> Span:
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id, sampled = secrets.token_hex(16), None, None
+
+        if sampled is None or not trust_sampled:
+            sampled = random.random() < self.sample_ratio
+
+        return Span(
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent_id,
+            name=name,
+            sampled=sampled and self.enabled,
+            start_time=time.time(),
+            tracer=self,
+        )
+
+    def export(self, span: Span):
+        try:
+            self.exporter.export(span)
+        except Exception as e:
+            logger.error("Failed to export span", e)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_request_span: ContextVar[Optional[Span]] = ContextVar("request_span", default=None)
+_render_span: ContextVar[Optional[Span]] = ContextVar("render_span", default=None)
+
+
+def get_current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextlib.contextmanager
+def _child_span(parent: Span, name: str, attributes: Dict[str, Any]) -> Iterator[Span]:
+    child = parent.child(name, **attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException:
+        child.error = True
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+def span(name: str, **attributes) -> ContextManager[Optional[Span]]:
+    """Traces the enclosed block as a child of the current span, if the request is sampled."""
+    parent = _current_span.get()
+    if parent is None or not parent.sampled:
+        return _NO_SPAN
+    return _child_span(parent, name, attributes)
+
+
+def inject_traceparent(headers: Dict[str, str]) -> Dict[str, str]:
+    """Adds the trace context of the current span to the headers of an outgoing request."""
+    current = _current_span.get()
+    if current is not None:
+        headers[TRACEPARENT_HEADER] = current.traceparent()
+    return headers
+
+
+def register_tracing(
+    app: Quart,
+    tracer: Tracer,
+    accept_paths: Optional[Callable[[quart.Request], bool]] = None,
+    attributes: Optional[Callable[[quart.Request], Dict[str, Any]]] = None,
+    trusted_callers: Optional[Callable[[quart.Request], bool]] = None,
+):
+    """
+    Starts a span for every request, continuing the trace of the caller when it sends a `traceparent` header, see
+    `get_tracer`. Template rendering is traced as `render`, other spans are added with `span` (or `common.timing.phase`).
+    `attributes` can add attributes of the request (e.g. its session id) to the root span.
+
+    Only the requests accepted by `trusted_callers` (e.g. calls between our own services) follow the sampling decision
+    of the caller. Anyone can send a `traceparent`, the sampling of other requests is decided with the `sample_ratio`
+    of the tracer.
+    """
+    if QUART_EXTENSION_TRACER in app.extensions:
+        raise ValueError(
+            "Tracer is already registered, only call 'register_tracing' once."
+        )
+    app.extensions[QUART_EXTENSION_TRACER] = tracer
+
+    if not tracer.enabled:
+        return
+
+    @app.before_request
+    async def start_span():
+        if accept_paths is not None and not accept_paths(request):
+            return
+
+        root = tracer.start_trace(
+            f"{request.method} {request.url_rule.rule if request.url_rule is not None else '<unknown>'}",
+            request.headers.get(TRACEPARENT_HEADER),
+            trust_sampled=trusted_callers is not None and trusted_callers(request),
+        )
+        if root.sampled and attributes is not None:
+            root.attributes.update(attributes(request))
+        _current_span.set(root)
+        _request_span.set(root)
+
+    @app.after_request
+    async def end_span(response: Response) -> Response:
+        root = _request_span.get()
+        if root is not None:
+            _request_span.set(None)
+            # Unhandled exceptions get here as a 500
+            root.set_attribute("http.status_code", response.status_code)
+            root.error = response.status_code >= 500
+            root.end()
+        return response
+
+    async def start_render(sender: Quart, template, **kwargs):
+        parent = _current_span.get()
+        if parent is not None and parent.sampled:
+            _render_span.set(parent.child("render", template=template.name))
+
+    async def end_render(sender: Quart, **kwargs):
+        render = _render_span.get()
+        if render is not None:
+            _render_span.set(None)
+            render.end()
+
+    before_render_template.connect(start_render, app, weak=False)
+    template_rendered.connect(end_render, app, weak=False)
+
+
+def get_tracer(app: Quart) -> Tracer:
+    if QUART_EXTENSION_TRACER not in app.extensions:
+        raise KeyError(
+            f"Tracer '{QUART_EXTENSION_TRACER}' is missing. Please ensure it is registered via 'register_tracing'."
+        )
+    return app.extensions[QUART_EXTENSION_TRACER]
+
+
+blueprint = Blueprint("tracing", __name__, url_prefix="/tracing")
+
+
+class SpansRequestQuery(BaseModel):
+    trace_id: Optional[str] = None
+
+
+@dataclass
+class SpansResponse:
+    spans: List[Dict[str, Any]]
+    """Ended spans, oldest first"""
+
+
+@blueprint.get("/spans")
+@validate_querystring(SpansRequestQuery)
+@validate_response(SpansResponse)
+async def spans(
+    query_args: SpansRequestQuery,
+    tracer: injector.Inject[Tracer],
+) -> SpansResponse:
+    """
+    Returns the spans kept by this instance, optionally only those of a trace. Only available with
+    `TRACING_EXPORTER=memory`.
+    """
+    if not isinstance(tracer.exporter, InMemorySpanExporter):
+        raise NotFound()
+
+    return SpansResponse(
+        spans=[span.to_dict() for span in tracer.exporter.spans(query_args.trace_id)]
+    )
@@ -1,4 +1,10 @@
 import pathlib
+from typing import Callable, Optional
+
+import injector
+import quart_injector
+from quart import Blueprint, Quart
+from quart_schema import QuartSchema
 
 _base = pathlib.Path(__file__).parent.resolve().joinpath("resources")
 
@@ -15,3 +21,16 @@ def get_resource_contents(resource):
             buff.append(line)
 
     return "".join(buff)
+
+
+def app_with_blueprint(
+    blueprint: Blueprint,
+    injector_module: Optional[Callable[[injector.Binder], None]] = None,
+) -> Quart:
+    app = Quart(__name__)
+    app.register_blueprint(blueprint)
+
+    quart_injector.wire(app, [injector_module] if injector_module is not None else [])
+
+    QuartSchema(app)  # Ensures we can return objects from the endpoints
+    return app
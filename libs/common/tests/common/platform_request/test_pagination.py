@@ -0,0 +1,130 @@
+import contextlib
+import json
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from common.platform_request import PlatformRequest
+
+
+@pytest.fixture
+async def aiohttp_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+def page(data, **kwargs) -> str:
+    return json.dumps({"data": data, **kwargs})
+
+
+async def test_paginate_links_next(session, aiohttp_mock):
+    aiohttp_mock.get(
+        "http://service/api/items?limit=2&offset=0",
+        body=page([1, 2], links={"next": "/api/items?limit=2&offset=2"}),
+    )
+    aiohttp_mock.get(
+        "http://service/api/items?limit=2&offset=2",
+        body=page([3], links={"next": None}),
+    )
+
+    testee = PlatformRequest(session)
+    items = [
+        item
+        async for item in testee.paginate("http://service", "/api/items", page_size=2)
+    ]
+    assert items == [1, 2, 3]
+
+
+async def test_paginate_limit_offset(session, aiohttp_mock):
+    aiohttp_mock.get(
+        "http://service/api/items?foo=bar&limit=2&offset=0",
+        body=page([1, 2], meta={"count": 4}),
+    )
+    aiohttp_mock.get(
+        "http://service/api/items?foo=bar&limit=2&offset=2",
+        body=page([3, 4], meta={"count": 4}),
+    )
+
+    testee = PlatformRequest(session)
+    items = [
+        item
+        async for item in testee.paginate(
+            "http://service", "/api/items", page_size=2, params={"foo": "bar"}
+        )
+    ]
+    assert items == [1, 2, 3, 4]
+    assert len(aiohttp_mock.requests) == 2
+
+
+async def test_paginate_stops_on_short_page(session, aiohttp_mock):
+    aiohttp_mock.get(
+        "http://service/api/items?limit=2&offset=0",
+        body=page([1]),
+    )
+
+    testee = PlatformRequest(session)
+    items = [
+        item
+        async for item in testee.paginate("http://service", "/api/items", page_size=2)
+    ]
+    assert items == [1]
+
+
+async def test_paginate_max_items(session, aiohttp_mock):
+    aiohttp_mock.get(
+        "http://service/api/items?limit=2&offset=0",
+        body=page([1, 2], links={"next": "/api/items?limit=2&offset=2"}),
+    )
+    aiohttp_mock.get(
+        "http://service/api/items?limit=2&offset=2",
+        body=page([3, 4], links={"next": "/api/items?limit=2&offset=4"}),
+    )
+
+    testee = PlatformRequest(session)
+    items = [
+        item
+        async for item in testee.paginate(
+            "http://service", "/api/items", page_size=2, max_items=3
+        )
+    ]
+    assert items == [1, 2, 3]
+    # Does not fetch a page that will not be used
+    assert len(aiohttp_mock.requests) == 2
+
+
+async def test_paginate_break_early(session, aiohttp_mock):
+    aiohttp_mock.get(
+        "http://service/api/items?limit=2&offset=0",
+        body=page([1, 2], links={"next": "/api/items?limit=2&offset=2"}),
+    )
+    aiohttp_mock.get(
+        "http://service/api/items?limit=2&offset=2",
+        body=page([3, 4], links={"next": "/api/items?limit=2&offset=4"}),
+    )
+
+    testee = PlatformRequest(session)
+    async with contextlib.aclosing(
+        testee.paginate("http://service", "/api/items", page_size=2)
+    ) as pages:
+        async for item in pages:
+            if item == 1:
+                break
+
+    assert len(aiohttp_mock.requests) <= 2
+
+
+async def test_paginate_error(session, aiohttp_mock):
+    aiohttp_mock.get("http://service/api/items?limit=2&offset=0", status=500)
+
+    testee = PlatformRequest(session)
+    with pytest.raises(aiohttp.ClientResponseError):
+        async for _ in testee.paginate("http://service", "/api/items", page_size=2):
+            pass
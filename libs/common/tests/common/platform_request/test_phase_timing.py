@@ -0,0 +1,76 @@
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioprometheus import Registry
+
+from common.platform_request import PlatformRequest
+from common.platform_request.phase_timing import make_phase_trace_config
+from common.platform_request.tracked_platform_request import TrackedPlatformRequest
+
+BODY = {"data": ["x" * 100] * 100}
+
+
+@pytest.fixture
+async def server():
+    async def handler(request):
+        return web.json_response(BODY)
+
+    app = web.Application()
+    app.router.add_get("/api/data", handler)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession(trace_configs=[make_phase_trace_config()])
+    yield session
+    await session.close()
+
+
+async def test_phase_timing(server, session):
+    registry = Registry()
+    testee = TrackedPlatformRequest(PlatformRequest(session), registry, "test-app")
+    base_url = str(server.make_url("")).rstrip("/")
+
+    response = await testee.get(base_url, "/api/data")
+    assert isinstance(response, aiohttp.ClientResponse)
+    assert response.status == 200
+    assert await response.json() == BODY
+    # Reading again does not count twice
+    assert await response.json() == BODY
+
+    response = await testee.get(base_url, "/api/data")
+    await response.text()
+
+    phase_duration = registry.get("platform_request_phase_duration_seconds")
+    # Connection is reused in the second call
+    assert phase_duration.get({"service": base_url, "phase": "connect"})["count"] == 1
+    assert phase_duration.get({"service": base_url, "phase": "ttfb"})["count"] == 2
+    assert phase_duration.get({"service": base_url, "phase": "body"})["count"] == 2
+
+    response_size = registry.get("platform_response_size_bytes").get(
+        {"service": base_url}
+    )
+    assert response_size["count"] == 2
+    assert response_size["sum"] > 2 * 100 * 100
+
+
+async def test_phase_timing_streamed_body(server, session):
+    registry = Registry()
+    testee = TrackedPlatformRequest(PlatformRequest(session), registry, "test-app")
+    base_url = str(server.make_url("")).rstrip("/")
+
+    response = await testee.get(base_url, "/api/data")
+    size = 0
+    while chunk := await response.content.read(1024):
+        size += len(chunk)
+
+    response_size = registry.get("platform_response_size_bytes").get(
+        {"service": base_url}
+    )
+    assert response_size["count"] == 1
+    assert response_size["sum"] == size
@@ -0,0 +1,141 @@
+import asyncio
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+from aioprometheus import Registry
+
+from common.metrics import LabelCardinalityGuard
+from common.platform_request import AbstractPlatformRequest
+from common.platform_request.tracked_platform_request import (
+    TrackedPlatformRequest,
+    template_api_path,
+)
+from common.timing import ensure_phase_timer
+
+
+class StatusPlatformRequest(AbstractPlatformRequest):
+    def __init__(self, status: int = 200):
+        self.status = status
+
+    async def request(
+        self,
+        method: str,
+        base_url: str,
+        api_path: str,
+        user_identity: Optional[str] = None,
+        **kwargs,
+    ):
+        response = MagicMock()
+        response.status = self.status
+        return response
+
+
+@pytest.mark.parametrize(
+    "api_path,expected",
+    [
+        ("/api/insights/v1/rule/", "/api/insights/v1/rule/"),
+        (
+            "/api/rbac/v1/roles/?system=true&limit=9999",
+            "/api/rbac/v1/roles/",
+        ),
+        (
+            "/api/sources/v3.1/sources/1234/pause",
+            "/api/sources/v3.1/sources/{id}/pause",
+        ),
+        (
+            "/api/integrations/v1.0/endpoints/3fa85f64-5717-4562-b3fc-2c963f66afa6/enable",
+            "/api/integrations/v1.0/endpoints/{id}/enable",
+        ),
+        (
+            "/api/chrome-service/v1/static/stable/prod/services/services-generated.json",
+            "/api/chrome-service/v1/static/stable/prod/services/services-generated.json",
+        ),
+        (
+            "/api/insights/v1/rule/some_rule_name|ERROR_KEY_1/",
+            "/api/insights/v1/rule/some_rule_name|ERROR_KEY_1/",
+        ),
+    ],
+)
+def test_template_api_path(api_path, expected):
+    assert template_api_path(api_path) == expected
+
+
+def test_label_cardinality_guard():
+    guard = LabelCardinalityGuard(2)
+    assert guard("a") == "a"
+    assert guard("b") == "b"
+    assert guard("c") == "other"
+    assert guard("a") == "a"
+
+
+async def test_tracked_platform_request_uses_templates():
+    registry = Registry()
+    testee = TrackedPlatformRequest(StatusPlatformRequest(), registry, "test-app")
+
+    await testee.post("http://sources", "/api/sources/v3.1/sources/1/pause")
+    await testee.post("http://sources", "/api/sources/v3.1/sources/2/pause", "id")
+    await testee.post("http://sources", "/api/sources/v3.1/sources/2/pause", "id")
+
+    labels = {
+        "service": "http://sources",
+        "method": "POST",
+        "path": "/api/sources/v3.1/sources/{id}/pause",
+        "status": "200",
+    }
+    request_total = registry.get("platform_requests_total")
+    request_duration = registry.get("platform_request_duration_seconds")
+
+    assert request_total.get(labels) == 1
+    assert request_total.get({**labels, "authenticated": "true"}) == 2
+    assert request_duration.get({**labels, "authenticated": "true"})["count"] == 2
+    assert len(request_total.values) == 2
+
+
+async def test_tracked_platform_request_folds_overflow_paths():
+    registry = Registry()
+    testee = TrackedPlatformRequest(
+        StatusPlatformRequest(404), registry, "test-app", max_paths=1
+    )
+
+    await testee.get("http://service", "/api/first")
+    await testee.get("http://service", "/api/second")
+    await testee.get("http://service", "/api/third")
+
+    request_total = registry.get("platform_requests_total")
+    labels = {"service": "http://service", "method": "GET", "status": "404"}
+    assert request_total.get({**labels, "path": "/api/first"}) == 1
+    assert request_total.get({**labels, "path": "other"}) == 2
+
+
+async def test_tracked_platform_request_adds_platform_phase():
+    testee = TrackedPlatformRequest(StatusPlatformRequest(), Registry(), "test-app")
+
+    timer = ensure_phase_timer()
+    await testee.get("http://service", "/api/first")
+    await testee.get("http://service", "/api/second")
+
+    assert set(timer.phases) == {"platform"}
+
+
+async def test_tracked_platform_request_tracks_requests_in_flight():
+    registry = Registry()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    class BlockingPlatformRequest(StatusPlatformRequest):
+        async def request(self, *args, **kwargs):
+            started.set()
+            await release.wait()
+            return await super().request(*args, **kwargs)
+
+    testee = TrackedPlatformRequest(BlockingPlatformRequest(), registry, "test-app")
+
+    task = asyncio.create_task(testee.get("http://service", "/api/first"))
+    await started.wait()
+    in_flight = registry.get("platform_requests_in_flight")
+    assert in_flight.get({"service": "http://service"}) == 1
+
+    release.set()
+    await task
+    assert in_flight.get({"service": "http://service"}) == 0
@@ -0,0 +1,86 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+from aioprometheus import Registry
+
+from common.session_storage import Session, SessionStorage
+from common.session_storage.memory import MemorySessionStorage
+from common.session_storage.redis import RedisSessionStorage
+from common.session_storage.tracked import TrackedSessionStorage
+
+SESSION = Session(key="my-key", user_identity="my.identity", user_id="1234")
+
+
+@pytest.fixture
+def registry() -> Registry:
+    return Registry()
+
+
+@pytest.fixture
+def testee(registry) -> TrackedSessionStorage:
+    return TrackedSessionStorage(MemorySessionStorage(), "memory", registry, "test-app")
+
+
+def lookups(registry: Registry, result: str) -> int:
+    return registry.get("session_storage_lookups_total").get(
+        {"backend": "memory", "result": result}
+    )
+
+
+def durations(registry: Registry, operation: str) -> int:
+    return registry.get("session_storage_request_duration_seconds").get(
+        {"backend": "memory", "operation": operation}
+    )["count"]
+
+
+async def test_get_and_put(testee, registry):
+    assert await testee.get("my-key") is None
+    await testee.put(SESSION)
+    assert await testee.get("my-key") == SESSION
+    assert await testee.get("my-key", "1234") == SESSION
+
+    assert lookups(registry, "miss") == 1
+    assert lookups(registry, "hit") == 2
+    assert durations(registry, "get") == 3
+    assert durations(registry, "put") == 1
+
+
+async def test_get_other_user(testee, registry):
+    await testee.put(SESSION)
+
+    assert await testee.get("my-key", "4321") is None
+    assert lookups(registry, "mismatch") == 1
+
+
+async def test_get_error(registry):
+    session_storage = AsyncMock(SessionStorage)
+    session_storage.get.side_effect = ConnectionError("redis is down")
+    testee = TrackedSessionStorage(session_storage, "memory", registry, "test-app")
+
+    with pytest.raises(ConnectionError):
+        await testee.get("my-key")
+
+    assert lookups(registry, "error") == 1
+    assert durations(registry, "get") == 1
+
+
+async def test_session_size(registry):
+    redis = AsyncMock()
+    testee = TrackedSessionStorage(
+        RedisSessionStorage(redis), "redis", registry, "test-app"
+    )
+
+    await testee.put(SESSION)
+
+    stored = redis.set.call_args.args[1]
+    assert json.loads(stored)["user_id"] == "1234"
+    size = registry.get("session_storage_session_size_bytes").get({"backend": "redis"})
+    assert size["count"] == 1
+    assert size["sum"] == len(stored)
+
+
+async def test_memory_session_size_is_not_tracked(testee, registry):
+    await testee.put(SESSION)
+
+    assert not registry.get("session_storage_session_size_bytes").values
@@ -0,0 +1,140 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import ClientTimeout
+from aioresponses import aioresponses
+from quart import Quart
+
+from common.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    apply_deadline,
+    deadline_scope,
+    get_deadline,
+    register_deadline,
+    set_deadline,
+)
+from common.metrics.quart import register_app, get_registry
+from common.platform_request import PlatformRequest
+
+
+@pytest.fixture
+async def aiohttp_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+def test_apply_deadline_without_deadline():
+    set_deadline(None)
+    assert apply_deadline({"params": {}}) == {"params": {}}
+
+
+def test_apply_deadline_caps_timeout():
+    with deadline_scope(5):
+        kwargs = apply_deadline({})
+        assert 4 < kwargs["timeout"].total <= 5
+
+        # A shorter timeout is kept
+        kwargs = apply_deadline({"timeout": ClientTimeout(total=1)})
+        assert kwargs["timeout"].total == 1
+
+        kwargs = apply_deadline({"timeout": ClientTimeout(total=10)})
+        assert kwargs["timeout"].total <= 5
+
+
+def test_apply_deadline_expired():
+    set_deadline(Deadline.after(-1))
+    with pytest.raises(DeadlineExceeded):
+        apply_deadline({})
+    set_deadline(None)
+
+
+def test_deadline_scope_keeps_shorter_deadline():
+    with deadline_scope(1) as outer:
+        with deadline_scope(10) as inner:
+            assert inner is outer
+        with deadline_scope(0.5) as inner:
+            assert inner is not outer
+            assert get_deadline() is inner
+        assert get_deadline() is outer
+    assert get_deadline() is None
+
+
+async def test_platform_request_does_not_call_after_deadline(session, aiohttp_mock):
+    testee = PlatformRequest(session)
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceeded):
+            await testee.get("target-url", "/path")
+
+    assert len(aiohttp_mock.requests) == 0
+
+
+def _app(**kwargs) -> Quart:
+    app = Quart(__name__)
+    register_app(app, 0)
+    register_deadline(app, "test-app", **kwargs)
+
+    @app.get("/remaining")
+    async def remaining():
+        deadline = get_deadline()
+        return {"remaining": deadline.remaining() if deadline else None}
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.02)
+        apply_deadline({})
+        return "done"
+
+    @app.get("/timeout")
+    async def timeout():
+        raise TimeoutError()
+
+    return app
+
+
+async def test_register_deadline_from_header_and_defaults():
+    app = _app(default_timeout=10, route_timeouts={"slow": 2})
+    client = app.test_client()
+
+    response = await client.get("/remaining")
+    assert 9 < (await response.get_json())["remaining"] <= 10
+
+    response = await client.get("/remaining", headers={"x-rh-timeout-ms": "500"})
+    assert (await response.get_json())["remaining"] <= 0.5
+
+    # Invalid header is ignored
+    response = await client.get("/remaining", headers={"x-rh-timeout-ms": "foo"})
+    assert 9 < (await response.get_json())["remaining"] <= 10
+
+    app = _app()
+    client = app.test_client()
+    response = await client.get("/remaining")
+    assert (await response.get_json())["remaining"] is None
+
+
+async def test_register_deadline_exceeded():
+    async def fallback():
+        return {"response": "fallback"}, 504
+
+    app = _app(route_timeouts={"slow": 0.01}, on_deadline_exceeded=fallback)
+    client = app.test_client()
+
+    response = await client.get("/slow")
+    assert response.status_code == 504
+    assert await response.get_json() == {"response": "fallback"}
+
+    registry = get_registry(app)
+    assert registry.get("deadline_exceeded_total").get({"path": "/slow"}) == 1
+    assert registry.get("deadline_wasted_seconds").get({"path": "/slow"})["count"] == 1
+
+    # Timeouts not caused by the deadline are not handled
+    response = await client.get("/timeout")
+    assert response.status_code == 500
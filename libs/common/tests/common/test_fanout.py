@@ -0,0 +1,91 @@
+import asyncio
+
+from aioprometheus import Registry
+
+from common.deadline import deadline_scope, get_deadline
+from common.fanout import FanOut
+
+
+async def value_after(value, seconds: float = 0):
+    await asyncio.sleep(seconds)
+    return value
+
+
+async def fail():
+    raise ValueError("boom")
+
+
+async def test_run_branches_concurrently():
+    fan_out = FanOut()
+
+    start = asyncio.get_running_loop().time()
+    results = await fan_out.run(
+        "test",
+        {
+            "first": lambda: value_after(1, 0.2),
+            "second": lambda: value_after(2, 0.2),
+        },
+    )
+
+    assert asyncio.get_running_loop().time() - start < 0.35
+    assert list(results) == ["first", "second"]
+    assert results["first"].ok and results["first"].value == 1
+    assert results["second"].ok and results["second"].value == 2
+
+
+async def test_run_keeps_results_of_other_branches():
+    fan_out = FanOut(timeouts={"test.slow": 0.05})
+
+    results = await fan_out.run(
+        "test",
+        {
+            "ok": lambda: value_after("value"),
+            "failed": fail,
+            "slow": lambda: value_after("late", 10),
+        },
+    )
+
+    assert results["ok"].value == "value"
+    assert not results["failed"].ok
+    assert isinstance(results["failed"].error, ValueError)
+    assert not results["slow"].ok
+    assert results["slow"].timed_out
+    assert results["slow"].duration < 1
+
+
+async def test_timeout_narrows_the_deadline():
+    fan_out = FanOut(default_timeout=5)
+
+    async def remaining():
+        return get_deadline().remaining()
+
+    results = await fan_out.run("test", {"branch": remaining})
+    assert 4 < results["branch"].value <= 5
+
+    # A shorter deadline of the request is kept
+    with deadline_scope(1):
+        results = await fan_out.run("test", {"branch": remaining})
+    assert results["branch"].value <= 1
+
+
+async def test_metrics():
+    metrics = Registry()
+    fan_out = FanOut(metrics, "test-app", timeouts={"test.slow": 0.01})
+
+    await fan_out.run(
+        "test",
+        {
+            "ok": lambda: value_after(1),
+            "failed": fail,
+            "slow": lambda: value_after(1, 10),
+        },
+    )
+
+    duration = metrics.get("fanout_branch_duration_seconds")
+    for branch, result in (("ok", "ok"), ("failed", "error"), ("slow", "timeout")):
+        assert (
+            duration.get({"fanout": "test", "branch": branch, "result": result})[
+                "count"
+            ]
+            == 1
+        )
@@ -0,0 +1,144 @@
+import asyncio
+
+import injector
+import pytest
+from quart import Quart
+
+from .. import app_with_blueprint
+from common.flight_recorder import (
+    blueprint,
+    FlightRecorder,
+    RequestRecord,
+    get_flight_recorder,
+    register_flight_recorder,
+)
+from common.timing import get_phase_timer, phase
+
+
+def make_record(duration: float, path: str = "/api/slow") -> RequestRecord:
+    return RequestRecord(
+        method="GET",
+        path=path,
+        status="200",
+        duration=duration,
+        timestamp=0,
+        phases={},
+        calls=[],
+        dropped_calls=0,
+    )
+
+
+def make_app(recorder: FlightRecorder) -> Quart:
+    app = Quart(__name__)
+    register_flight_recorder(app, recorder, lambda r: r.path.startswith("/api"))
+
+    @app.get("/api/items/<item_id>")
+    async def item(item_id: str):
+        with phase("work"):
+            await asyncio.sleep(0.01)
+        get_phase_timer().add_call(
+            "http://advisor", "GET", "/api/insights/v1/rule/{id}", "200", 0.005
+        )
+        return item_id
+
+    @app.get("/api/error")
+    async def error():
+        return "error", 503
+
+    @app.get("/api/exception")
+    async def exception():
+        raise ValueError("boom")
+
+    @app.get("/health")
+    async def health():
+        return "ok"
+
+    return app
+
+
+def test_keeps_the_slowest_requests():
+    recorder = FlightRecorder(slowest=2, errors=0)
+    for duration in (5, 1, 9, 3, 7):
+        recorder.record(make_record(duration))
+
+    assert [record.duration for record in recorder.slowest()] == [9, 7]
+    assert recorder.errors() == []
+    assert recorder.is_slow(8)
+    assert not recorder.is_slow(7)
+
+
+def test_keeps_the_last_errors():
+    recorder = FlightRecorder(slowest=0, errors=2)
+    for path in ("/api/a", "/api/b", "/api/c"):
+        recorder.record(make_record(1, path), error=True)
+
+    assert [record.path for record in recorder.errors()] == ["/api/c", "/api/b"]
+    assert recorder.slowest() == []
+
+
+async def test_records_requests():
+    recorder = FlightRecorder(slowest=5, errors=5)
+    test_client = make_app(recorder).test_client()
+
+    await test_client.get("/api/items/1234")
+    await test_client.get("/api/error")
+    await test_client.get("/health")
+
+    slowest = recorder.slowest()
+    assert [record.path for record in slowest] == [
+        "/api/items/<item_id>",
+        "/api/error",
+    ]
+    assert slowest[0].status == "200"
+    assert slowest[0].duration >= 10
+    assert set(slowest[0].phases) == {"work", "platform", "total"}
+    assert slowest[0].calls[0].path == "/api/insights/v1/rule/{id}"
+    assert slowest[0].calls[0].duration == 5.0
+
+    errors = recorder.errors()
+    assert [(record.path, record.status) for record in errors] == [
+        ("/api/error", "503")
+    ]
+
+
+async def test_records_unhandled_exceptions():
+    recorder = FlightRecorder(slowest=0, errors=5)
+    app = make_app(recorder)
+
+    response = await app.test_client().get("/api/exception")
+
+    assert response.status_code == 500
+    assert [(record.path, record.status) for record in recorder.errors()] == [
+        ("/api/exception", "500")
+    ]
+
+
+def test_get_flight_recorder():
+    recorder = FlightRecorder()
+    app = make_app(recorder)
+
+    assert get_flight_recorder(app) is recorder
+    with pytest.raises(ValueError):
+        register_flight_recorder(app, recorder)
+    with pytest.raises(KeyError):
+        get_flight_recorder(Quart(__name__))
+
+
+async def test_requests_route():
+    recorder = FlightRecorder(slowest=2, errors=2)
+    recorder.record(make_record(1234.5, path="/api/slow"), error=True)
+
+    def injector_binder(binder: injector.Binder):
+        binder.bind(FlightRecorder, recorder)
+
+    response = (
+        await app_with_blueprint(blueprint, injector_binder)
+        .test_client()
+        .get("/flight_recorder/requests")
+    )
+
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert data["slowest"] == data["errors"]
+    assert data["errors"][0]["path"] == "/api/slow"
+    assert data["errors"][0]["duration"] == 1234.5
@@ -0,0 +1,117 @@
+import injector
+from aioprometheus import Registry
+from quart import Quart
+
+from .. import app_with_blueprint
+from common.heavy_hitters import (
+    blueprint,
+    CountMinSketch,
+    HeavyHitter,
+    HeavyHitters,
+    HeavyHitterTracker,
+    get_heavy_hitters,
+    record_request_key,
+    register_heavy_hitters,
+)
+
+
+def test_sketch_never_undercounts():
+    sketch = CountMinSketch(width=64, depth=4)
+    counts = {f"org-{i}": i for i in range(200)}
+    for key, count in counts.items():
+        sketch.add(key, count)
+
+    total = sum(counts.values())
+    for key, count in counts.items():
+        assert count <= sketch.estimate(key) <= count + total
+    assert sketch.estimate("org-199") >= 199
+
+
+def test_heavy_hitters_keeps_the_most_frequent_keys():
+    heavy_hitters = HeavyHitters(k=2)
+    for key in ["a"] * 5 + ["b"] * 3 + ["c"]:
+        heavy_hitters.add(key)
+
+    assert heavy_hitters.top() == [("a", 5), ("b", 3)]
+    assert heavy_hitters.total == 9
+
+    # "c" overtakes "b"
+    for _ in range(3):
+        estimate, evicted = heavy_hitters.add("c")
+    assert (estimate, evicted) == (4, "b")
+    assert heavy_hitters.top() == [("a", 5), ("c", 4)]
+
+
+def test_tracker_exports_only_the_top_k():
+    registry = Registry()
+    tracker = HeavyHitterTracker(registry, "test-app", k=2)
+    for key in ["org-a"] * 3 + ["org-b"] * 2 + ["org-c"] * 3:
+        tracker.add("org", key)
+
+    gauge = registry.get("heavy_hitter_requests")
+    assert sorted((labels["key"], value) for labels, value in gauge.get_all()) == [
+        ("org-a", 3),
+        ("org-c", 3),
+    ]
+    assert tracker.top()["org"].total == 8
+    assert tracker.top()["org"].top[0] == HeavyHitter("org-a", 3)
+
+
+def make_app(tracker: HeavyHitterTracker) -> Quart:
+    app = Quart(__name__)
+    register_heavy_hitters(app, tracker, lambda r: r.path.startswith("/api"))
+
+    @app.get("/api/orgs/<org_id>")
+    async def org(org_id: str):
+        record_request_key("org", org_id)
+        record_request_key("intent", None)
+        return org_id
+
+    @app.get("/health")
+    async def health():
+        return "ok"
+
+    return app
+
+
+async def test_register_records_routes_and_keys():
+    tracker = HeavyHitterTracker(Registry(), "test-app")
+    client = make_app(tracker).test_client()
+
+    for org_id in ("123", "123", "456"):
+        await client.get(f"/api/orgs/{org_id}")
+    await client.get("/health")
+
+    top = tracker.top()
+    assert list(top) == ["org", "route"]
+    assert top["route"].top == [HeavyHitter("/api/orgs/<org_id>", 3)]
+    assert top["org"].top == [HeavyHitter("123", 2), HeavyHitter("456", 1)]
+
+
+def test_record_outside_of_a_request_is_ignored():
+    record_request_key("org", "123")
+
+
+def test_get_heavy_hitters():
+    tracker = HeavyHitterTracker(Registry(), "test-app")
+    assert get_heavy_hitters(make_app(tracker)) is tracker
+
+
+async def test_heavy_hitters_route():
+    tracker = HeavyHitterTracker(Registry(), "test-app", k=1)
+    for org_id in ("123", "456", "456"):
+        tracker.add("org", org_id)
+
+    def injector_binder(binder: injector.Binder):
+        binder.bind(HeavyHitterTracker, tracker)
+
+    response = (
+        await app_with_blueprint(blueprint, injector_binder)
+        .test_client()
+        .get("/heavy_hitters")
+    )
+
+    assert response.status == "200 OK"
+    assert await response.get_json() == {
+        "dimensions": {"org": {"total": 3, "top": [{"key": "456", "count": 2}]}}
+    }
@@ -0,0 +1,49 @@
+import asyncio
+
+from quart import Quart
+
+from common.metrics.quart import get_registry, register_app, register_http_metrics
+
+
+async def test_tracks_requests_in_flight():
+    app = Quart(__name__)
+    register_app(app, 0, monitor_loop=False)
+    register_http_metrics(
+        app, "test", lambda r: r.path.startswith("/api"), concurrency_target=4
+    )
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    @app.get("/api/items/<item_id>")
+    async def item(item_id: str):
+        started.set()
+        await release.wait()
+        return item_id
+
+    @app.get("/api/exception")
+    async def exception():
+        raise ValueError("boom")
+
+    @app.get("/health")
+    async def health():
+        return "ok"
+
+    registry = get_registry(app)
+    in_flight = registry.get("http_requests_in_flight")
+    saturation = registry.get("http_requests_saturation_ratio")
+    test_client = app.test_client()
+
+    request = asyncio.create_task(test_client.get("/api/items/1234"))
+    await started.wait()
+    await test_client.get("/health")
+    assert in_flight.get({"path": "/api/items/<item_id>"}) == 1
+    assert saturation.get({}) == 0.25
+
+    release.set()
+    await request
+    await test_client.get("/api/exception")
+    assert in_flight.get_all() == [
+        ({"path": "/api/items/<item_id>"}, 0),
+        ({"path": "/api/exception"}, 0),
+    ]
+    assert saturation.get({}) == 0
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from aioprometheus import Registry
+
+from common.metrics.loop_monitor import LoopMonitor
+
+
+async def test_reports_a_blocked_loop(caplog):
+    registry = Registry()
+    monitor = LoopMonitor(registry, "test", interval=0.02, blocked_threshold=0.05)
+
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        with caplog.at_level(logging.WARNING):
+            time.sleep(0.3)
+            await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    lag = registry.get("event_loop_lag_seconds").get({})
+    assert lag["count"] >= 2
+    assert lag["sum"] >= 0.2
+    assert registry.get("event_loop_blocked_total").get({}) == 1
+    assert "Event loop blocked" in caplog.text
+    assert "test_reports_a_blocked_loop" in caplog.text
+
+
+async def test_reports_default_executor_usage():
+    registry = Registry()
+    monitor = LoopMonitor(registry, "test", interval=0.01, blocked_threshold=1)
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(2))
+    release = threading.Event()
+
+    monitor.start()
+    try:
+        # Two items running and one waiting for a thread
+        tasks = [asyncio.create_task(asyncio.to_thread(release.wait)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        workers = registry.get("default_executor_workers")
+        queue = registry.get("default_executor_queue_depth")
+        assert workers.get({"state": "active"}) == 2
+        assert queue.get({}) == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        await asyncio.sleep(0.05)
+
+        assert workers.get({"state": "active"}) == 0
+        assert workers.get({"state": "idle"}) == 2
+        assert queue.get({}) == 0
+    finally:
+        release.set()
+        await monitor.stop()
@@ -0,0 +1,123 @@
+import asyncio
+import tracemalloc
+
+import injector
+import pytest
+from aioprometheus import Registry
+
+from .. import app_with_blueprint
+from common.memory_tracer import (
+    MemorySnapshotBusy,
+    MemoryTracer,
+    MemoryTracingNotStarted,
+    blueprint,
+)
+from common.metrics.memory import MemoryMonitor
+
+retained = []
+
+
+def allocate():
+    retained.append([object() for _ in range(10_000)])
+
+
+@pytest.fixture
+def memory_tracer():
+    tracer = MemoryTracer()
+    yield tracer
+    tracer.stop()
+    retained.clear()
+
+
+async def test_snapshots(memory_tracer):
+    with pytest.raises(MemoryTracingNotStarted):
+        await memory_tracer.snapshot()
+
+    memory_tracer.start()
+    assert memory_tracer.tracing
+
+    first = await memory_tracer.snapshot(limit=5)
+    assert first.growth is None
+    assert len(first.top) <= 5
+
+    allocate()
+    allocation_line = f"test_memory_tracer.py:{allocate.__code__.co_firstlineno + 1}"
+    second = await memory_tracer.snapshot(limit=5)
+    assert second.traced_memory > first.traced_memory
+    assert any(
+        stat.location.endswith(allocation_line) and stat.count_diff >= 10_000
+        for stat in second.growth
+    )
+
+    by_file = await memory_tracer.snapshot(limit=50, group_by="filename")
+    assert any(stat.location.endswith("test_memory_tracer.py") for stat in by_file.top)
+    assert not any(stat.location == tracemalloc.__file__ for stat in by_file.top)
+
+    memory_tracer.stop()
+    assert not memory_tracer.tracing
+    memory_tracer.start()
+    assert (await memory_tracer.snapshot()).growth is None
+
+
+async def test_only_one_snapshot_at_a_time(memory_tracer):
+    memory_tracer.start()
+    running = asyncio.create_task(memory_tracer.snapshot())
+    await asyncio.sleep(0)
+
+    with pytest.raises(MemorySnapshotBusy):
+        await memory_tracer.snapshot()
+
+    await running
+
+    # The baseline of the next snapshot is the one that was taken
+    assert (await memory_tracer.snapshot()).growth is not None
+
+
+def test_memory_monitor():
+    registry = Registry()
+    MemoryMonitor(registry, "test").observe()
+
+    assert registry.get("process_resident_memory_bytes").get({}) > 0
+    collections = registry.get("python_gc_collections_total")
+    assert [labels for labels, _ in collections.get_all()] == [
+        {"generation": "0"},
+        {"generation": "1"},
+        {"generation": "2"},
+    ]
+
+
+def make_test_client(memory_tracer: MemoryTracer):
+    def injector_binder(binder: injector.Binder):
+        binder.bind(MemoryTracer, memory_tracer)
+
+    return app_with_blueprint(blueprint, injector_binder).test_client()
+
+
+async def test_snapshots_route(memory_tracer):
+    test_client = make_test_client(memory_tracer)
+
+    response = await test_client.post("/memory/snapshots")
+    assert response.status_code == 409
+
+    response = await test_client.post("/memory/tracing?frames=2")
+    assert await response.get_json() == {"tracing": True}
+
+    response = await test_client.post("/memory/snapshots?limit=3")
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert len(data["top"]) == 3
+    assert data["growth"] is None
+
+    response = await test_client.post("/memory/snapshots?group_by=filename")
+    data = await response.get_json()
+    assert data["growth"] is not None
+
+    response = await test_client.delete("/memory/tracing")
+    assert await response.get_json() == {"tracing": False}
+
+
+async def test_disabled_route():
+    test_client = make_test_client(MemoryTracer(enabled=False))
+
+    response = await test_client.post("/memory/tracing")
+    assert response.status_code == 404
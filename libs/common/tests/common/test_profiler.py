@@ -0,0 +1,112 @@
+import asyncio
+import time
+
+import injector
+import pytest
+
+from .. import app_with_blueprint
+from common.profiler import Profile, ProfilerBusy, SamplingProfiler, make_blueprint
+
+
+def blocking_work(duration: float):
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        pass
+
+
+async def waiting_on_upstream(event: asyncio.Event):
+    await event.wait()
+
+
+async def test_samples_threads_and_tasks():
+    profiler = SamplingProfiler(interval=0.005)
+    event = asyncio.Event()
+    waiting = asyncio.create_task(waiting_on_upstream(event))
+
+    profiling = asyncio.create_task(profiler.profile(0.2))
+    await asyncio.sleep(0.05)
+    blocking_work(0.1)
+    profile = await profiling
+    event.set()
+    await waiting
+
+    assert profile.duration >= 0.2
+    stacks = profile.samples.keys()
+    assert any(
+        stack.startswith("thread:MainThread")
+        and "blocking_work (test_profiler.py" in stack
+        for stack in stacks
+    )
+    assert any(
+        stack.startswith("tasks;waiting_on_upstream (test_profiler.py:")
+        and ";Event.wait (locks.py:" in stack
+        for stack in stacks
+    )
+    assert not any("sampling-profiler" in stack for stack in stacks)
+
+
+async def test_only_one_profile_at_a_time():
+    profiler = SamplingProfiler(interval=0.005)
+    running = asyncio.create_task(profiler.profile(0.05))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ProfilerBusy):
+        await profiler.profile(0.05)
+
+    await running
+
+
+def test_formats():
+    profile = Profile(
+        duration=1,
+        interval=0.01,
+        samples={"thread:MainThread;main;work": 3, "thread:MainThread;main": 1},
+    )
+
+    assert profile.collapsed() == (
+        "thread:MainThread;main 1\nthread:MainThread;main;work 3\n"
+    )
+
+    speedscope = profile.speedscope("test")
+    assert speedscope["shared"]["frames"] == [
+        {"name": "thread:MainThread"},
+        {"name": "main"},
+        {"name": "work"},
+    ]
+    assert speedscope["profiles"][0]["samples"] == [[0, 1, 2], [0, 1]]
+    assert speedscope["profiles"][0]["weights"] == [0.03, 0.01]
+    assert speedscope["profiles"][0]["endValue"] == 0.04
+
+
+def make_test_client(profiler: SamplingProfiler):
+    def injector_binder(binder: injector.Binder):
+        binder.bind(SamplingProfiler, profiler)
+
+    return app_with_blueprint(make_blueprint("test-app"), injector_binder).test_client()
+
+
+async def test_profile_route():
+    test_client = make_test_client(SamplingProfiler(interval=0.005))
+
+    response = await test_client.get("/profiler/profile?seconds=0.05")
+    assert response.status == "200 OK"
+    assert "thread:MainThread;" in await response.get_data(as_text=True)
+
+    response = await test_client.get("/profiler/profile?seconds=0.05&format=speedscope")
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert data["name"] == "test-app"
+    assert data["profiles"][0]["type"] == "sampled"
+
+
+@pytest.mark.parametrize(
+    "profiler,query,status",
+    [
+        (SamplingProfiler(enabled=False), "seconds=1", 404),
+        (SamplingProfiler(max_duration=10), "seconds=11", 400),
+        (SamplingProfiler(), "seconds=0", 400),
+    ],
+)
+async def test_profile_route_rejected(profiler, query, status):
+    response = await make_test_client(profiler).get(f"/profiler/profile?{query}")
+    assert response.status_code == status
@@ -0,0 +1,81 @@
+import asyncio
+
+from quart import Quart, render_template_string
+
+from common.timing import (
+    PhaseTimer,
+    ensure_phase_timer,
+    get_phase_timer,
+    phase,
+    register_server_timing,
+)
+
+
+def make_app(enabled: bool) -> Quart:
+    app = Quart(__name__)
+    register_server_timing(app, enabled=enabled)
+
+    @app.get("/")
+    async def index():
+        with phase("work"):
+            await asyncio.sleep(0.01)
+        return await render_template_string("Hello {{ name }}", name="world")
+
+    @app.get("/debug")
+    async def debug():
+        timer = ensure_phase_timer()
+        with phase("work"):
+            await asyncio.sleep(0)
+        return timer.breakdown()
+
+    return app
+
+
+def parse_server_timing(header: str) -> dict:
+    return {
+        name: float(duration.removeprefix("dur="))
+        for name, duration in (entry.split(";") for entry in header.split(", "))
+    }
+
+
+async def test_phase_timer_accumulates():
+    timer = PhaseTimer()
+    with timer.phase("a"):
+        await asyncio.sleep(0.01)
+    with timer.phase("a"):
+        pass
+    timer.add("b", 0.002)
+
+    breakdown = timer.breakdown()
+    assert breakdown["a"] >= 10
+    assert breakdown["b"] == 2.0
+    assert breakdown["total"] >= breakdown["a"]
+
+
+async def test_phase_without_timer_does_nothing():
+    assert get_phase_timer() is None
+    with phase("work"):
+        pass
+    assert get_phase_timer() is None
+
+
+async def test_server_timing_header():
+    response = await make_app(enabled=True).test_client().get("/")
+
+    assert await response.get_data(as_text=True) == "Hello world"
+    timing = parse_server_timing(response.headers["Server-Timing"])
+    assert set(timing) == {"work", "render", "total"}
+    assert timing["work"] >= 10
+    assert timing["total"] >= timing["work"] + timing["render"]
+
+
+async def test_server_timing_disabled():
+    client = make_app(enabled=False).test_client()
+
+    response = await client.get("/")
+    assert "Server-Timing" not in response.headers
+
+    # A handler can still time a request to debug it
+    response = await client.get("/debug")
+    assert "Server-Timing" not in response.headers
+    assert set(await response.get_json()) == {"work", "total"}
@@ -0,0 +1,215 @@
+import json
+from typing import Optional
+
+import injector
+import pytest
+from aioprometheus import Registry
+from quart import Quart, render_template_string
+
+from .. import app_with_blueprint
+from common.platform_request import AbstractPlatformRequest
+from common.platform_request.tracked_platform_request import TrackedPlatformRequest
+from common.timing import phase
+from common.tracing import (
+    FileSpanExporter,
+    InMemorySpanExporter,
+    Tracer,
+    blueprint,
+    get_tracer,
+    parse_traceparent,
+    register_tracing,
+)
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class HeadersPlatformRequest(AbstractPlatformRequest):
+    def __init__(self):
+        self.headers = []
+
+    async def request(
+        self,
+        method: str,
+        base_url: str,
+        api_path: str,
+        user_identity: Optional[str] = None,
+        **kwargs,
+    ):
+        self.headers.append(kwargs["headers"])
+        raise ConnectionError("unreachable")
+
+
+def make_app(tracer: Tracer, platform_request: AbstractPlatformRequest) -> Quart:
+    platform_request = TrackedPlatformRequest(platform_request, Registry(), "test")
+    app = Quart(__name__)
+    register_tracing(
+        app,
+        tracer,
+        lambda r: r.path.startswith("/api"),
+        lambda r: {"session.id": r.headers.get("x-rh-session-id")},
+        lambda r: r.path.startswith("/api/internal"),
+    )
+
+    @app.get("/api/items/<item_id>")
+    @app.get("/api/internal/items/<item_id>")
+    async def item(item_id: str):
+        with phase("work"):
+            try:
+                await platform_request.get("http://advisor", f"/api/rule/{item_id}")
+            except ConnectionError:
+                pass
+        return await render_template_string("Item {{ item_id }}", item_id=item_id)
+
+    @app.get("/health")
+    async def health():
+        return "ok"
+
+    return app
+
+
+async def test_traces_requests():
+    exporter = InMemorySpanExporter()
+    platform_request = HeadersPlatformRequest()
+    app = make_app(Tracer(exporter, sample_ratio=1), platform_request)
+
+    await app.test_client().get(
+        "/api/items/1234", headers={"x-rh-session-id": "session"}
+    )
+    await app.test_client().get("/health")
+
+    spans = {span.name: span for span in exporter.spans()}
+    assert list(spans) == ["platform", "work", "render", "GET /api/items/<item_id>"]
+
+    root = spans["GET /api/items/<item_id>"]
+    assert root.parent_id is None
+    assert root.attributes == {"session.id": "session", "http.status_code": 200}
+    assert spans["work"].parent_id == root.span_id
+    assert spans["render"].parent_id == root.span_id
+    assert spans["platform"].parent_id == spans["work"].span_id
+    assert spans["platform"].error
+    assert spans["platform"].attributes["path"] == "/api/rule/{id}"
+    assert {span.trace_id for span in spans.values()} == {root.trace_id}
+
+    assert platform_request.headers == [
+        {"traceparent": spans["platform"].traceparent()}
+    ]
+
+
+async def test_continues_the_trace_of_the_caller():
+    exporter = InMemorySpanExporter()
+    platform_request = HeadersPlatformRequest()
+    app = make_app(Tracer(exporter, sample_ratio=0), platform_request)
+
+    await app.test_client().get(
+        "/api/internal/items/1234", headers={"traceparent": TRACEPARENT}
+    )
+
+    root = exporter.spans()[-1]
+    assert root.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert root.parent_id == "b7ad6b7169203331"
+    assert exporter.spans(trace_id="other") == []
+
+
+async def test_untrusted_callers_do_not_force_sampling():
+    exporter = InMemorySpanExporter()
+    platform_request = HeadersPlatformRequest()
+    app = make_app(Tracer(exporter, sample_ratio=0), platform_request)
+
+    await app.test_client().get("/api/items/1234", headers={"traceparent": TRACEPARENT})
+
+    assert exporter.spans() == []
+    # The trace is still continued, with the local sampling decision
+    assert platform_request.headers[0]["traceparent"].startswith(
+        "00-0af7651916cd43dd8448eb211c80319c-"
+    )
+    assert platform_request.headers[0]["traceparent"].endswith("-00")
+
+
+async def test_does_not_trace_requests_that_are_not_sampled():
+    exporter = InMemorySpanExporter()
+    platform_request = HeadersPlatformRequest()
+    app = make_app(Tracer(exporter, sample_ratio=0), platform_request)
+
+    await app.test_client().get(
+        "/api/items/1234",
+        headers={"traceparent": TRACEPARENT.removesuffix("01") + "00"},
+    )
+    await app.test_client().get("/api/items/1234")
+
+    assert exporter.spans() == []
+    # The context is still passed on, with the decision of the caller
+    assert platform_request.headers[0]["traceparent"].startswith(
+        "00-0af7651916cd43dd8448eb211c80319c-"
+    )
+    assert platform_request.headers[0]["traceparent"].endswith("-00")
+
+
+async def test_disabled_tracer():
+    platform_request = HeadersPlatformRequest()
+    tracer = Tracer(None)
+    app = make_app(tracer, platform_request)
+
+    await app.test_client().get("/api/items/1234")
+
+    assert platform_request.headers == [{}]
+    assert get_tracer(app) is tracer
+    with pytest.raises(ValueError):
+        register_tracing(app, tracer)
+
+
+def test_file_exporter(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer = Tracer(FileSpanExporter(str(path)))
+
+    tracer.start_trace("first").end()
+    tracer.start_trace("second", TRACEPARENT).end()
+
+    spans = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [span["name"] for span in spans] == ["first", "second"]
+    assert spans[1]["parent_id"] == "b7ad6b7169203331"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (TRACEPARENT, ("0af7651916cd43dd8448eb211c80319c", "b7ad6b7169203331", True)),
+        (None, None),
+        ("00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331", None),
+        ("00-00000000000000000000000000000000-b7ad6b7169203331-01", None),
+        ("garbage", None),
+    ],
+)
+def test_parse_traceparent(value, expected):
+    assert parse_traceparent(value) == expected
+
+
+def make_test_client(tracer: Tracer):
+    def injector_binder(binder: injector.Binder):
+        binder.bind(Tracer, tracer)
+
+    return app_with_blueprint(blueprint, injector_binder).test_client()
+
+
+async def test_spans_route():
+    tracer = Tracer(InMemorySpanExporter())
+    first = tracer.start_trace("GET /first")
+    first.child("platform", service="http://advisor").end()
+    first.end()
+    tracer.start_trace("GET /second").end()
+
+    response = await make_test_client(tracer).get(
+        f"/tracing/spans?trace_id={first.trace_id}"
+    )
+
+    assert response.status == "200 OK"
+    spans = (await response.get_json())["spans"]
+    assert [(span["name"], span["parent_id"]) for span in spans] == [
+        ("platform", first.span_id),
+        ("GET /first", None),
+    ]
+    assert spans[0]["attributes"] == {"service": "http://advisor"}
+
+
+async def test_spans_route_not_kept_in_memory():
+    response = await make_test_client(Tracer(None)).get("/tracing/spans")
+    assert response.status_code == 404
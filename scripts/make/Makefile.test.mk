@@ -26,5 +26,8 @@ test-python-coverage:
 test-python-coverage-html: COVERAGE_FORMAT = "html"
 test-python-coverage-html: test-python-coverage
 
+benchmark-openshift-advisor:
+	PYTHONPATH=src uv run --directory services/watson-extension python benchmarks/openshift_advisor.py
+
 test-openapi:
 	curl -X GET http://0.0.0.0:5005/api/virtual-assistant/v1/openapi.json
@@ -12,6 +12,10 @@ import virtual_assistant.config as config
 
 from common.logging import build_logger
 from virtual_assistant.quart_schema import VirtualAssistantOpenAPIProvider
+from common.flight_recorder import FlightRecorder, register_flight_recorder
+from common.heavy_hitters import HeavyHitterTracker, register_heavy_hitters
+from common.timing import register_server_timing
+from common.tracing import Tracer, make_span_exporter, register_tracing
 from common.types.errors import ValidationError
 from virtual_assistant.startup import wire_routes, injector_from_config
 
@@ -22,9 +26,39 @@ app = Quart(__name__)
 wire_routes(app)
 quart_injector.QuartModule(app)
 quart_injector.wire(app, injector_from_config)
-quart_metrics.register_app(app, port=config.metrics_port)
+quart_metrics.register_app(
+    app,
+    port=config.metrics_port,
+    app_name=config.name,
+    monitor_loop=config.loop_monitor_enabled,
+    monitor_memory=config.memory_monitor_enabled,
+)
 quart_metrics.register_http_metrics(
-    app, config.name, lambda r: r.path.startswith("/api")
+    app,
+    config.name,
+    lambda r: r.path.startswith("/api"),
+    concurrency_target=config.http_concurrency_target,
+)
+register_tracing(
+    app,
+    Tracer(
+        make_span_exporter(config.tracing_exporter, config.tracing_file),
+        sample_ratio=config.tracing_sample_ratio,
+    ),
+    lambda r: r.path.startswith("/api"),
+)
+register_server_timing(app, enabled=config.server_timing_enabled)
+register_flight_recorder(
+    app,
+    FlightRecorder(config.flight_recorder_slowest, config.flight_recorder_errors),
+    lambda r: r.path.startswith("/api"),
+)
+register_heavy_hitters(
+    app,
+    HeavyHitterTracker(
+        quart_metrics.get_registry(app), config.name, k=config.heavy_hitters_top_k
+    ),
+    lambda r: r.path.startswith("/api"),
 )
 
 
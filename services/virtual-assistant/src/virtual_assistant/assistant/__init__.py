@@ -157,6 +157,9 @@ class AssistantOutput(BaseModel):
     is_action_running: bool
     """True if we are in the middle of a multi-step action"""
 
+    intent: Optional[str] = None
+    """Intent the assistant recognized in the input, if any"""
+
 
 @dataclasses.dataclass
 class AssistantContext:
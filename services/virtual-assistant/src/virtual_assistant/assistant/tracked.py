@@ -0,0 +1,106 @@
+import logging
+import time
+from collections import Counter as EntryCounter
+
+from aioprometheus import Counter, Histogram, Registry
+from ibm_cloud_sdk_core.api_exception import ApiException
+
+from common.metrics import get_or_create_metric
+from . import Assistant, AssistantContext, AssistantInput, AssistantOutput
+
+_REQUESTS_TOTAL_METRIC_NAME = "assistant_requests_total"
+_REQUEST_DURATION_METRIC_NAME = "assistant_request_duration_seconds"
+_RESPONSE_ENTRIES_METRIC_NAME = "assistant_response_entries_total"
+_CONFIDENCE_METRIC_NAME = "assistant_response_confidence"
+
+logger = logging.getLogger(__name__)
+
+
+class TrackedAssistant(Assistant):
+    """
+    Measures the calls made to the assistant (e.g. Watson): duration and status of `create_session` and
+    `send_message`, the kinds of entries of the responses and how confident the assistant was about them.
+    """
+
+    def __init__(self, assistant: Assistant, registry: Registry, app_name: str):
+        self.assistant = assistant
+
+        self.requests_total = get_or_create_metric(
+            registry,
+            _REQUESTS_TOTAL_METRIC_NAME,
+            Counter,
+            "Total number of assistant requests by operation and status",
+            const_labels={"app": app_name},
+        )
+
+        self.request_duration = get_or_create_metric(
+            registry,
+            _REQUEST_DURATION_METRIC_NAME,
+            Histogram,
+            "Duration of assistant requests in seconds",
+            const_labels={"app": app_name},
+            buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+        )
+
+        self.response_entries = get_or_create_metric(
+            registry,
+            _RESPONSE_ENTRIES_METRIC_NAME,
+            Counter,
+            "Entries of the assistant responses by type",
+            const_labels={"app": app_name},
+        )
+
+        self.confidence = get_or_create_metric(
+            registry,
+            _CONFIDENCE_METRIC_NAME,
+            Histogram,
+            "Confidence of the assistant in its responses",
+            const_labels={"app": app_name},
+            buckets=[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+        )
+
+    async def create_session(self, user_id: str) -> str:
+        start = time.monotonic()
+        status = "exception"
+        try:
+            session_id = await self.assistant.create_session(user_id)
+            status = "ok"
+            return session_id
+        except ApiException as e:
+            status = str(e.status_code)
+            raise
+        finally:
+            self._observe_request("create_session", status, time.monotonic() - start)
+
+    async def send_message(
+        self, message: AssistantInput, context: AssistantContext
+    ) -> AssistantOutput:
+        start = time.monotonic()
+        status = "exception"
+        try:
+            output = await self.assistant.send_message(message, context)
+            status = "ok"
+        except ApiException as e:
+            status = str(e.status_code)
+            raise
+        finally:
+            self._observe_request("send_message", status, time.monotonic() - start)
+
+        self._observe_output(output)
+        return output
+
+    def _observe_request(self, operation: str, status: str, duration: float):
+        try:
+            self.requests_total.inc({"operation": operation, "status": status})
+            self.request_duration.observe({"operation": operation}, duration)
+        except Exception as e:
+            logger.error("Failed to send assistant metrics", e)
+
+    def _observe_output(self, output: AssistantOutput):
+        try:
+            entries = EntryCounter(entry.type for entry in output.response)
+            for response_type, count in entries.items():
+                self.response_entries.add({"type": response_type.value}, count)
+            self.confidence.observe({}, output.confidence)
+        except Exception as e:
+            logger.error("Failed to send assistant metrics", e)
@@ -5,7 +5,7 @@ import base64
 import re
 import textwrap
 import logging
-from typing import List, Any, Tuple
+from typing import List, Any, Optional, Tuple
 
 from . import (
     Assistant,
@@ -132,6 +132,14 @@ def get_confidence(response: dict) -> float:
     return 1.0
 
 
+def get_intent(response: dict) -> Optional[str]:
+    intents = response.get("output", {}).get("intents")
+    if intents is not None and len(intents) > 0:
+        return intents[0].get("intent")
+
+    return None
+
+
 def get_action_running(response: dict) -> bool:
     try:
         b64_state = (
@@ -334,4 +342,5 @@ class WatsonAssistant(Assistant):
             debug_output=debug_output,
             confidence=get_confidence(response_result),
             is_action_running=get_action_running(response_result),
+            intent=get_intent(response_result),
         )
@@ -9,6 +9,32 @@ port = config("PORT", default=5000, cast=int)
 environment_name = config("ENVIRONMENT_NAME", default="stage", cast=str)
 
 metrics_port = config("METRICS_PORT", default=0, cast=int)
+# Reports how long each phase of a request took (e.g. session lookup, assistant, rendering) in the Server-Timing header.
+# Off by default, the header exposes internal phases and upstream durations to every caller.
+server_timing_enabled = config("SERVER_TIMING_ENABLED", default=False, cast=bool)
+# Exports event loop lag, event loop stalls (logging the blocking stack) and default executor usage as metrics
+loop_monitor_enabled = config("LOOP_MONITOR_ENABLED", default=True, cast=bool)
+# Exports the resident memory and the gc activity of the process as metrics, read every 15 seconds
+memory_monitor_enabled = config("MEMORY_MONITOR_ENABLED", default=True, cast=bool)
+# Requests a replica should handle at once, http_requests_saturation_ratio reports the requests in flight over it
+http_concurrency_target = config("HTTP_CONCURRENCY_TARGET", default=50, cast=int)
+# Requests kept by the flight recorder (served on /flight_recorder/requests): the slowest ones and the last failed ones
+flight_recorder_slowest = config("FLIGHT_RECORDER_SLOWEST", default=20, cast=int)
+flight_recorder_errors = config("FLIGHT_RECORDER_ERRORS", default=20, cast=int)
+# Most frequent routes, orgs and intents exported in heavy_hitter_requests and served on /heavy_hitters
+heavy_hitters_top_k = config("HEAVY_HITTERS_TOP_K", default=20, cast=int)
+# Allows sampling the stacks of the instance on /profiler/profile, for at most PROFILER_MAX_DURATION seconds
+profiler_enabled = config("PROFILER_ENABLED", default=False, cast=bool)
+profiler_max_duration = config("PROFILER_MAX_DURATION", default=60, cast=float)
+# Allows tracing allocations with tracemalloc and taking snapshots on /memory
+memory_tracer_enabled = config("MEMORY_TRACER_ENABLED", default=False, cast=bool)
+# Exports the spans of the sampled requests: none, memory (served on /tracing/spans) or file (one json span per line)
+tracing_exporter = config(
+    "TRACING_EXPORTER", default="none", cast=Choices(["none", "memory", "file"])
+)
+tracing_file = config("TRACING_FILE", default="spans.jsonl")
+# Share of the requests traced when the caller did not decide with a traceparent header
+tracing_sample_ratio = config("TRACING_SAMPLE_RATIO", default=0.1, cast=float)
 
 is_running_locally = config("IS_RUNNING_LOCALLY", default=False, cast=bool)
 if is_running_locally:
@@ -32,6 +58,14 @@ if session_storage == "redis":
     redis_hostname = config("REDIS_HOSTNAME")
     redis_port = config("REDIS_PORT")
 
+# Opt-in: private url of watson-extension's /prefetch, called in the background when a session is created so the data
+# of the user is ready for the first turns (e.g. http://virtual-assistant-v2-watson-extension:8000/prefetch).
+# Needs redis session storage on both services.
+watson_extension_prefetch_url = config("WATSON_EXTENSION_PREFETCH_URL", default=None)
+watson_extension_prefetch_timeout = config(
+    "WATSON_EXTENSION_PREFETCH_TIMEOUT", default=10.0, cast=float
+)
+
 
 console_assistant = config(
     "CONSOLE_ASSISTANT", default="echo", cast=Choices(["echo", "watson"])
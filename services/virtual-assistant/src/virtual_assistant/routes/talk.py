@@ -15,6 +15,9 @@ from common.auth import (
     require_identity_header,
     decoded_identity_header,
 )
+from common.heavy_hitters import record_request_key
+from common.timing import ensure_phase_timer, phase
+from common.tracing import get_current_span
 from common.types.errors import ValidationError
 from virtual_assistant.assistant import (
     Assistant,
@@ -26,6 +29,7 @@ from virtual_assistant.assistant import (
 from virtual_assistant.assistant.response_processor.response_processor import (
     ResponseProcessor,
 )
+from virtual_assistant.session_prefetch import SessionPrefetcher
 
 
 blueprint = Blueprint("talk", __name__, url_prefix="/talk")
@@ -83,29 +87,45 @@ async def talk(
     assistant: injector.Inject[Assistant],
     session_storage: injector.Inject[SessionStorage],
     assistant_response_processors: injector.Inject[List[ResponseProcessor]],
+    session_prefetcher: injector.Inject[SessionPrefetcher],
 ) -> Union[TalkResponse, Tuple[ValidationError, 400]]:
     identity = request.headers.get("x-rh-identity")
     user_id = assistant_user_id(identity)
     session_id = data.session_id
+    record_request_key("org", user_id.split("/", 1)[0])
 
     debug_output = None
     if data.include_debug:
         debug_output = {}
+        ensure_phase_timer()
 
-    if session_id is not None:
-        session = await session_storage.get(session_id)
-        if session is None or session.user_id != user_id:
+    new_session = session_id is None
+    if not new_session:
+        with phase("session"):
+            session = await session_storage.get(session_id, user_id)
+        if session is None:
             raise BadRequest(f"Invalid session {session_id}")
     else:
-        session_id = await assistant.create_session(user_id)
-
-    await session_storage.put(
-        Session(
-            key=session_id,
-            user_identity=identity,
-            user_id=user_id,
+        with phase("create_session"):
+            session_id = await assistant.create_session(user_id)
+
+    with phase("session"):
+        await session_storage.put(
+            Session(
+                key=session_id,
+                user_identity=identity,
+                user_id=user_id,
+            )
         )
-    )
+
+    current_span = get_current_span()
+    if current_span is not None:
+        # Watson does not forward the trace context, spans of watson-extension are found by session id
+        current_span.set_attribute("session.id", session_id)
+
+    if new_session:
+        # Needs the stored session, watson-extension resolves the identity from it
+        session_prefetcher.start(session_id)
 
     # Send message to the configured assistant
     try:
@@ -115,33 +135,46 @@ async def talk(
         )
 
         identity_json = decoded_identity_header(identity)["identity"]
-        assistant_response = await assistant.send_message(
-            message=AssistantInput(
-                session_id=session_id,
-                user_id=user_id,
-                query=query,
-                include_debug=data.include_debug,
-            ),
-            context=AssistantContext(
-                is_internal=identity_json.get("user", {}).get("is_internal", False),
-                is_org_admin=identity_json.get("user", {}).get("is_org_admin", False),
-                user_email=identity_json.get("user", {}).get("email", "no_user_email"),
-            ),
-        )
-
+        with phase("assistant"):
+            assistant_response = await assistant.send_message(
+                message=AssistantInput(
+                    session_id=session_id,
+                    user_id=user_id,
+                    query=query,
+                    include_debug=data.include_debug,
+                ),
+                context=AssistantContext(
+                    is_internal=identity_json.get("user", {}).get("is_internal", False),
+                    is_org_admin=identity_json.get("user", {}).get(
+                        "is_org_admin", False
+                    ),
+                    user_email=identity_json.get("user", {}).get(
+                        "email", "no_user_email"
+                    ),
+                ),
+            )
+
+        record_request_key("intent", assistant_response.intent)
         if data.include_debug:
             debug_output["assistant"] = assistant_response.debug_output
 
         if assistant_response_processors:
             for processor in assistant_response_processors:
-                assistant_response.response = await processor.process(
-                    assistant_response.response, query=query
-                )
+                with phase(type(processor).__name__):
+                    assistant_response.response = await processor.process(
+                        assistant_response.response, query=query
+                    )
 
     except ApiException as e:
         # Todo: Should we just let raise this error and let the error handler wrap it into a validation error?
         return ValidationError(message=str(e)), 400
 
+    if data.include_debug:
+        debug_output["timing"] = ensure_phase_timer().breakdown()
+        # Traces that are not sampled are not exported, their id would point to nothing
+        if current_span is not None and current_span.sampled:
+            debug_output["trace_id"] = current_span.trace_id
+
     return TalkResponse(
         session_id=session_id,
         response=assistant_response.response,
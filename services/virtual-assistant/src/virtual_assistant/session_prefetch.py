@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Optional, Set
+
+import aiohttp
+from aioprometheus import Counter, Registry
+
+from common.metrics import get_or_create_metric
+from common.tracing import inject_traceparent
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPrefetcher:
+    """
+    Asks watson-extension to prefetch the data of a user as soon as their session is created, so it is ready by the
+    time Watson calls the extension. The call runs in the background and never delays or fails the conversation.
+
+    Disabled without a `prefetch_url`.
+    """
+
+    def __init__(
+        self,
+        prefetch_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: float = 10.0,
+        metrics_registry: Optional[Registry] = None,
+        app_name: str = "",
+    ):
+        self.prefetch_url = prefetch_url
+        self.session = session
+        self.timeout = timeout
+        # Keeps the running prefetches referenced until they are done
+        self._tasks: Set[asyncio.Task] = set()
+
+        self._prefetch_total: Optional[Counter] = None
+        if metrics_registry is not None:
+            self._prefetch_total = get_or_create_metric(
+                metrics_registry,
+                "session_prefetch_total",
+                Counter,
+                "Prefetches requested for new sessions by result",
+                const_labels={"app": app_name},
+            )
+
+    def start(self, session_id: str):
+        if self.prefetch_url is None or self.session is None:
+            return
+
+        task = asyncio.create_task(self._prefetch(session_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _prefetch(self, session_id: str):
+        try:
+            async with self.session.post(
+                self.prefetch_url,
+                headers=inject_traceparent({"x-rh-session-id": session_id}),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as response:
+                response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Failed to prefetch the data of session {session_id}: {e}")
+            self._record("error")
+            return
+
+        self._record("success")
+
+    def _record(self, result: str):
+        if self._prefetch_total is None:
+            return
+        try:
+            self._prefetch_total.inc({"result": result})
+        except Exception as e:
+            logger.error("Failed to send session prefetch metrics", e)
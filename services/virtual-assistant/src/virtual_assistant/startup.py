@@ -14,6 +14,13 @@ from common.identity import (
 from common.platform_request import (
     AbstractPlatformRequest,
 )
+from common import flight_recorder, heavy_hitters, memory_tracer, profiler, tracing
+from common.flight_recorder import FlightRecorder, get_flight_recorder
+from common.heavy_hitters import HeavyHitterTracker, get_heavy_hitters
+from common.memory_tracer import MemoryTracer
+from common.profiler import SamplingProfiler
+from common.tracing import Tracer, get_tracer
+from common.metrics.quart import get_registry
 from common.session_storage import SessionStorage
 
 import virtual_assistant.config as config
@@ -41,25 +48,31 @@ from virtual_assistant.assistant.watson import (
     WatsonAssistantVariables,
 )
 from virtual_assistant.assistant.echo import EchoAssistant
+from virtual_assistant.assistant.tracked import TrackedAssistant
+from virtual_assistant.session_prefetch import SessionPrefetcher
 
 
 @injector.provider
-def console_assistant_watson_provider() -> Assistant:
-    return WatsonAssistant(
-        assistant=build_assistant(
-            config.watson_api_key, config.watson_env_version, config.watson_api_url
-        ),
-        assistant_id=config.watson_env_id,  # Todo: Should we use a different id for the assistant?
-        environment_id=config.watson_env_id,
-        variables=WatsonAssistantVariables(
-            draft=config.watson_is_draft_env,
+def console_assistant_watson_provider(app: injector.Inject[Quart]) -> Assistant:
+    return TrackedAssistant(
+        WatsonAssistant(
+            assistant=build_assistant(
+                config.watson_api_key, config.watson_env_version, config.watson_api_url
+            ),
+            assistant_id=config.watson_env_id,  # Todo: Should we use a different id for the assistant?
+            environment_id=config.watson_env_id,
+            variables=WatsonAssistantVariables(
+                draft=config.watson_is_draft_env,
+            ),
         ),
+        get_registry(app),
+        config.name,
     )
 
 
 @injector.provider
-def console_assistant_echo_provider() -> Assistant:
-    return EchoAssistant()
+def console_assistant_echo_provider(app: injector.Inject[Quart]) -> Assistant:
+    return TrackedAssistant(EchoAssistant(), get_registry(app), config.name)
 
 
 @injector.multiprovider
@@ -79,6 +92,20 @@ def response_processors_default() -> List[ResponseProcessor]:
     return [CombineEmpty()]
 
 
+@injector.provider
+def session_prefetcher_provider(
+    session: injector.Inject[aiohttp.ClientSession],
+    app: injector.Inject[Quart],
+) -> SessionPrefetcher:
+    return SessionPrefetcher(
+        config.watson_extension_prefetch_url,
+        session,
+        timeout=config.watson_extension_prefetch_timeout,
+        metrics_registry=get_registry(app),
+        app_name=config.name,
+    )
+
+
 @injector.provider
 def quart_user_identity_provider() -> QuartRedHatUserIdentityProvider:
     import quart
@@ -86,6 +113,21 @@ def quart_user_identity_provider() -> QuartRedHatUserIdentityProvider:
     return QuartRedHatUserIdentityProvider(quart.request)
 
 
+@injector.provider
+def flight_recorder_provider(app: injector.Inject[Quart]) -> FlightRecorder:
+    return get_flight_recorder(app)
+
+
+@injector.provider
+def tracer_provider(app: injector.Inject[Quart]) -> Tracer:
+    return get_tracer(app)
+
+
+@injector.provider
+def heavy_hitters_provider(app: injector.Inject[Quart]) -> HeavyHitterTracker:
+    return get_heavy_hitters(app)
+
+
 def injector_from_config(binder: injector.Binder) -> None:
     # This gets injected into routes when it is requested.
     # e.g. async def status(session_storage: injector.Inject[SessionStorage]) -> StatusResponse:
@@ -95,13 +137,16 @@ def injector_from_config(binder: injector.Binder) -> None:
             to=make_redis_session_storage_provider(
                 hostname=config.redis_hostname,
                 port=config.redis_port,
+                app_name=config.name,
             ),
             scope=injector.singleton,
         )
     elif config.session_storage == "file":
         binder.bind(
             SessionStorage,
-            to=make_file_session_storage_provider(".va-session-storage"),
+            to=make_file_session_storage_provider(
+                ".va-session-storage", app_name=config.name
+            ),
             scope=injector.singleton,
         )
 
@@ -111,6 +156,25 @@ def injector_from_config(binder: injector.Binder) -> None:
         scope=injector.singleton,
     )
 
+    binder.bind(
+        SessionPrefetcher, to=session_prefetcher_provider, scope=injector.singleton
+    )
+    binder.bind(FlightRecorder, to=flight_recorder_provider, scope=injector.singleton)
+    binder.bind(Tracer, to=tracer_provider, scope=injector.singleton)
+    binder.bind(HeavyHitterTracker, to=heavy_hitters_provider, scope=injector.singleton)
+    binder.bind(
+        SamplingProfiler,
+        to=SamplingProfiler(
+            enabled=config.profiler_enabled, max_duration=config.profiler_max_duration
+        ),
+        scope=injector.singleton,
+    )
+    binder.bind(
+        MemoryTracer,
+        to=MemoryTracer(enabled=config.memory_tracer_enabled),
+        scope=injector.singleton,
+    )
+
     if config.platform_request == "dev":
         binder.bind(
             AbstractPlatformRequest,
@@ -200,6 +264,11 @@ def wire_routes(app: Quart) -> None:
 
     # Connecting private routes (/)
     private_root.register_blueprint(health.blueprint)
+    private_root.register_blueprint(flight_recorder.blueprint)
+    private_root.register_blueprint(profiler.make_blueprint(config.name))
+    private_root.register_blueprint(memory_tracer.blueprint)
+    private_root.register_blueprint(tracing.blueprint)
+    private_root.register_blueprint(heavy_hitters.blueprint)
 
     # Connect public routes ({config.base_url})
     public_root.register_blueprint(talk.blueprint)
@@ -0,0 +1,103 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aioprometheus import Registry
+from ibm_cloud_sdk_core.api_exception import ApiException
+
+from virtual_assistant.assistant import (
+    Assistant,
+    AssistantContext,
+    AssistantInput,
+    AssistantOutput,
+    Query,
+    ResponseOption,
+    ResponseOptions,
+    ResponseText,
+)
+from virtual_assistant.assistant.tracked import TrackedAssistant
+
+MESSAGE = AssistantInput(session_id="session", user_id="user", query=Query(text="hi"))
+CONTEXT = AssistantContext(is_internal=False, is_org_admin=False, user_email="")
+
+
+@pytest.fixture
+def registry() -> Registry:
+    return Registry()
+
+
+@pytest.fixture
+def assistant() -> MagicMock:
+    return MagicMock(Assistant)
+
+
+@pytest.fixture
+def testee(assistant, registry) -> TrackedAssistant:
+    return TrackedAssistant(assistant, registry, "test-app")
+
+
+def duration_count(registry: Registry, operation: str) -> int:
+    return registry.get("assistant_request_duration_seconds").get(
+        {"operation": operation}
+    )["count"]
+
+
+async def test_create_session(testee, assistant, registry):
+    assistant.create_session = AsyncMock(return_value="session")
+
+    assert await testee.create_session("user") == "session"
+
+    requests = registry.get("assistant_requests_total")
+    assert requests.get({"operation": "create_session", "status": "ok"}) == 1
+    assert duration_count(registry, "create_session") == 1
+
+
+async def test_send_message(testee, assistant, registry):
+    output = AssistantOutput(
+        session_id="session",
+        user_id="user",
+        response=[
+            ResponseText(text="one"),
+            ResponseText(text="two"),
+            ResponseOptions(options=[ResponseOption(text="option", value="value")]),
+        ],
+        confidence=0.45,
+        is_action_running=False,
+    )
+    assistant.send_message = AsyncMock(return_value=output)
+
+    assert await testee.send_message(MESSAGE, CONTEXT) is output
+
+    requests = registry.get("assistant_requests_total")
+    assert requests.get({"operation": "send_message", "status": "ok"}) == 1
+    assert duration_count(registry, "send_message") == 1
+    entries = registry.get("assistant_response_entries_total")
+    assert entries.get({"type": "TEXT"}) == 2
+    assert entries.get({"type": "OPTIONS"}) == 1
+    confidence = registry.get("assistant_response_confidence").get({})
+    assert confidence["count"] == 1
+    assert confidence[0.4] == 0
+    assert confidence[0.5] == 1
+
+
+async def test_send_message_api_exception(testee, assistant, registry):
+    assistant.send_message = AsyncMock(
+        side_effect=ApiException(404, message="Not found")
+    )
+
+    with pytest.raises(ApiException):
+        await testee.send_message(MESSAGE, CONTEXT)
+
+    requests = registry.get("assistant_requests_total")
+    assert requests.get({"operation": "send_message", "status": "404"}) == 1
+    assert duration_count(registry, "send_message") == 1
+    assert not registry.get("assistant_response_confidence").values
+
+
+async def test_create_session_exception(testee, assistant, registry):
+    assistant.create_session = AsyncMock(side_effect=ValueError("boom"))
+
+    with pytest.raises(ValueError):
+        await testee.create_session("user")
+
+    requests = registry.get("assistant_requests_total")
+    assert requests.get({"operation": "create_session", "status": "exception"}) == 1
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 
 from common.session_storage import SessionStorage
 from common.session_storage.memory import MemorySessionStorage
+from common.tracing import InMemorySpanExporter, Tracer, register_tracing
 from quart.typing import TestClientProtocol
 import injector
 import pytest
@@ -12,6 +13,7 @@ from virtual_assistant.assistant.response_processor.response_processor import (
     ResponseProcessor,
 )
 from virtual_assistant.routes.talk import blueprint, TalkResponse
+from virtual_assistant.session_prefetch import SessionPrefetcher
 from virtual_assistant.assistant import Assistant, ResponseType, ResponseText
 
 from .common import app_with_blueprint
@@ -29,11 +31,19 @@ async def response_processor_mock() -> MagicMock:
 
 
 @pytest.fixture
-async def test_client(response_processor_mock) -> TestClientProtocol:
+async def session_prefetcher_mock() -> MagicMock:
+    return MagicMock(SessionPrefetcher)
+
+
+@pytest.fixture
+async def test_client(
+    response_processor_mock, session_prefetcher_mock
+) -> TestClientProtocol:
     def injector_binder(binder: injector.Binder):
         binder.bind(Assistant, EchoAssistant())
         binder.bind(SessionStorage, MemorySessionStorage())
         binder.multibind(List[ResponseProcessor], [response_processor_mock])
+        binder.bind(SessionPrefetcher, session_prefetcher_mock)
 
     return app_with_blueprint(blueprint, injector_binder).test_client()
 
@@ -64,6 +74,28 @@ async def test_talk(test_client) -> None:
     assert talk_response.response[0].text == "hello world"
 
 
+async def test_talk_prefetch_new_session(test_client, session_prefetcher_mock):
+    headers = {
+        "x-rh-identity": "eyJpZGVudGl0eSI6IHsiYWNjb3VudF9udW1iZXIiOiJhY2NvdW50MTIzIiwib3JnX2lkIjoib3JnMTIzIiwidHlwZSI6IlVzZXIiLCJ1c2VyIjp7ImlzX29yZ19hZG1pbiI6dHJ1ZSwgInVzZXJfaWQiOiIxMjM0NTY3ODkwIiwidXNlcm5hbWUiOiJhc3RybyJ9LCJpbnRlcm5hbCI6eyJvcmdfaWQiOiJvcmcxMjMifX19",
+    }
+    raw_response = await test_client.post(
+        "/talk",
+        json={"session_id": None, "input": {"text": "hello world"}},
+        headers=headers,
+    )
+    session_id = TalkResponse(**await raw_response.get_json()).session_id
+    session_prefetcher_mock.start.assert_called_once_with(session_id)
+
+    # Only for new sessions
+    raw_response = await test_client.post(
+        "/talk",
+        json={"session_id": session_id, "input": {"text": "hello again"}},
+        headers=headers,
+    )
+    assert raw_response.status == "200 OK"
+    session_prefetcher_mock.start.assert_called_once()
+
+
 async def test_talk_processors(test_client, response_processor_mock):
     raw_response = await test_client.post(
         "/talk",
@@ -143,6 +175,46 @@ async def test_talk_debug_output(test_client) -> None:
     talk_response = TalkResponse(**json)
 
     assert talk_response.debug_output is not None
+    assert {"create_session", "session", "assistant", "total"} <= set(
+        talk_response.debug_output["timing"]
+    )
+
+
+@pytest.mark.parametrize("sample_ratio", [0, 1])
+async def test_talk_debug_output_trace_id(
+    response_processor_mock, session_prefetcher_mock, sample_ratio
+) -> None:
+    def injector_binder(binder: injector.Binder):
+        binder.bind(Assistant, EchoAssistant())
+        binder.bind(SessionStorage, MemorySessionStorage())
+        binder.multibind(List[ResponseProcessor], [response_processor_mock])
+        binder.bind(SessionPrefetcher, session_prefetcher_mock)
+
+    exporter = InMemorySpanExporter()
+    app = app_with_blueprint(blueprint, injector_binder)
+    register_tracing(app, Tracer(exporter, sample_ratio=sample_ratio))
+
+    raw_response = await app.test_client().post(
+        "/talk",
+        json={
+            "session_id": None,
+            "input": {
+                "text": "hello world",
+            },
+            "include_debug": True,
+        },
+        headers={
+            "x-rh-identity": "eyJpZGVudGl0eSI6IHsiYWNjb3VudF9udW1iZXIiOiJhY2NvdW50MTIzIiwib3JnX2lkIjoib3JnMTIzIiwidHlwZSI6IlVzZXIiLCJ1c2VyIjp7ImlzX29yZ19hZG1pbiI6dHJ1ZSwgInVzZXJfaWQiOiIxMjM0NTY3ODkwIiwidXNlcm5hbWUiOiJhc3RybyJ9LCJpbnRlcm5hbCI6eyJvcmdfaWQiOiJvcmcxMjMifX19",
+        },
+    )
+    assert raw_response.status == "200 OK"
+    debug_output = TalkResponse(**await raw_response.get_json()).debug_output
+
+    # Only the id of an exported trace is returned
+    assert debug_output.get("trace_id") == (
+        exporter.spans()[-1].trace_id if exporter.spans() else None
+    )
+    assert ("trace_id" in debug_output) == (sample_ratio == 1)
 
 
 async def test_talk_bad_request_invalid_session(test_client) -> None:
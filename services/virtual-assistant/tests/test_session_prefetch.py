@@ -0,0 +1,61 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aioprometheus import Registry
+from aioresponses import aioresponses
+from yarl import URL
+
+from virtual_assistant.session_prefetch import SessionPrefetcher
+
+PREFETCH_URL = "http://watson-extension/prefetch"
+
+
+@pytest.fixture
+async def aiohttp_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+async def wait_for_prefetches(prefetcher: SessionPrefetcher):
+    await asyncio.gather(*prefetcher._tasks)
+
+
+async def test_start_prefetches_in_the_background(session, aiohttp_mock):
+    aiohttp_mock.post(PREFETCH_URL, payload={"prefetched": {}})
+    metrics = Registry()
+    prefetcher = SessionPrefetcher(PREFETCH_URL, session, metrics_registry=metrics)
+
+    prefetcher.start("session-1")
+    await wait_for_prefetches(prefetcher)
+
+    (call,) = aiohttp_mock.requests[("POST", URL(PREFETCH_URL))]
+    assert call.kwargs["headers"] == {"x-rh-session-id": "session-1"}
+    assert metrics.get("session_prefetch_total").get({"result": "success"}) == 1
+
+
+async def test_start_failures_are_only_recorded(session, aiohttp_mock):
+    aiohttp_mock.post(PREFETCH_URL, status=500)
+    metrics = Registry()
+    prefetcher = SessionPrefetcher(PREFETCH_URL, session, metrics_registry=metrics)
+
+    prefetcher.start("session-1")
+    await wait_for_prefetches(prefetcher)
+
+    assert metrics.get("session_prefetch_total").get({"result": "error"}) == 1
+
+
+async def test_start_disabled_without_url(session, aiohttp_mock):
+    prefetcher = SessionPrefetcher(None, session)
+
+    prefetcher.start("session-1")
+
+    assert prefetcher._tasks == set()
+    assert aiohttp_mock.requests == {}
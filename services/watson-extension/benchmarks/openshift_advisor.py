@@ -0,0 +1,133 @@
+"""
+Compares loading the whole OpenShift advisor clusters response and sorting it against streaming it into a top-k
+selection, for 10k and 100k clusters.
+
+Run with: make benchmark-openshift-advisor
+"""
+
+import asyncio
+import json
+import multiprocessing
+import socket
+import time
+import tracemalloc
+import uuid
+
+import aiohttp
+from aiohttp import web
+
+from common.identity import FixedUserIdentityProvider
+from common.platform_request import PlatformRequest
+from watson_extension.clients import AdvisorOpenshiftURL
+from watson_extension.clients.openshift.advisor import AdvisorClientHttp, Cluster
+from watson_extension.clients.org_cache import OrgCache
+
+CLUSTERS_PATH = "/api/insights-results-aggregator/v2/clusters"
+
+
+def build_payload(rows: int) -> bytes:
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "cluster_id": str(uuid.uuid4()),
+                    "cluster_name": f"cluster {i}",
+                    "last_checked_at": f"2025-03-{1 + i % 28:02}T13:{i % 60:02}:00Z",
+                    "total_hit_count": i % 10,
+                }
+                for i in range(rows)
+            ],
+            "meta": {"count": rows},
+            "status": "ok",
+        }
+    ).encode()
+
+
+async def load_and_sort(session: aiohttp.ClientSession, url: str):
+    # Previous implementation: full body, a dataclass per row and a full sort
+    response = await session.get(url)
+    content = await response.json()
+    clusters = [
+        Cluster(
+            id=c["cluster_id"],
+            name=c["cluster_name"],
+            last_checked_at=c.get("last_checked_at"),
+        )
+        for c in content["data"]
+    ]
+    clusters.sort(
+        key=lambda c: [c.last_checked_at] if c.last_checked_at is not None else [],
+        reverse=True,
+    )
+    return clusters[:3]
+
+
+async def measure(name: str, rows: int, coroutine_factory):
+    # Timing and memory are measured in separate runs, tracemalloc slows down allocations
+    start = time.perf_counter()
+    await coroutine_factory()
+    duration = time.perf_counter() - start
+
+    tracemalloc.start()
+    await coroutine_factory()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:>14} {rows:>7} rows: {duration * 1000:8.1f} ms, peak {peak / 1_000_000:7.2f} MB"
+    )
+
+
+def serve(payload_rows: int, port: int):
+    # Runs in its own process, so the server buffers are not part of the measurements
+    payload = build_payload(payload_rows)
+
+    async def handler(request):
+        return web.Response(body=payload, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get(CLUSTERS_PATH, handler)
+    web.run_app(app, host="127.0.0.1", port=port, print=None)
+
+
+async def wait_for_server(session: aiohttp.ClientSession, base_url: str):
+    for _ in range(100):
+        try:
+            await session.head(base_url)
+            return
+        except aiohttp.ClientConnectionError:
+            await asyncio.sleep(0.1)
+
+
+async def main():
+    for rows in (10_000, 100_000):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+
+        server = multiprocessing.Process(target=serve, args=(rows, port))
+        server.start()
+        base_url = f"http://127.0.0.1:{port}"
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                await wait_for_server(session, base_url)
+                client = AdvisorClientHttp(
+                    AdvisorOpenshiftURL(base_url),
+                    FixedUserIdentityProvider(),
+                    PlatformRequest(session),
+                    # Not cached, every run reads the response
+                    OrgCache({}),
+                )
+                await measure(
+                    "load and sort",
+                    rows,
+                    lambda: load_and_sort(session, base_url + CLUSTERS_PATH),
+                )
+                await measure("stream top-k", rows, client.get_clusters)
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
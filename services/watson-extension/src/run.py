@@ -1,6 +1,6 @@
 import quart_injector
 import common.metrics.quart as quart_metrics
-from quart import Quart
+from quart import Quart, render_template
 import watson_extension.config as config
 from common.logging import build_logger
 
@@ -12,12 +12,18 @@ from quart_schema import (
     Info,
 )
 
+from common.deadline import register_deadline
+from common.flight_recorder import FlightRecorder, register_flight_recorder
+from common.heavy_hitters import HeavyHitterTracker, register_heavy_hitters
+from common.timing import register_server_timing
+from common.tracing import Tracer, make_span_exporter, register_tracing
 from common.types.errors import ValidationError
 from watson_extension.quart_schema import WatsonExtensionAPIProvider
 from watson_extension.startup import (
     wire_routes,
     injector_from_config,
     injector_defaults,
+    wire_lifecycle,
 )
 
 build_logger(config.logger_type)
@@ -27,9 +33,53 @@ config.log_config()
 wire_routes(app)
 quart_injector.QuartModule(app)
 quart_injector.wire(app, [injector_defaults, injector_from_config])
-quart_metrics.register_app(app, config.metrics_port)
+wire_lifecycle(app)
+quart_metrics.register_app(
+    app,
+    port=config.metrics_port,
+    app_name=config.name,
+    monitor_loop=config.loop_monitor_enabled,
+    monitor_memory=config.memory_monitor_enabled,
+)
 quart_metrics.register_http_metrics(
-    app, config.name, lambda r: r.path.startswith("/api")
+    app,
+    config.name,
+    lambda r: r.path.startswith("/api"),
+    concurrency_target=config.http_concurrency_target,
+)
+register_tracing(
+    app,
+    Tracer(
+        make_span_exporter(config.tracing_exporter, config.tracing_file),
+        sample_ratio=config.tracing_sample_ratio,
+    ),
+    lambda r: r.path.startswith("/api") or r.path.startswith("/prefetch"),
+    attributes=lambda r: {"session.id": r.headers.get("x-rh-session-id")},
+)
+register_server_timing(app, enabled=config.server_timing_enabled)
+register_flight_recorder(
+    app,
+    FlightRecorder(config.flight_recorder_slowest, config.flight_recorder_errors),
+    lambda r: r.path.startswith("/api"),
+)
+register_heavy_hitters(
+    app,
+    HeavyHitterTracker(
+        quart_metrics.get_registry(app), config.name, k=config.heavy_hitters_top_k
+    ),
+    lambda r: r.path.startswith("/api") or r.path.startswith("/prefetch"),
+)
+
+
+async def deadline_exceeded_response():
+    return {"response": await render_template("deadline_exceeded.txt.jinja")}, 504
+
+
+register_deadline(
+    app,
+    config.name,
+    default_timeout=config.request_timeout or None,
+    on_deadline_exceeded=deadline_exceeded_response,
 )
 
 
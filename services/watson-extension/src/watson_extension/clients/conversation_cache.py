@@ -0,0 +1,120 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import quart
+from aioprometheus import Counter, Registry
+
+from common.metrics import get_or_create_metric
+
+T = TypeVar("T")
+
+SESSION_HEADER = "x-rh-session-id"
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def current_session_id() -> Optional[str]:
+    if not quart.has_request_context():
+        return None
+    return quart.request.headers.get(SESSION_HEADER)
+
+
+class ConversationCache:
+    """
+    Keeps the upstream payloads fetched during a conversation (identified by the `x-rh-session-id` of the request),
+    so the following steps of a Watson flow reuse them instead of fetching them again, e.g. the favorites listed by
+    `/chrome/favorites/options` when `/chrome/favorites` is called next.
+
+    A session is forgotten `ttl` seconds after its last use (by default the lifetime of the session itself). Clients
+    call `invalidate` when they change a resource, requests without a session id and `None` results are not cached.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 1200.0,
+        max_sessions: int = 10_000,
+        metrics_registry: Optional[Registry] = None,
+        app_name: str = "",
+    ):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, Tuple[float, Dict[Tuple, Any]]] = OrderedDict()
+
+        self._requests_total: Optional[Counter] = None
+        if metrics_registry is not None:
+            self._requests_total = get_or_create_metric(
+                metrics_registry,
+                "conversation_cache_requests_total",
+                Counter,
+                "Reads through the conversation cache by resource and result: hit or miss",
+                const_labels={"app": app_name},
+            )
+
+    async def get_or_load(
+        self, resource: str, key: Hashable, loader: Callable[[], Awaitable[T]]
+    ) -> T:
+        entries = self._entries(current_session_id())
+        if entries is None:
+            return await loader()
+
+        value = entries.get((resource, key), _MISSING)
+        if value is not _MISSING:
+            self._record(resource, "hit")
+            return value
+
+        self._record(resource, "miss")
+        value = await loader()
+        if value is not None:
+            entries[(resource, key)] = value
+        return value
+
+    def put(self, resource: str, key: Hashable, value: Any):
+        """Stores a payload fetched as part of another call (e.g. the items of a listing)."""
+        entries = self._entries(current_session_id())
+        if entries is not None:
+            entries[(resource, key)] = value
+
+    def invalidate(self, resource: str, key: Optional[Hashable] = None):
+        """Drops the resource (all of its keys unless `key` is given) from the conversation of the request."""
+        session_id = current_session_id()
+        if session_id is None or session_id not in self._sessions:
+            return
+
+        _, entries = self._sessions[session_id]
+        for entry_key in list(entries):
+            entry_resource, resource_key = entry_key
+            if entry_resource == resource and (key is None or resource_key == key):
+                del entries[entry_key]
+
+    def _entries(self, session_id: Optional[str]) -> Optional[Dict[Tuple, Any]]:
+        if not session_id or self.ttl <= 0:
+            return None
+
+        now = time.monotonic()
+        session = self._sessions.get(session_id)
+        if session is None or session[0] <= now:
+            entries = {}
+        else:
+            entries = session[1]
+
+        self._sessions[session_id] = (now + self.ttl, entries)
+        self._sessions.move_to_end(session_id)
+        # Sessions are ordered by last use, the expired ones are at the front
+        while self._sessions and (
+            len(self._sessions) > self.max_sessions
+            or next(iter(self._sessions.values()))[0] <= now
+        ):
+            self._sessions.popitem(last=False)
+        return entries
+
+    def _record(self, resource: str, result: str):
+        if self._requests_total is None:
+            return
+        try:
+            self._requests_total.inc({"resource": resource, "result": result})
+        except Exception as e:
+            logger.error("Failed to send conversation cache metrics", e)
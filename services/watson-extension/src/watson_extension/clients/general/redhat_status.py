@@ -1,33 +1,214 @@
 import abc
+import asyncio
+import json
 import logging
+import time
+from dataclasses import dataclass
 from typing import Optional, Dict
 import injector
 import aiohttp
+from aioprometheus import Counter, Gauge, Registry
+from redis.asyncio import Redis
 
+from common.metrics import get_or_create_metric
+
+UNRESOLVED_INCIDENTS_URL = "https://status.redhat.com/api/v2/incidents/unresolved.json"
+MIRROR_KEY = "redhat-status:incidents"
+MIRROR_LOCK_KEY = "redhat-status:poll-lock"
 
 logger = logging.getLogger(__name__)
 
 
-class RedhatStatusClient(abc.ABC):
-    @abc.abstractmethod
-    async def check_services_offline(self) -> Optional[Dict]: ...
+@dataclass(frozen=True, slots=True)
+class IncidentsSnapshot:
+    content: Dict
+    fetched_at: float
 
 
-class RedhatStatusClientHttp(RedhatStatusClient):
-    def __init__(self, session: injector.Inject[aiohttp.ClientSession]):
-        super().__init__()
+class RedhatStatusPoller:
+    """
+    Keeps the latest unresolved incidents of status.redhat.com in memory, polled every `poll_interval` seconds once
+    `start` is called. On errors the previous snapshot is kept, so a status page outage only makes the data older.
+
+    With a `redis` mirror only one replica polls per interval (whoever takes the lock), the others copy its snapshot.
+
+    Once started, polling only happens in the background: `start` does not wait for the first poll, and until it
+    lands requests get `None` and fall back to the error answer. When not started, requests without a snapshot poll
+    inline at most once per interval: while status.redhat.com is down they get `None` instead of queueing behind each
+    other's timeouts.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        poll_interval: float = 60.0,
+        request_timeout: float = 10.0,
+        redis: Optional[Redis] = None,
+        metrics_registry: Optional[Registry] = None,
+        app_name: str = "",
+    ):
         self.session = session
+        self.poll_interval = poll_interval
+        self.request_timeout = request_timeout
+        self.redis = redis
+        self._snapshot: Optional[IncidentsSnapshot] = None
+        self._last_attempt: Optional[float] = None
+        self._poll_lock = asyncio.Lock()
+        self._poll_task: Optional[asyncio.Task] = None
 
-    async def check_services_offline(self) -> Optional[Dict]:
-        result = None
+        self._metrics: Optional[tuple[Counter, Gauge]] = None
+        if metrics_registry is not None:
+            const_labels = {"app": app_name}
+            self._metrics = (
+                get_or_create_metric(
+                    metrics_registry,
+                    "redhat_status_polls_total",
+                    Counter,
+                    "Polls of status.redhat.com by source (upstream or mirror) and result",
+                    const_labels=const_labels,
+                ),
+                get_or_create_metric(
+                    metrics_registry,
+                    "redhat_status_snapshot_timestamp_seconds",
+                    Gauge,
+                    "Unix time at which the served incidents were fetched from status.redhat.com",
+                    const_labels=const_labels,
+                ),
+            )
+
+    @property
+    def snapshot(self) -> Optional[IncidentsSnapshot]:
+        return self._snapshot
+
+    async def get(self) -> Optional[IncidentsSnapshot]:
+        """
+        Returns the latest snapshot. Polls here only if the poller was not started, there is no snapshot yet and no
+        poll was tried recently.
+        """
+        if self._snapshot is None and self._poll_task is None and self._may_poll():
+            async with self._poll_lock:
+                # Waiters behind a failed poll return None rather than trying again
+                if self._snapshot is None and self._may_poll():
+                    await self.poll()
+        return self._snapshot
+
+    def _may_poll(self) -> bool:
+        return (
+            self._last_attempt is None
+            or time.monotonic() - self._last_attempt >= self.poll_interval
+        )
+
+    async def poll(self):
+        self._last_attempt = time.monotonic()
+        if self.redis is not None:
+            try:
+                if not await self._take_poll_turn():
+                    # Another replica polls, unless it has not written anything we can use yet
+                    if await self._copy_mirror() or self._snapshot is not None:
+                        return
+            except Exception as e:
+                logger.error(
+                    f"Failed to read mirrored status.redhat.com incidents, polling it directly: {e}"
+                )
+
+        await self._poll_upstream()
+
+    async def _poll_upstream(self):
         try:
             async with self.session.get(
-                "https://status.redhat.com/api/v2/incidents/unresolved.json", ssl=False
+                UNRESOLVED_INCIDENTS_URL,
+                ssl=False,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
             ) as status_response:
-                result = await status_response.json()
+                status_response.raise_for_status()
+                content = await status_response.json()
         except Exception as e:
             logger.error(
                 f"An Exception occured while handling response from status.redhat.com: {e}"
             )
-            raise e
-        return result
+            self._record_poll("upstream", "error")
+            return
+
+        snapshot = IncidentsSnapshot(content=content, fetched_at=time.time())
+        self._set_snapshot(snapshot)
+        self._record_poll("upstream", "success")
+
+        if self.redis is not None:
+            try:
+                await self.redis.set(
+                    MIRROR_KEY,
+                    json.dumps(
+                        {"content": snapshot.content, "fetched_at": snapshot.fetched_at}
+                    ),
+                )
+            except Exception as e:
+                logger.error(f"Failed to mirror status.redhat.com incidents: {e}")
+
+    async def start(self):
+        # The first poll runs in the background too, serving does not wait for status.redhat.com
+        self._poll_task = asyncio.create_task(self._poll_periodically())
+
+    async def stop(self):
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+
+    async def _poll_periodically(self):
+        while True:
+            await self.poll()
+            await asyncio.sleep(self.poll_interval)
+
+    async def _take_poll_turn(self) -> bool:
+        # Expires slightly before the next poll, so the replica polling can change between intervals
+        lock_ttl = max(1, int(self.poll_interval * 0.9))
+        return bool(await self.redis.set(MIRROR_LOCK_KEY, "1", nx=True, ex=lock_ttl))
+
+    async def _copy_mirror(self) -> bool:
+        value = await self.redis.get(MIRROR_KEY)
+        if value is None:
+            self._record_poll("mirror", "missing")
+            return False
+
+        mirrored = json.loads(value)
+        if self._snapshot is None or mirrored["fetched_at"] > self._snapshot.fetched_at:
+            self._set_snapshot(
+                IncidentsSnapshot(
+                    content=mirrored["content"], fetched_at=mirrored["fetched_at"]
+                )
+            )
+        self._record_poll("mirror", "success")
+        return True
+
+    def _set_snapshot(self, snapshot: IncidentsSnapshot):
+        self._snapshot = snapshot
+        if self._metrics is not None:
+            try:
+                self._metrics[1].set({}, snapshot.fetched_at)
+            except Exception as e:
+                logger.error("Failed to send redhat status metrics", e)
+
+    def _record_poll(self, source: str, result: str):
+        if self._metrics is not None:
+            try:
+                self._metrics[0].inc({"source": source, "result": result})
+            except Exception as e:
+                logger.error("Failed to send redhat status metrics", e)
+
+
+class RedhatStatusClient(abc.ABC):
+    @abc.abstractmethod
+    async def check_services_offline(self) -> Optional[Dict]: ...
+
+
+class RedhatStatusClientHttp(RedhatStatusClient):
+    def __init__(self, poller: injector.Inject[RedhatStatusPoller]):
+        super().__init__()
+        self.poller = poller
+
+    async def check_services_offline(self) -> Optional[Dict]:
+        snapshot = await self.poller.get()
+        return snapshot.content if snapshot is not None else None
@@ -7,7 +7,10 @@ import injector
 
 from watson_extension.clients import AdvisorURL
 from watson_extension.clients.identity import AbstractUserIdentityProvider
+from watson_extension.clients.org_cache import OrgCache
 from watson_extension.clients.platform_request import AbstractPlatformRequest
+from watson_extension.clients.prefetch_cache import PrefetchCache
+from watson_extension.clients.reference_data import ReferenceDataRegistry
 
 
 @dataclass
@@ -54,13 +57,31 @@ class AdvisorClientHttp(AdvisorClient):
         advisor_url: injector.Inject[AdvisorURL],
         user_identity_provider: injector.Inject[AbstractUserIdentityProvider],
         platform_request: injector.Inject[AbstractPlatformRequest],
+        reference_data: injector.Inject[ReferenceDataRegistry],
+        org_cache: injector.Inject[OrgCache],
+        prefetch_cache: injector.Inject[PrefetchCache],
     ):
         super().__init__()
         self.advisor_url = advisor_url
         self.user_identity_provider = user_identity_provider
         self.platform_request = platform_request
+        self.reference_data = reference_data
+        self.org_cache = org_cache
+        self.prefetch_cache = prefetch_cache
 
     async def find_rule_category_by_name(self, category_name: str) -> RuleCategory:
+        categories = await self.reference_data.get(
+            "advisor_rule_categories",
+            self._get_rule_categories,
+            lambda category: category.name,
+        )
+        category = categories.get(category_name)
+        if category is None:
+            raise ValueError(f"{category_name} was not found in advisor rules.")
+
+        return category
+
+    async def _get_rule_categories(self) -> List[RuleCategory]:
         response = await self.platform_request.get(
             self.advisor_url,
             "/api/insights/v1/rulecategory/",
@@ -69,12 +90,10 @@ class AdvisorClientHttp(AdvisorClient):
         response.raise_for_status()
 
         content = await response.json()
-
-        for category in content:
-            if category["name"].lower() == category_name.lower():
-                return RuleCategory(id=category["id"], name=category["name"])
-
-        raise ValueError(f"{category_name} was not found in advisor rules.")
+        return [
+            RuleCategory(id=category["id"], name=category["name"])
+            for category in content
+        ]
 
     async def find_rules(
         self,
@@ -82,6 +101,25 @@ class AdvisorClientHttp(AdvisorClient):
         total_risk: Optional[int] = None,
         sort: Optional[FindRuleSort] = None,
         only_workloads: Optional[bool] = None,
+    ) -> FindRulesResponse:
+        user_identity = await self.user_identity_provider.get_user_identity()
+        return await self.org_cache.get_or_load(
+            "advisor",
+            user_identity,
+            ("find_rules", category_id, total_risk, sort, only_workloads),
+            lambda: self._find_rules(
+                user_identity, category_id, total_risk, sort, only_workloads
+            ),
+            per_user=True,
+        )
+
+    async def _find_rules(
+        self,
+        user_identity: str,
+        category_id: Optional[str] = None,
+        total_risk: Optional[int] = None,
+        sort: Optional[FindRuleSort] = None,
+        only_workloads: Optional[bool] = None,
     ) -> FindRulesResponse:
         query = "impacting=true&rule_status=enabled"
         if category_id is not None:
@@ -98,15 +136,9 @@ class AdvisorClientHttp(AdvisorClient):
                 f"&filter[system_profile][sap_system]={str(only_workloads).lower()}"
             )
 
-        request = f"/api/insights/v1/rule?{query}&limit=3"
-        response = await self.platform_request.get(
-            self.advisor_url,
-            request,
-            user_identity=await self.user_identity_provider.get_user_identity(),
+        content = await self.prefetch_cache.fetch_json(
+            f"advisor_rules:{query}", lambda: self._get_rules(user_identity, query)
         )
-        response.raise_for_status()
-
-        content = await response.json()
 
         rules = [
             Rule(
@@ -123,3 +155,14 @@ class AdvisorClientHttp(AdvisorClient):
             rules=rules,
             link=dashboard_link,
         )
+
+    async def _get_rules(self, user_identity: str, query: str) -> dict:
+        request = f"/api/insights/v1/rule?{query}&limit=3"
+        response = await self.platform_request.get(
+            self.advisor_url,
+            request,
+            user_identity=user_identity,
+        )
+        response.raise_for_status()
+
+        return await response.json()
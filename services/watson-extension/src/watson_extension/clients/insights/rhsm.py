@@ -6,7 +6,9 @@ import injector
 
 from watson_extension.clients import RhsmURL
 from watson_extension.clients.identity import AbstractUserIdentityProvider
+from watson_extension.clients.org_cache import OrgCache
 from watson_extension.clients.platform_request import AbstractPlatformRequest
+from watson_extension.clients.prefetch_cache import PrefetchCache
 
 
 @dataclass
@@ -24,7 +26,8 @@ class ActivationKeyResponse:
 class RhsmClient(abc.ABC):
     @abc.abstractmethod
     async def check_subscriptions(
-        self, category: Optional[str]
+        self,
+        category: Optional[str],
     ) -> List[SubscriptionInfo]: ...
 
     async def create_activation_key(self, name: str): ...
@@ -36,25 +39,37 @@ class RhsmClientHttp(RhsmClient):
         rhsm_url: injector.Inject[RhsmURL],
         user_identity_provider: injector.Inject[AbstractUserIdentityProvider],
         platform_request: injector.Inject[AbstractPlatformRequest],
+        org_cache: injector.Inject[OrgCache],
+        prefetch_cache: injector.Inject[PrefetchCache],
     ):
         super().__init__()
         self.rhsm_url = rhsm_url
         self.user_identity_provider = user_identity_provider
         self.platform_request = platform_request
+        self.org_cache = org_cache
+        self.prefetch_cache = prefetch_cache
 
     async def check_subscriptions(
         self,
         category: Optional[str],
     ) -> List[SubscriptionInfo]:
-        request = "/api/rhsm/v2/products/status"
-        response = await self.platform_request.get(
-            self.rhsm_url,
-            request,
-            user_identity=await self.user_identity_provider.get_user_identity(),
+        user_identity = await self.user_identity_provider.get_user_identity()
+        return await self.org_cache.get_or_load(
+            "rhsm",
+            user_identity,
+            ("check_subscriptions", category),
+            lambda: self._check_subscriptions(user_identity, category),
+            per_user=True,
         )
-        response.raise_for_status()
 
-        content = await response.json()
+    async def _check_subscriptions(
+        self,
+        user_identity: str,
+        category: Optional[str],
+    ) -> List[SubscriptionInfo]:
+        content = await self.prefetch_cache.fetch_json(
+            "rhsm_products_status", lambda: self._get_products_status(user_identity)
+        )
         content_body = content.get("body")
 
         subscriptions_info = []
@@ -91,14 +106,28 @@ class RhsmClientHttp(RhsmClient):
 
         return subscriptions_info
 
+    async def _get_products_status(self, user_identity: str) -> dict:
+        request = "/api/rhsm/v2/products/status"
+        response = await self.platform_request.get(
+            self.rhsm_url,
+            request,
+            user_identity=user_identity,
+        )
+        response.raise_for_status()
+
+        return await response.json()
+
     async def create_activation_key(self, name: str):
+        user_identity = await self.user_identity_provider.get_user_identity()
         body = {"name": name, "role": "", "serviceLevel": "", "usage": ""}
         response = await self.platform_request.post(
             self.rhsm_url,
             "/api/rhsm/v2/activation_keys",
-            user_identity=await self.user_identity_provider.get_user_identity(),
+            user_identity=user_identity,
             json=body,
         )
+        # Writes drop the cached reads of the org
+        self.org_cache.invalidate(user_identity, "rhsm")
 
         response_json = await response.json()
 
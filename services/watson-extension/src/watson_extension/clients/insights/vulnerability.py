@@ -6,6 +6,7 @@ import injector
 
 from watson_extension.clients import VulnerabilityURL
 from watson_extension.clients.identity import AbstractUserIdentityProvider
+from watson_extension.clients.org_cache import OrgCache
 from watson_extension.clients.platform_request import AbstractPlatformRequest
 
 
@@ -28,15 +29,31 @@ class VulnerabilityClientHttp(VulnerabilityClient):
         vulnerability_url: injector.Inject[VulnerabilityURL],
         user_identity_provider: injector.Inject[AbstractUserIdentityProvider],
         platform_request: injector.Inject[AbstractPlatformRequest],
+        org_cache: injector.Inject[OrgCache],
     ):
         super().__init__()
         self.vulnerability_url = vulnerability_url
         self.user_identity_provider = user_identity_provider
         self.platform_request = platform_request
+        self.org_cache = org_cache
 
     async def find_cves(
         self,
         vulnerability_limit: int = 5,
+    ) -> List[CVEInfo]:
+        user_identity = await self.user_identity_provider.get_user_identity()
+        return await self.org_cache.get_or_load(
+            "vulnerability",
+            user_identity,
+            ("find_cves", vulnerability_limit),
+            lambda: self._find_cves(user_identity, vulnerability_limit),
+            per_user=True,
+        )
+
+    async def _find_cves(
+        self,
+        user_identity: str,
+        vulnerability_limit: int = 5,
     ) -> List[CVEInfo]:
         query = f"limit={vulnerability_limit}&sort=-cvss_score&affecting=true&advisory_available=true"
 
@@ -44,7 +61,7 @@ class VulnerabilityClientHttp(VulnerabilityClient):
         response = await self.platform_request.get(
             self.vulnerability_url,
             request,
-            user_identity=await self.user_identity_provider.get_user_identity(),
+            user_identity=user_identity,
         )
         response.raise_for_status()
 
@@ -0,0 +1,80 @@
+import heapq
+import itertools
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional
+
+import ijson
+from aiohttp import ClientResponse
+
+_CONTAINER_START = ("start_map", "start_array")
+_CONTAINER_END = ("end_map", "end_array")
+
+
+async def stream_json_items(
+    response: ClientResponse,
+    prefix: str,
+    top_level: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Any]:
+    """
+    Yields the items of the array at `prefix` (e.g. `data` for `{"data": [...]}`) as they are read from the response,
+    without holding the whole body in memory.
+
+    Top level scalar values (e.g. `status`) are collected into `top_level` if given, this requires looking at every
+    parsing event in python and is noticeably slower than only reading the items.
+    """
+    item_prefix = f"{prefix}.item"
+    if top_level is None:
+        async for item in ijson.items_async(
+            response.content, item_prefix, use_float=True
+        ):
+            yield item
+        return
+
+    builder: Optional[ijson.ObjectBuilder] = None
+
+    async for current_prefix, event, value in ijson.parse_async(
+        response.content, use_float=True
+    ):
+        if builder is not None:
+            builder.event(event, value)
+            if current_prefix == item_prefix and event in _CONTAINER_END:
+                yield builder.value
+                builder = None
+        elif current_prefix == item_prefix:
+            if event in _CONTAINER_START:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value
+        elif (
+            "." not in current_prefix
+            and current_prefix != ""
+            and event not in _CONTAINER_START
+            and event not in _CONTAINER_END
+            and event != "map_key"
+        ):
+            top_level[current_prefix] = value
+
+
+async def top_k(
+    items: AsyncIterable[Any],
+    k: int,
+    key: Callable[[Any], Any],
+) -> List[Any]:
+    """
+    Returns the `k` items with the largest `key`, keeping O(k) items in memory.
+    Equivalent to `sorted(items, key=key, reverse=True)[:k]`, ties keep the original order.
+    """
+    if k <= 0:
+        return []
+
+    # Min heap of the current top k, the decreasing order makes earlier items win ties.
+    heap = []
+    order = itertools.count(0, -1)
+    async for item in items:
+        entry = (key(item), next(order), item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    return [item for _, _, item in sorted(heap, key=lambda e: e[:2], reverse=True)]
@@ -6,6 +6,8 @@ from typing import List, Optional
 from common.identity import AbstractUserIdentityProvider
 from common.platform_request import AbstractPlatformRequest
 from watson_extension.clients import AdvisorOpenshiftURL
+from watson_extension.clients.json_stream import stream_json_items, top_k
+from watson_extension.clients.org_cache import OrgCache
 
 
 @dataclass
@@ -47,89 +49,120 @@ class AdvisorClientHttp(AdvisorClient):
         advisor_url: injector.Inject[AdvisorOpenshiftURL],
         user_identity_provider: injector.Inject[AbstractUserIdentityProvider],
         platform_request: injector.Inject[AbstractPlatformRequest],
+        org_cache: injector.Inject[OrgCache],
     ):
         super().__init__()
         self.advisor_url = advisor_url
         self.user_identity_provider = user_identity_provider
         self.platform_request = platform_request
+        self.org_cache = org_cache
 
     async def get_clusters(self) -> List[Cluster]:
+        user_identity = await self.user_identity_provider.get_user_identity()
+        return await self.org_cache.get_or_load(
+            "openshift_advisor",
+            user_identity,
+            "get_clusters",
+            lambda: self._get_clusters(user_identity),
+            per_user=True,
+        )
+
+    async def _get_clusters(self, user_identity: str) -> List[Cluster]:
         response = await self.platform_request.get(
             self.advisor_url,
             "/api/insights-results-aggregator/v2/clusters",
-            user_identity=await self.user_identity_provider.get_user_identity(),
+            user_identity=user_identity,
         )
         response.raise_for_status()
 
-        content = await response.json()
+        clusters = await top_k(
+            stream_json_items(response, "data"),
+            3,
+            key=lambda c: [c["last_checked_at"]]
+            if c.get("last_checked_at") is not None
+            else [],
+        )
 
-        clusters = [
+        return [
             Cluster(
                 id=c["cluster_id"],
                 name=c["cluster_name"],
-                last_checked_at=c["last_checked_at"]
-                if "last_checked_at" in c
-                else None,
+                last_checked_at=c.get("last_checked_at"),
             )
-            for c in content["data"]
+            for c in clusters
         ]
 
-        clusters.sort(
-            key=lambda c: [c.last_checked_at] if c.last_checked_at is not None else [],
-            reverse=True,
+    async def get_workloads(self) -> List[Workload]:
+        user_identity = await self.user_identity_provider.get_user_identity()
+        return await self.org_cache.get_or_load(
+            "openshift_advisor",
+            user_identity,
+            "get_workloads",
+            lambda: self._get_workloads(user_identity),
+            per_user=True,
         )
 
-        return clusters[:3]
-
-    async def get_workloads(self) -> List[Workload]:
+    async def _get_workloads(self, user_identity: str) -> List[Workload]:
         response = await self.platform_request.get(
             self.advisor_url,
             "/api/insights-results-aggregator/v2/namespaces/dvo",
-            user_identity=await self.user_identity_provider.get_user_identity(),
+            user_identity=user_identity,
         )
         response.raise_for_status()
 
-        content = await response.json()
-        if content["status"] != "ok":
+        top_level = {}
+        workloads = await top_k(
+            stream_json_items(response, "workloads", top_level),
+            3,
+            key=lambda w: [w["metadata"]["last_checked_at"]]
+            if w.get("metadata", {}).get("last_checked_at") is not None
+            else [],
+        )
+
+        if top_level.get("status") != "ok":
             raise RuntimeError(
-                f"Received invalid status from openshift_advisor/workloads: {content['status']}"
+                f"Received invalid status from openshift_advisor/workloads: {top_level.get('status')}"
             )
 
-        workloads = [
+        return [
             Workload(
                 cluster_id=w["cluster"]["uuid"],
                 cluster_display_name=w["cluster"]["display_name"],
                 namespace_id=w["namespace"]["uuid"],
                 last_checked_at=w.get("metadata", {}).get("last_checked_at", None),
             )
-            for w in content["workloads"]
+            for w in workloads
         ]
 
-        workloads.sort(
-            key=lambda w: [w.last_checked_at] if w.last_checked_at is not None else [],
-            reverse=True,
+    async def get_recommendations(self) -> List[Recommendation]:
+        user_identity = await self.user_identity_provider.get_user_identity()
+        return await self.org_cache.get_or_load(
+            "openshift_advisor",
+            user_identity,
+            "get_recommendations",
+            lambda: self._get_recommendations(user_identity),
+            per_user=True,
         )
 
-        return workloads[:3]
-
-    async def get_recommendations(self) -> List[Recommendation]:
+    async def _get_recommendations(self, user_identity: str) -> List[Recommendation]:
         response = await self.platform_request.get(
             self.advisor_url,
             "/api/insights-results-aggregator/v2/rule?impacting=true",
-            user_identity=await self.user_identity_provider.get_user_identity(),
+            user_identity=user_identity,
         )
         response.raise_for_status()
 
-        content = await response.json()
+        rules = await top_k(
+            stream_json_items(response, "recommendations"),
+            3,
+            key=lambda r: r["total_risk"],
+        )
 
-        rules = [
+        return [
             Recommendation(
                 id=r["rule_id"],
                 description=r["description"],
                 total_risk=r["total_risk"],
             )
-            for r in content["recommendations"]
+            for r in rules
         ]
-        rules.sort(key=lambda r: r.total_risk, reverse=True)
-
-        return rules[:3]
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from aioprometheus import Counter, Registry
+
+from common.auth import assistant_user_id, decoded_identity_header
+from common.metrics import get_or_create_metric
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class OrgCache:
+    """
+    Short lived cache for per org reads of the platform (e.g. advisor recommendations), repeated requests of the same
+    org (or user, for data filtered by the user's permissions) within `ttls[client]` seconds are answered without
+    calling the platform. Concurrent misses of the same key share a single call.
+
+    Entries are keyed by the client name, the org (and user) of the identity and the arguments of the read. A client
+    without ttl, or with a ttl of 0, is not cached.
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float],
+        metrics_registry: Optional[Registry] = None,
+        app_name: str = "",
+        max_entries: int = 10_000,
+    ):
+        self.ttls = ttls
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Tuple, Tuple[float, Any]] = OrderedDict()
+        self._loading: Dict[Tuple, asyncio.Task] = {}
+
+        self._requests_total: Optional[Counter] = None
+        if metrics_registry is not None:
+            self._requests_total = get_or_create_metric(
+                metrics_registry,
+                "org_cache_requests_total",
+                Counter,
+                "Reads through the org cache by client and result: hit, miss or coalesced (waited for a running miss)",
+                const_labels={"app": app_name},
+            )
+
+    async def get_or_load(
+        self,
+        client: str,
+        user_identity: str,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        per_user: bool = False,
+    ) -> T:
+        ttl = self.ttls.get(client, 0)
+        scope = self._scope(user_identity, per_user) if ttl > 0 else None
+        if scope is None:
+            return await loader()
+
+        cache_key = (client, scope, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(cache_key)
+                self._record(client, "hit")
+                return value
+            del self._entries[cache_key]
+
+        task = self._loading.get(cache_key)
+        if task is not None:
+            self._record(client, "coalesced")
+        else:
+            self._record(client, "miss")
+            task = asyncio.create_task(self._load(cache_key, ttl, loader))
+            self._loading[cache_key] = task
+            task.add_done_callback(lambda _: self._loading.pop(cache_key, None))
+
+        # Shielded, a cancelled request does not cancel the load others are waiting for
+        return await asyncio.shield(task)
+
+    def invalidate(
+        self,
+        user_identity: str,
+        client: Optional[str] = None,
+        per_user: bool = False,
+    ):
+        """Drops the entries of the org (or user) of the identity, only of `client` if given."""
+        scope = self._scope(user_identity, per_user)
+        if scope is None:
+            return
+
+        for cache_key in list(self._entries):
+            entry_client, entry_scope, _ = cache_key
+            if client is not None and entry_client != client:
+                continue
+            # Invalidating an org also drops the entries of its users
+            if entry_scope == scope or (
+                not per_user and entry_scope.startswith(f"{scope}/")
+            ):
+                del self._entries[cache_key]
+
+    async def _load(
+        self, cache_key: Tuple, ttl: float, loader: Callable[[], Awaitable[T]]
+    ) -> T:
+        value = await loader()
+        self._entries[cache_key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _scope(user_identity: str, per_user: bool) -> Optional[str]:
+        try:
+            if per_user:
+                return assistant_user_id(user_identity)
+            return decoded_identity_header(user_identity)["identity"]["org_id"]
+        except Exception:
+            # Nothing safe to share the result with
+            return None
+
+    def _record(self, client: str, result: str):
+        if self._requests_total is None:
+            return
+        try:
+            self._requests_total.inc({"client": client, "result": result})
+        except Exception as e:
+            logger.error("Failed to send org cache metrics", e)
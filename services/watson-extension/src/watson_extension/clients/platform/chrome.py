@@ -2,11 +2,13 @@ import abc
 import json
 import injector
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List
 
 from common.identity import AbstractUserIdentityProvider
 from common.platform_request import AbstractPlatformRequest
 from watson_extension.clients import ChromeServiceURL
+from watson_extension.clients.conversation_cache import ConversationCache
+from watson_extension.clients.prefetch_cache import PrefetchCache
 
 
 @dataclass
@@ -28,34 +30,10 @@ class User:
     visited_bundles: dict
 
 
-@dataclass
-class Link:
-    id: Optional[str]
-    title: str
-    alt_title: Optional[List[str]]
-    links: Optional[List["Link"]]
-    app_id: Optional[str] = None
-    is_group: bool = False
-    is_external: bool = False
-    href: Optional[str] = None
-
-
-@dataclass
-class Service:
-    description: str
-    id: str
-    links: Optional[List[dict]]
-    title: str
-    href: Optional[str]
-
-
 class ChromeServiceClient(abc.ABC):
     @abc.abstractmethod
     async def get_user(self) -> User: ...
 
-    @abc.abstractmethod
-    async def get_generated_services(self) -> List[Service]: ...
-
     @abc.abstractmethod
     async def modify_favorite_service(self, service, favorite=True) -> str: ...
 
@@ -66,22 +44,24 @@ class ChromeServiceClientHttp(ChromeServiceClient):
         chrome_url: injector.Inject[ChromeServiceURL],
         user_identity_provider: injector.Inject[AbstractUserIdentityProvider],
         platform_request: injector.Inject[AbstractPlatformRequest],
+        conversation_cache: injector.Inject[ConversationCache],
+        prefetch_cache: injector.Inject[PrefetchCache],
     ):
         super().__init__()
         self.chrome_url = chrome_url
         self.user_identity_provider = user_identity_provider
         self.platform_request = platform_request
+        self.conversation_cache = conversation_cache
+        self.prefetch_cache = prefetch_cache
 
     async def get_user(self):
-        # struggles to be a json response, manually doing it here
-        response = await self.platform_request.get(
-            self.chrome_url,
-            "/api/chrome-service/v1/user",
-            user_identity=await self.user_identity_provider.get_user_identity(),
+        # Favorites flows read the user in every step
+        return await self.conversation_cache.get_or_load(
+            "chrome_user", None, self._get_user
         )
-        response.raise_for_status()
 
-        data = json.loads(await response.text())["data"]
+    async def _get_user(self):
+        data = await self.prefetch_cache.fetch_json("chrome_user", self._get_user_data)
         return User(
             account_id=data["accountId"],
             first_login=data["firstLogin"],
@@ -100,25 +80,16 @@ class ChromeServiceClientHttp(ChromeServiceClient):
             visited_bundles=data.get("visitedBundles", {}),
         )
 
-    async def get_generated_services(self) -> List[Service]:
+    async def _get_user_data(self) -> dict:
+        # struggles to be a json response, manually doing it here
         response = await self.platform_request.get(
             self.chrome_url,
-            "/api/chrome-service/v1/static/stable/prod/services/services-generated.json",
+            "/api/chrome-service/v1/user",
             user_identity=await self.user_identity_provider.get_user_identity(),
         )
         response.raise_for_status()
 
-        data = await response.json()
-        return [
-            Service(
-                description=service.get("description", ""),
-                id=service.get("id", ""),
-                links=parse_links_into_obj(service.get("links", [])),
-                title=service.get("title", ""),
-                href=service.get("href", ""),
-            )
-            for service in data
-        ]
+        return json.loads(await response.text())["data"]
 
     async def modify_favorite_service(self, href, favorite=True):
         response = await self.platform_request.post(
@@ -131,22 +102,6 @@ class ChromeServiceClientHttp(ChromeServiceClient):
             },
         )
         response.raise_for_status()
+        self.conversation_cache.invalidate("chrome_user")
+        await self.prefetch_cache.invalidate("chrome_user")
         return await response.text()
-
-
-def parse_links_into_obj(links) -> List[Link]:
-    if not links:
-        return []
-    return [
-        Link(
-            id=link.get("id"),
-            title=link.get("title", ""),
-            alt_title=link.get("altTitle", []),
-            links=parse_links_into_obj(link.get("links", [])),
-            app_id=link.get("appId"),
-            is_group=link.get("isGroup", False),
-            is_external=link.get("isExternal", False),
-            href=link.get("href", ""),
-        )
-        for link in links
-    ]
@@ -0,0 +1,281 @@
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import injector
+
+from common.platform_request import AbstractPlatformRequest
+from watson_extension.clients import ChromeServiceURL
+
+GENERATED_SERVICES_PATH = (
+    "/api/chrome-service/v1/static/stable/prod/services/services-generated.json"
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogCategory:
+    title: str
+    href: str
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogService:
+    group: str
+    title: Optional[str]
+    href: Optional[str]
+    app_id: Optional[str]
+    alt_title: Tuple[str, ...]
+
+
+def normalize_service_name(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+def _trigrams(name: str) -> Set[str]:
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _allowed_edits(name: str) -> int:
+    # Short names are too close to each other to allow any typo
+    if len(name) < 3:
+        return 0
+    if len(name) <= 5:
+        return 1
+    return 2
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (a transposition counts as one edit), gives up with `limit + 1`."""
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class ServicesIndex:
+    """
+    Lookup of catalog services by any of their names: title, alt titles, app id or href.
+    Names are compared case and whitespace insensitive, when there is no exact match a name within a couple of typos
+    (see `_allowed_edits`) is accepted as long as it points to a single service.
+    """
+
+    __slots__ = ("_exact", "_by_href", "_names", "_name_services", "_postings")
+
+    def __init__(self, services: Iterable[CatalogService]):
+        self._exact: Dict[str, CatalogService] = {}
+        self._by_href: Dict[str, CatalogService] = {}
+        self._names: List[str] = []
+        self._name_services: List[CatalogService] = []
+        self._postings: Dict[str, List[int]] = {}
+
+        for service in services:
+            if not service.href:
+                continue
+            self._by_href.setdefault(service.href, service)
+
+            names = [service.title, *service.alt_title, service.app_id]
+            for name in [service.href, *names]:
+                if name:
+                    # First service wins on conflicts
+                    self._exact.setdefault(normalize_service_name(name), service)
+
+            for name in {normalize_service_name(n) for n in names if n}:
+                name_id = len(self._names)
+                self._names.append(name)
+                self._name_services.append(service)
+                for trigram in _trigrams(name):
+                    self._postings.setdefault(trigram, []).append(name_id)
+
+    def find(self, name: str) -> Optional[CatalogService]:
+        normalized = normalize_service_name(name)
+        service = self._exact.get(normalized)
+        if service is not None or not normalized:
+            return service
+        return self._find_near_miss(normalized)
+
+    def find_by_href(self, href: str) -> Optional[CatalogService]:
+        return self._by_href.get(href)
+
+    def _find_near_miss(self, name: str) -> Optional[CatalogService]:
+        allowed = _allowed_edits(name)
+        if allowed == 0:
+            return None
+
+        trigrams = _trigrams(name)
+        shared = Counter()
+        for trigram in trigrams:
+            shared.update(self._postings.get(trigram, ()))
+
+        # Each edit changes at most 4 trigrams (a transposition touches two characters), names with fewer in
+        # common can't be within the allowed edits
+        min_shared = max(1, len(trigrams) - 4 * allowed)
+        best: Optional[CatalogService] = None
+        best_distance = allowed + 1
+        ambiguous = False
+        for name_id, count in shared.items():
+            candidate = self._names[name_id]
+            if count < min_shared or abs(len(candidate) - len(name)) > allowed:
+                continue
+            distance = _edit_distance(name, candidate, allowed)
+            service = self._name_services[name_id]
+            if distance < best_distance:
+                best, best_distance, ambiguous = service, distance, False
+            elif distance == best_distance and service is not best:
+                ambiguous = True
+
+        return None if ambiguous else best
+
+
+@dataclass(frozen=True, slots=True)
+class ServicesCatalog:
+    """
+    Immutable snapshot of chrome's `services-generated.json`, the same for every user.
+    `categories` are the top level entries, `services` the (non-external) links found in their groups and `index`
+    looks them up by name.
+    """
+
+    categories: Tuple[CatalogCategory, ...]
+    services: Tuple[CatalogService, ...]
+    etag: Optional[str] = None
+    index: ServicesIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Built once per catalog version
+        object.__setattr__(self, "index", ServicesIndex(self.services))
+
+    @staticmethod
+    def from_generated_services(
+        content: List[dict], etag: Optional[str] = None
+    ) -> "ServicesCatalog":
+        categories = []
+        services = []
+        for category in content:
+            categories.append(
+                CatalogCategory(
+                    title=category.get("title", ""),
+                    href=category.get("href", ""),
+                )
+            )
+            for link in category.get("links") or []:
+                if not link.get("isGroup", False):
+                    continue
+                group_title = link.get("title", "")
+                for sublink in link.get("links") or []:
+                    if sublink.get("isExternal", False):
+                        # not really a service
+                        continue
+                    services.append(
+                        CatalogService(
+                            group=group_title,
+                            title=sublink.get("title") or None,
+                            href=sublink.get("href") or None,
+                            app_id=sublink.get("appId"),
+                            alt_title=tuple(sublink.get("altTitle") or ()),
+                        )
+                    )
+
+        return ServicesCatalog(
+            categories=tuple(categories),
+            services=tuple(services),
+            etag=etag,
+        )
+
+
+class ChromeServicesCatalog:
+    """
+    Process wide holder of the `ServicesCatalog`. It is loaded when the app starts serving (`start`) and revalidated
+    in the background every `refresh_interval` seconds using the ETag of the last response. Each change swaps in a
+    new snapshot, readers keep using the one they got.
+    """
+
+    def __init__(
+        self,
+        chrome_url: injector.Inject[ChromeServiceURL],
+        platform_request: injector.Inject[AbstractPlatformRequest],
+        refresh_interval: float = 300,
+    ):
+        self.chrome_url = chrome_url
+        self.platform_request = platform_request
+        self.refresh_interval = refresh_interval
+        self._catalog: Optional[ServicesCatalog] = None
+        self._load_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def current(self) -> Optional[ServicesCatalog]:
+        return self._catalog
+
+    async def get(self) -> ServicesCatalog:
+        """Returns the current catalog, it is only fetched here if it could not be loaded at startup."""
+        catalog = self._catalog
+        if catalog is not None:
+            return catalog
+
+        async with self._load_lock:
+            if self._catalog is None:
+                await self.refresh()
+            return self._catalog
+
+    async def refresh(self) -> bool:
+        """Fetches the catalog if it changed, returns whether a new catalog was loaded."""
+        current = self._catalog
+        headers = {}
+        if current is not None and current.etag is not None:
+            headers["If-None-Match"] = current.etag
+
+        response = await self.platform_request.get(
+            self.chrome_url,
+            GENERATED_SERVICES_PATH,
+            headers=headers,
+        )
+        if response.status == 304:
+            return False
+        response.raise_for_status()
+
+        content: Any = await response.json()
+        self._catalog = ServicesCatalog.from_generated_services(
+            content, response.headers.get("ETag")
+        )
+        return True
+
+    async def start(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(
+                f"Unable to load the chrome services catalog, it will be retried: {e}"
+            )
+        self._refresh_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_periodically(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Failed to refresh the chrome services catalog: {e}")
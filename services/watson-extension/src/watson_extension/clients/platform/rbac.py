@@ -1,4 +1,5 @@
 import abc
+import contextlib
 import injector
 import logging
 from dataclasses import dataclass
@@ -61,32 +62,38 @@ class RBACClientHttp(RBACClient):
 
     async def get_roles_for_tam(self) -> List[Roles]:
         """Get roles for TAM"""
-        response = await self.platform_request.get(
-            self.rbac_url,
-            "/api/rbac/v1/roles/?system=true&limit=9999&order_by=display_name&add_fields=groups_in_count",
-            user_identity=await self.user_identity_provider.get_user_identity(),
-        )
-        response.raise_for_status()
-        return [
-            Roles(
-                uuid=role["uuid"],
-                name=role["name"],
-                display_name=role["display_name"],
-                description=role["description"],
-                created=role["created"],
-                modified=role["modified"],
-                policyCount=role["policyCount"],
-                groups_in_count=role["groups_in_count"],
-                accessCount=role["accessCount"],
-                applications=role["applications"],
-                system=role["system"],
-                platform_default=role["platform_default"],
-                admin_default=role["admin_default"],
-                external_role_id=role.get("external_role_id"),
-                external_tenant=role.get("external_tenant"),
+        async with contextlib.aclosing(
+            self.platform_request.paginate(
+                self.rbac_url,
+                "/api/rbac/v1/roles/",
+                user_identity=await self.user_identity_provider.get_user_identity(),
+                params={
+                    "system": "true",
+                    "order_by": "display_name",
+                    "add_fields": "groups_in_count",
+                },
             )
-            for role in response.json()
-        ]
+        ) as roles:
+            return [
+                Roles(
+                    uuid=role["uuid"],
+                    name=role["name"],
+                    display_name=role["display_name"],
+                    description=role["description"],
+                    created=role["created"],
+                    modified=role["modified"],
+                    policyCount=role["policyCount"],
+                    groups_in_count=role["groups_in_count"],
+                    accessCount=role["accessCount"],
+                    applications=role["applications"],
+                    system=role["system"],
+                    platform_default=role["platform_default"],
+                    admin_default=role["admin_default"],
+                    external_role_id=role.get("external_role_id"),
+                    external_tenant=role.get("external_tenant"),
+                )
+                async for role in roles
+            ]
 
     async def send_rbac_tam_request(self, body: TAMRequestAccessPayload) -> bool:
         # POST https://console.stage.redhat.com/api/rbac/v1/cross-account-requests/
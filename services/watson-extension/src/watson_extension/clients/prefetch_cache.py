@@ -0,0 +1,117 @@
+import contextlib
+import json
+import logging
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from aioprometheus import Counter, Registry
+from redis.asyncio import Redis
+
+from common.metrics import get_or_create_metric
+from watson_extension.clients.conversation_cache import current_session_id
+
+logger = logging.getLogger(__name__)
+
+_warming: ContextVar[bool] = ContextVar("prefetch_warming", default=False)
+
+
+@contextlib.contextmanager
+def warming() -> Iterator[None]:
+    """Within this block, reads through the `PrefetchCache` go upstream and store what they get."""
+    token = _warming.set(True)
+    try:
+        yield
+    finally:
+        _warming.reset(token)
+
+
+class PrefetchCache:
+    """
+    Raw upstream payloads fetched for a session before the user asked for them (see the `/prefetch` route), shared by
+    all replicas through redis. Clients read from it first, so the first turns of a conversation skip the upstream
+    latency.
+
+    A payload is only served once (later reads are up to the conversation and org caches, which know about changes)
+    and lives `ttl` seconds. Without `redis` nothing is stored and every read goes upstream.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        ttl: int = 300,
+        metrics_registry: Optional[Registry] = None,
+        app_name: str = "",
+    ):
+        self.redis = redis
+        self.ttl = ttl
+
+        self._metrics: Optional[tuple[Counter, Counter]] = None
+        if metrics_registry is not None:
+            const_labels = {"app": app_name}
+            self._metrics = (
+                get_or_create_metric(
+                    metrics_registry,
+                    "prefetch_cache_writes_total",
+                    Counter,
+                    "Payloads prefetched for a session by resource and result",
+                    const_labels=const_labels,
+                ),
+                get_or_create_metric(
+                    metrics_registry,
+                    "prefetch_cache_reads_total",
+                    Counter,
+                    "Reads of prefetched payloads by resource and result: hit or miss",
+                    const_labels=const_labels,
+                ),
+            )
+
+    async def fetch_json(
+        self, resource: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        session_id = current_session_id()
+        if self.redis is None or session_id is None:
+            return await fetch()
+
+        key = f"prefetch:{session_id}:{resource}"
+        if _warming.get():
+            payload = await fetch()
+            await self._store(key, resource, payload)
+            return payload
+
+        try:
+            value = await self.redis.getdel(key)
+        except Exception as e:
+            logger.error(f"Failed to read prefetched {resource}: {e}")
+            value = None
+
+        self._record(1, resource, "miss" if value is None else "hit")
+        if value is None:
+            return await fetch()
+        return json.loads(value)
+
+    async def invalidate(self, resource: str):
+        """Drops a payload prefetched for the session of the request that was not read yet."""
+        session_id = current_session_id()
+        if self.redis is None or session_id is None:
+            return
+
+        try:
+            await self.redis.delete(f"prefetch:{session_id}:{resource}")
+        except Exception as e:
+            logger.error(f"Failed to invalidate prefetched {resource}: {e}")
+
+    async def _store(self, key: str, resource: str, payload: Any):
+        try:
+            await self.redis.set(key, json.dumps(payload), ex=self.ttl)
+            self._record(0, resource, "success")
+        except Exception as e:
+            logger.error(f"Failed to store prefetched {resource}: {e}")
+            self._record(0, resource, "error")
+
+    def _record(self, metric: int, resource: str, result: str):
+        if self._metrics is None:
+            return
+        try:
+            self._metrics[metric].inc({"resource": resource, "result": result})
+        except Exception as e:
+            logger.error("Failed to send prefetch cache metrics", e)
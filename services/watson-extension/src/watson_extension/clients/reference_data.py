@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from aioprometheus import Counter, Gauge, Registry
+
+from common.deadline import set_deadline
+from common.metrics import get_or_create_metric
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceDataset(Generic[T]):
+    """Immutable snapshot of a dataset, indexed by the (case insensitive) name of its items."""
+
+    __slots__ = ("items", "loaded_at", "_by_name")
+
+    def __init__(self, items: Iterable[T], name_of: Callable[[T], str]):
+        self.items: Tuple[T, ...] = tuple(items)
+        self.loaded_at = time.monotonic()
+        self._by_name: Dict[str, T] = {}
+        for item in self.items:
+            self._by_name.setdefault(name_of(item).casefold(), item)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, name: str) -> Optional[T]:
+        return self._by_name.get(name.casefold())
+
+
+class ReferenceDataRegistry:
+    """
+    Process wide store of reference data: datasets that are the same for every user (e.g. advisor rule categories),
+    loaded once and looked up by name without a network round trip.
+
+    A dataset is loaded by the first request that needs it, concurrent requests wait for the same load. Once older than
+    `refresh_interval` seconds, it keeps being served while it is reloaded in the background with the loader of the
+    request that noticed it, a failed reload is retried after `retry_interval` seconds.
+    Loaders need the identity of a request to talk to the platform, which is why the refresh is driven by use instead
+    of a timer.
+    """
+
+    def __init__(
+        self,
+        metrics_registry: Optional[Registry] = None,
+        app_name: str = "",
+        refresh_interval: float = 3600.0,
+        retry_interval: float = 60.0,
+    ):
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self._datasets: Dict[str, ReferenceDataset] = {}
+        self._refresh_at: Dict[str, float] = {}
+        self._loading: Dict[str, asyncio.Task] = {}
+
+        self._metrics: Optional[Tuple[Gauge, Gauge, Counter, Counter]] = None
+        if metrics_registry is not None:
+            const_labels = {"app": app_name}
+            self._metrics = (
+                get_or_create_metric(
+                    metrics_registry,
+                    "reference_data_last_refresh_timestamp_seconds",
+                    Gauge,
+                    "Unix time of the last successful load of a reference dataset",
+                    const_labels=const_labels,
+                ),
+                get_or_create_metric(
+                    metrics_registry,
+                    "reference_data_items",
+                    Gauge,
+                    "Number of items in a reference dataset",
+                    const_labels=const_labels,
+                ),
+                get_or_create_metric(
+                    metrics_registry,
+                    "reference_data_refresh_total",
+                    Counter,
+                    "Loads of a reference dataset by result",
+                    const_labels=const_labels,
+                ),
+                get_or_create_metric(
+                    metrics_registry,
+                    "reference_data_lookups_total",
+                    Counter,
+                    "Reads of a reference dataset by freshness: fresh, stale (served while refreshing) or loaded",
+                    const_labels=const_labels,
+                ),
+            )
+
+    async def get(
+        self,
+        dataset: str,
+        loader: Callable[[], Awaitable[Iterable[T]]],
+        name_of: Callable[[T], str],
+    ) -> ReferenceDataset[T]:
+        current = self._datasets.get(dataset)
+        if current is None:
+            self._record_lookup(dataset, "loaded")
+            # Shielded, a cancelled request does not cancel the load others are waiting for
+            return await asyncio.shield(self._start_load(dataset, loader, name_of))
+
+        if time.monotonic() >= self._refresh_at[dataset]:
+            self._record_lookup(dataset, "stale")
+            self._start_load(dataset, loader, name_of)
+        else:
+            self._record_lookup(dataset, "fresh")
+
+        return current
+
+    def invalidate(self, dataset: Optional[str] = None):
+        """Reloads the dataset (or all of them) the next time it is used."""
+        datasets = [dataset] if dataset is not None else list(self._refresh_at)
+        for name in datasets:
+            if name in self._refresh_at:
+                self._refresh_at[name] = 0
+
+    def _start_load(
+        self,
+        dataset: str,
+        loader: Callable[[], Awaitable[Iterable[T]]],
+        name_of: Callable[[T], str],
+    ) -> asyncio.Task:
+        task = self._loading.get(dataset)
+        if task is None:
+            task = asyncio.create_task(self._load(dataset, loader, name_of))
+            self._loading[dataset] = task
+            task.add_done_callback(lambda _: self._loading.pop(dataset, None))
+        return task
+
+    async def _load(
+        self,
+        dataset: str,
+        loader: Callable[[], Awaitable[Iterable[T]]],
+        name_of: Callable[[T], str],
+    ) -> ReferenceDataset[T]:
+        refreshing = dataset in self._datasets
+        if refreshing:
+            # Outlives the request that started it, its deadline does not apply
+            set_deadline(None)
+
+        try:
+            loaded = ReferenceDataset(await loader(), name_of)
+        except Exception as e:
+            self._record_refresh(dataset, "error")
+            if not refreshing:
+                raise
+            logger.warning(f"Failed to refresh reference data {dataset}: {e}")
+            self._refresh_at[dataset] = time.monotonic() + self.retry_interval
+            return self._datasets[dataset]
+
+        self._datasets[dataset] = loaded
+        self._refresh_at[dataset] = loaded.loaded_at + self.refresh_interval
+        self._record_refresh(dataset, "success", loaded)
+        return loaded
+
+    def _record_lookup(self, dataset: str, freshness: str):
+        if self._metrics is None:
+            return
+        try:
+            self._metrics[3].inc({"dataset": dataset, "freshness": freshness})
+        except Exception as e:
+            logger.error("Failed to send reference data metrics", e)
+
+    def _record_refresh(
+        self,
+        dataset: str,
+        result: str,
+        loaded: Optional[ReferenceDataset] = None,
+    ):
+        if self._metrics is None:
+            return
+        last_refresh, items, refresh_total, _ = self._metrics
+        try:
+            refresh_total.inc({"dataset": dataset, "result": result})
+            if loaded is not None:
+                last_refresh.set({"dataset": dataset}, time.time())
+                items.set({"dataset": dataset}, len(loaded))
+        except Exception as e:
+            logger.error("Failed to send reference data metrics", e)
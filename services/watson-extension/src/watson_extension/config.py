@@ -8,6 +8,36 @@ port = config("PORT", default=5050, cast=int)
 environment_name = config("ENVIRONMENT_NAME", default="stage", cast=str)
 
 metrics_port = config("METRICS_PORT", default=0, cast=int)
+# Reports how long each phase of a request took (e.g. session lookup, assistant, rendering) in the Server-Timing header.
+# Off by default, the header exposes internal phases and upstream durations to every caller.
+server_timing_enabled = config("SERVER_TIMING_ENABLED", default=False, cast=bool)
+# Exports event loop lag, event loop stalls (logging the blocking stack) and default executor usage as metrics
+loop_monitor_enabled = config("LOOP_MONITOR_ENABLED", default=True, cast=bool)
+# Exports the resident memory and the gc activity of the process as metrics, read every 15 seconds
+memory_monitor_enabled = config("MEMORY_MONITOR_ENABLED", default=True, cast=bool)
+# Requests a replica should handle at once, http_requests_saturation_ratio reports the requests in flight over it
+http_concurrency_target = config("HTTP_CONCURRENCY_TARGET", default=50, cast=int)
+# Requests kept by the flight recorder (served on /flight_recorder/requests): the slowest ones and the last failed ones
+flight_recorder_slowest = config("FLIGHT_RECORDER_SLOWEST", default=20, cast=int)
+flight_recorder_errors = config("FLIGHT_RECORDER_ERRORS", default=20, cast=int)
+# Most frequent routes, orgs and intents exported in heavy_hitter_requests and served on /heavy_hitters
+heavy_hitters_top_k = config("HEAVY_HITTERS_TOP_K", default=20, cast=int)
+# Allows sampling the stacks of the instance on /profiler/profile, for at most PROFILER_MAX_DURATION seconds
+profiler_enabled = config("PROFILER_ENABLED", default=False, cast=bool)
+profiler_max_duration = config("PROFILER_MAX_DURATION", default=60, cast=float)
+# Allows tracing allocations with tracemalloc and taking snapshots on /memory
+memory_tracer_enabled = config("MEMORY_TRACER_ENABLED", default=False, cast=bool)
+# Exports the spans of the sampled requests: none, memory (served on /tracing/spans) or file (one json span per line)
+tracing_exporter = config(
+    "TRACING_EXPORTER", default="none", cast=Choices(["none", "memory", "file"])
+)
+tracing_file = config("TRACING_FILE", default="spans.jsonl")
+# Share of the requests traced when the caller did not decide with a traceparent header
+tracing_sample_ratio = config("TRACING_SAMPLE_RATIO", default=0.1, cast=float)
+
+# Time budget (in seconds) for a request, calls to the platform are cancelled once it runs out.
+# Keep it below the time Watson waits for custom extensions, 0 disables it.
+request_timeout = config("REQUEST_TIMEOUT", default=25.0, cast=float)
 
 is_running_locally = config("IS_RUNNING_LOCALLY", default=False, cast=bool)
 if is_running_locally:
@@ -39,6 +69,49 @@ platform_notifications_url = config(
 )
 rbac_url = config("ENDPOINT__RBAC__SERVICE__URL", default=__platform_url)
 
+# How often (in seconds) the chrome services catalog is revalidated in the background
+chrome_services_catalog_refresh_interval = config(
+    "CHROME_SERVICES_CATALOG_REFRESH_INTERVAL", default=300.0, cast=float
+)
+# How long (in seconds) per org reads of each client are cached, 0 disables it
+org_cache_ttls = {
+    "advisor": config("ORG_CACHE_TTL_ADVISOR", default=60.0, cast=float),
+    "vulnerability": config("ORG_CACHE_TTL_VULNERABILITY", default=60.0, cast=float),
+    "rhsm": config("ORG_CACHE_TTL_RHSM", default=300.0, cast=float),
+    "openshift_advisor": config(
+        "ORG_CACHE_TTL_OPENSHIFT_ADVISOR", default=60.0, cast=float
+    ),
+}
+# How long (in seconds) after its last request a conversation keeps the payloads fetched by its previous steps,
+# 0 disables it. Defaults to the lifetime of the session.
+conversation_cache_ttl = config("CONVERSATION_CACHE_TTL", default=1200.0, cast=float)
+# Time budget (in seconds) of each backend a listing queries concurrently, a backend that runs out of it is left out
+# of the results instead of delaying the others.
+fan_out_timeouts = {
+    "integrations.notifications": config(
+        "INTEGRATIONS_NOTIFICATIONS_TIMEOUT", default=5.0, cast=float
+    ),
+    "integrations.sources": config(
+        "INTEGRATIONS_SOURCES_TIMEOUT", default=5.0, cast=float
+    ),
+    "account_digest.advisor": config(
+        "ACCOUNT_DIGEST_ADVISOR_TIMEOUT", default=5.0, cast=float
+    ),
+    "account_digest.vulnerability": config(
+        "ACCOUNT_DIGEST_VULNERABILITY_TIMEOUT", default=5.0, cast=float
+    ),
+    "account_digest.subscriptions": config(
+        "ACCOUNT_DIGEST_SUBSCRIPTIONS_TIMEOUT", default=5.0, cast=float
+    ),
+    "account_digest.openshift_advisor": config(
+        "ACCOUNT_DIGEST_OPENSHIFT_ADVISOR_TIMEOUT", default=5.0, cast=float
+    ),
+}
+# How old (in seconds) reference data (e.g. advisor rule categories) can get before it is reloaded
+reference_data_refresh_interval = config(
+    "REFERENCE_DATA_REFRESH_INTERVAL", default=3600.0, cast=float
+)
+
 # Platform requests
 platform_request = config(
     "PLATFORM_REQUEST",
@@ -81,6 +154,20 @@ if session_storage == "redis":
     redis_hostname = config("REDIS_HOSTNAME")
     redis_port = config("REDIS_PORT")
 
+# status.redhat.com incidents are polled in the background, with redis only one replica polls and shares them
+redhat_status_poll_interval = config(
+    "REDHAT_STATUS_POLL_INTERVAL", default=60.0, cast=float
+)
+redhat_status_redis_mirror = session_storage == "redis" and config(
+    "REDHAT_STATUS_REDIS_MIRROR", default=True, cast=bool
+)
+# Shares the data prefetched when a session starts (see virtual-assistant's WATSON_EXTENSION_PREFETCH_URL) between
+# replicas, only with redis session storage. Prefetched payloads are kept for PREFETCH_CACHE_TTL seconds.
+prefetch_cache_enabled = session_storage == "redis" and config(
+    "PREFETCH_CACHE_ENABLED", default=False, cast=bool
+)
+prefetch_cache_ttl = config("PREFETCH_CACHE_TTL", default=300, cast=int)
+
 proxy = config("HTTPS_PROXY", default=None)
 
 
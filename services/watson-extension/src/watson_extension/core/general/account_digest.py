@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import injector
+
+from common.fanout import FanOut
+from watson_extension.clients.insights.advisor import FindRulesResponse
+from watson_extension.clients.insights.rhsm import SubscriptionInfo
+from watson_extension.clients.insights.vulnerability import CVEInfo
+from watson_extension.core.insights.advisor import (
+    AdvisorCore,
+    RecommendationCategory,
+)
+from watson_extension.core.insights.rhsm import RhsmCore
+from watson_extension.core.insights.vulnerability import VulnerabilityCore
+from watson_extension.core.openshift.advisor import (
+    AdvisorCore as OpenshiftAdvisorCore,
+    AdvisorRecommendationResponse,
+    RecommendationCategory as OpenshiftRecommendationCategory,
+)
+
+DIGEST_VULNERABILITY_LIMIT = 5
+
+
+@dataclass
+class AccountDigest:
+    """Each section is `None` when its backend failed or ran out of time."""
+
+    advisor: Optional[FindRulesResponse]
+    vulnerability: Optional[List[CVEInfo]]
+    subscriptions: Optional[List[SubscriptionInfo]]
+    openshift_advisor: Optional[AdvisorRecommendationResponse]
+
+    @property
+    def has_errors(self) -> bool:
+        return None in (
+            self.advisor,
+            self.vulnerability,
+            self.subscriptions,
+            self.openshift_advisor,
+        )
+
+
+class AccountDigestCore:
+    def __init__(
+        self,
+        advisor_core: injector.Inject[AdvisorCore],
+        vulnerability_core: injector.Inject[VulnerabilityCore],
+        rhsm_core: injector.Inject[RhsmCore],
+        openshift_advisor_core: injector.Inject[OpenshiftAdvisorCore],
+        fan_out: injector.Inject[FanOut],
+    ):
+        self.advisor_core = advisor_core
+        self.vulnerability_core = vulnerability_core
+        self.rhsm_core = rhsm_core
+        self.openshift_advisor_core = openshift_advisor_core
+        self.fan_out = fan_out
+
+    async def get_digest(self) -> AccountDigest:
+        # All the backends are queried at the same time, one that fails or is slow only leaves its section out
+        results = await self.fan_out.run(
+            "account_digest",
+            {
+                "advisor": lambda: self.advisor_core.get_recommendations(
+                    RecommendationCategory.CRITICAL
+                ),
+                "vulnerability": lambda: self.vulnerability_core.get_cves(
+                    DIGEST_VULNERABILITY_LIMIT
+                ),
+                "subscriptions": self.rhsm_core.check_subscriptions,
+                "openshift_advisor": lambda: self.openshift_advisor_core.get_recommendations(
+                    OpenshiftRecommendationCategory.RECOMMENDATION
+                ),
+            },
+        )
+
+        return AccountDigest(
+            **{
+                section: result.value if result.ok else None
+                for section, result in results.items()
+            }
+        )
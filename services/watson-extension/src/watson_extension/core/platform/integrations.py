@@ -1,14 +1,27 @@
+import asyncio
+import copy
 import enum
-from typing import Optional, List, Tuple
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional, List, Tuple
 
 import injector
 
+from common.fanout import FanOut
 from watson_extension.clients.platform import IntegrationInfo
+from watson_extension.clients.conversation_cache import ConversationCache
 from watson_extension.clients.platform.integrations import IntegrationsClient
 from watson_extension.clients.platform.sources import SourcesClient
 
 
 MAX_NUMBER_OF_INTEGRATIONS = 5
+# Actions of a bulk request in flight at the same time against each backend
+MAX_CONCURRENT_BULK_ACTIONS = 4
+
+logger = logging.getLogger(__name__)
+
+# Conversation cache resource of the notifications endpoints payloads
+NOTIFICATIONS_ENDPOINT = "notifications_endpoint"
 
 
 class IntegrationType(enum.Enum):
@@ -16,14 +29,35 @@ class IntegrationType(enum.Enum):
     NOTIFICATIONS = "notifications"
 
 
+class IntegrationAction(enum.Enum):
+    RESUME = "resume"
+    PAUSE = "pause"
+    DELETE = "delete"
+    UPDATE_NAME = "update_name"
+    UPDATE_URL = "update_url"
+    UPDATE_SECRET = "update_secret"
+
+
+@dataclass(frozen=True)
+class IntegrationActionResult:
+    integration_type: IntegrationType
+    integration_id: str
+    action: IntegrationAction
+    success: bool
+
+
 class IntegrationsCore:
     def __init__(
         self,
         integrations_client: injector.Inject[IntegrationsClient],
         sources_client: injector.Inject[SourcesClient],
+        fan_out: injector.Inject[FanOut],
+        conversation_cache: injector.Inject[ConversationCache],
     ):
         self.integrations_client = integrations_client
         self.sources_client = sources_client
+        self.fan_out = fan_out
+        self.conversation_cache = conversation_cache
 
     async def redhat_integrations_validate_name(
         self,
@@ -104,32 +138,37 @@ class IntegrationsCore:
         integration_search: Optional[str] = None,
         integration_enabled: Optional[bool] = None,
     ) -> Tuple[bool, Optional[List[IntegrationInfo]]]:
-        has_errors = False
-
-        (
-            response_ok,
-            notification_api_integrations,
-        ) = await self.integrations_client.fetch_integrations(
-            search=integration_search,
-            enabled=integration_enabled,
-            max_integration_num=MAX_NUMBER_OF_INTEGRATIONS,
-        )
-
-        if not response_ok:
-            has_errors = True
-
-        response_ok, sources_api_integrations = await self.sources_client.get_sources(
-            search=integration_search,
-            enabled=integration_enabled,
-            max_integration_num=MAX_NUMBER_OF_INTEGRATIONS,
+        # Both backends are queried at the same time, one that fails or is slow only leaves its integrations out
+        results = await self.fan_out.run(
+            "integrations",
+            {
+                "notifications": lambda: self.integrations_client.fetch_integrations(
+                    search=integration_search,
+                    enabled=integration_enabled,
+                    max_integration_num=MAX_NUMBER_OF_INTEGRATIONS,
+                ),
+                "sources": lambda: self.sources_client.get_sources(
+                    search=integration_search,
+                    enabled=integration_enabled,
+                    max_integration_num=MAX_NUMBER_OF_INTEGRATIONS,
+                ),
+            },
         )
 
-        if not response_ok:
-            has_errors = True
+        has_errors = False
+        integrations = []
+        # Notifications first, as they were listed before
+        for result in (results["notifications"], results["sources"]):
+            if not result.ok:
+                has_errors = True
+                continue
 
-        integrations = [*notification_api_integrations, *sources_api_integrations]
+            response_ok, source_integrations = result.value
+            if not response_ok:
+                has_errors = True
+            integrations.extend(source_integrations)
 
-        return has_errors, integrations[:5]
+        return has_errors, integrations[:MAX_NUMBER_OF_INTEGRATIONS]
 
     async def integration_enable(
         self,
@@ -144,6 +183,7 @@ class IntegrationsCore:
             )
         elif integration_type == IntegrationType.NOTIFICATIONS:
             response = await self.integrations_client.integration_resume(integration_id)
+            self.conversation_cache.invalidate(NOTIFICATIONS_ENDPOINT, integration_id)
 
         if response is not None and response.ok:
             return True
@@ -163,6 +203,7 @@ class IntegrationsCore:
             )
         elif integration_type == IntegrationType.NOTIFICATIONS:
             response = await self.integrations_client.integration_pause(integration_id)
+            self.conversation_cache.invalidate(NOTIFICATIONS_ENDPOINT, integration_id)
 
         if response is not None and response.ok:
             return True
@@ -182,6 +223,7 @@ class IntegrationsCore:
             )
         elif integration_type == IntegrationType.NOTIFICATIONS:
             response = await self.integrations_client.delete_integration(integration_id)
+            self.conversation_cache.invalidate(NOTIFICATIONS_ENDPOINT, integration_id)
 
         if response is not None and response.ok:
             return True
@@ -202,16 +244,13 @@ class IntegrationsCore:
                 integration_data={"name": new_integration_name},
             )
         elif integration_type == IntegrationType.NOTIFICATIONS:
-            response = await self.integrations_client.retrieve_notification_endpoint(
-                integration_id
-            )
+            integration_data = await self._get_notification_endpoint(integration_id)
 
-            if response.ok:
-                integration_data = await response.json()
+            if integration_data is not None:
                 integration_data["name"] = new_integration_name
 
-                response = await self.integrations_client.update_integration(
-                    integration_id=integration_id, integration_data=integration_data
+                response = await self._update_notification_endpoint(
+                    integration_id, integration_data
                 )
 
         if response is not None and response.ok:
@@ -228,16 +267,13 @@ class IntegrationsCore:
         response = None
 
         if integration_type == IntegrationType.NOTIFICATIONS:
-            response = await self.integrations_client.retrieve_notification_endpoint(
-                integration_id
-            )
+            integration_data = await self._get_notification_endpoint(integration_id)
 
-            if response.ok:
-                integration_data = await response.json()
+            if integration_data is not None:
                 integration_data["properties"]["url"] = new_integration_url
 
-                response = await self.integrations_client.update_integration(
-                    integration_id=integration_id, integration_data=integration_data
+                response = await self._update_notification_endpoint(
+                    integration_id, integration_data
                 )
 
         if response is not None and response.ok:
@@ -254,19 +290,109 @@ class IntegrationsCore:
         response = None
 
         if integration_type == IntegrationType.NOTIFICATIONS:
-            response = await self.integrations_client.retrieve_notification_endpoint(
-                integration_id
-            )
+            integration_data = await self._get_notification_endpoint(integration_id)
 
-            if response.ok:
-                integration_data = await response.json()
+            if integration_data is not None:
                 integration_data["properties"]["secret_token"] = new_integration_secret
 
-                response = await self.integrations_client.update_integration(
-                    integration_id=integration_id, integration_data=integration_data
+                response = await self._update_notification_endpoint(
+                    integration_id, integration_data
                 )
 
         if response is not None and response.ok:
             return True
 
         return False
+
+    async def _get_notification_endpoint(self, integration_id: str) -> Optional[Dict]:
+        async def load() -> Optional[Dict]:
+            response = await self.integrations_client.retrieve_notification_endpoint(
+                integration_id
+            )
+            return await response.json() if response.ok else None
+
+        # Kept until an update goes through, a retry of a failed one reuses it
+        integration_data = await self.conversation_cache.get_or_load(
+            NOTIFICATIONS_ENDPOINT, integration_id, load
+        )
+        # The cached payload is shared with the next steps, changes go to a copy
+        return copy.deepcopy(integration_data)
+
+    async def _update_notification_endpoint(
+        self, integration_id: str, integration_data: Dict
+    ):
+        response = await self.integrations_client.update_integration(
+            integration_id=integration_id, integration_data=integration_data
+        )
+        if response.ok:
+            self.conversation_cache.invalidate(NOTIFICATIONS_ENDPOINT, integration_id)
+        return response
+
+    async def integration_action(
+        self,
+        integration_type: IntegrationType,
+        integration_id: str,
+        action: IntegrationAction,
+        new_value: Optional[str] = None,
+    ) -> bool:
+        if action == IntegrationAction.RESUME:
+            return await self.integration_enable(integration_type, integration_id)
+        if action == IntegrationAction.PAUSE:
+            return await self.integration_disable(integration_type, integration_id)
+        if action == IntegrationAction.DELETE:
+            return await self.integration_delete(integration_type, integration_id)
+
+        if new_value is None:
+            return False
+
+        if action == IntegrationAction.UPDATE_NAME:
+            return await self.integration_update_name(
+                integration_type, integration_id, new_value
+            )
+        if action == IntegrationAction.UPDATE_URL:
+            return await self.integration_update_url(
+                integration_type, integration_id, new_value
+            )
+        if action == IntegrationAction.UPDATE_SECRET:
+            return await self.integration_update_secret(
+                integration_type, integration_id, new_value
+            )
+
+        return False
+
+    async def integration_bulk_actions(
+        self,
+        actions: List[Tuple[IntegrationType, str, IntegrationAction, Optional[str]]],
+    ) -> List[IntegrationActionResult]:
+        # Bounded per backend, so a slow one does not take the slots of the other
+        limits = {
+            integration_type: asyncio.Semaphore(MAX_CONCURRENT_BULK_ACTIONS)
+            for integration_type in IntegrationType
+        }
+
+        async def run(
+            integration_type: IntegrationType,
+            integration_id: str,
+            action: IntegrationAction,
+            new_value: Optional[str],
+        ) -> IntegrationActionResult:
+            async with limits[integration_type]:
+                try:
+                    success = await self.integration_action(
+                        integration_type, integration_id, action, new_value
+                    )
+                except Exception as e:
+                    # One failed item does not abort the rest
+                    logger.error(
+                        f"Failed to {action.value} {integration_type.value} integration {integration_id}: {e}"
+                    )
+                    success = False
+
+            return IntegrationActionResult(
+                integration_type=integration_type,
+                integration_id=integration_id,
+                action=action,
+                success=success,
+            )
+
+        return list(await asyncio.gather(*[run(*action) for action in actions]))
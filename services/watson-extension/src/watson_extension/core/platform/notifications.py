@@ -5,6 +5,7 @@ from typing import Optional, List
 import injector
 
 from watson_extension.clients.platform.notifications import PlatformNotificationsClient
+from watson_extension.clients.reference_data import ReferenceDataRegistry
 
 
 @dataclass
@@ -46,8 +47,10 @@ class PlatformNotificationsCore:
     def __init__(
         self,
         platform_notifications_client: injector.Inject[PlatformNotificationsClient],
+        reference_data: injector.Inject[ReferenceDataRegistry],
     ):
         self.platform_notifications_client = platform_notifications_client
+        self.reference_data = reference_data
 
     async def validate_notifications_bundle(
         self, provided_bundle_name: str
@@ -55,20 +58,20 @@ class PlatformNotificationsCore:
         if provided_bundle_name == "unsure":
             return BundleInfo(id="unsure", name="unsure", display_name="unsure")
 
-        result = await self.platform_notifications_client.get_available_bundles()
-
-        if len(result) == 0:
+        bundles = await self.reference_data.get(
+            "notifications_bundles",
+            self.platform_notifications_client.get_available_bundles,
+            lambda bundle: bundle["name"],
+        )
+        bundle = bundles.get(provided_bundle_name)
+        if bundle is None:
             return None
 
-        for bundle in result:
-            if bundle["name"] == provided_bundle_name.lower():
-                return BundleInfo(
-                    id=bundle["id"],
-                    name=bundle["name"],
-                    display_name=bundle["displayName"],
-                )
-
-        return None
+        return BundleInfo(
+            id=bundle["id"],
+            name=bundle["name"],
+            display_name=bundle["displayName"],
+        )
 
     async def get_notifications_event_options(
         self, bundle: NotificationsBundle
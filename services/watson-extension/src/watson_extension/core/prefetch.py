@@ -0,0 +1,41 @@
+from typing import Dict
+
+import injector
+
+from common.fanout import FanOut
+from watson_extension.clients.insights.rhsm import RhsmClient
+from watson_extension.clients.platform.chrome import ChromeServiceClient
+from watson_extension.clients.prefetch_cache import warming
+from watson_extension.core.insights.advisor import AdvisorCore, RecommendationCategory
+
+
+class PrefetchCore:
+    def __init__(
+        self,
+        chrome_service_client: injector.Inject[ChromeServiceClient],
+        advisor_core: injector.Inject[AdvisorCore],
+        rhsm_client: injector.Inject[RhsmClient],
+        fan_out: injector.Inject[FanOut],
+    ):
+        self.chrome_service_client = chrome_service_client
+        self.advisor_core = advisor_core
+        self.rhsm_client = rhsm_client
+        self.fan_out = fan_out
+
+    async def prefetch(self) -> Dict[str, bool]:
+        """
+        Warms the data the first turns of a conversation usually ask for, returns whether each one was prefetched.
+        """
+        with warming():
+            results = await self.fan_out.run(
+                "prefetch",
+                {
+                    "chrome_user": self.chrome_service_client.get_user,
+                    "advisor_recommendations": lambda: self.advisor_core.get_recommendations(
+                        RecommendationCategory.CRITICAL
+                    ),
+                    "subscriptions": lambda: self.rhsm_client.check_subscriptions(None),
+                },
+            )
+
+        return {branch: result.ok for branch, result in results.items()}
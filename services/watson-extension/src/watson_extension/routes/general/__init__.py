@@ -1,6 +1,8 @@
 from quart import Blueprint
 from . import redhat_status
+from . import account_digest
 
 blueprint = Blueprint("general", __name__, url_prefix="/general")
 
 blueprint.register_blueprint(redhat_status.blueprint)
+blueprint.register_blueprint(account_digest.blueprint)
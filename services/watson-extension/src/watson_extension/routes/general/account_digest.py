@@ -0,0 +1,40 @@
+import injector
+from pydantic import BaseModel
+
+from quart import Blueprint, render_template
+from quart_schema import validate_response, document_headers
+
+from watson_extension.core.general.account_digest import (
+    DIGEST_VULNERABILITY_LIMIT,
+    AccountDigestCore,
+)
+from watson_extension.routes import RHSessionIdHeader
+
+blueprint = Blueprint("account_digest", __name__, url_prefix="/account_digest")
+
+
+class AccountDigestResponse(BaseModel):
+    response: str
+    has_errors: bool
+
+
+@blueprint.get("/summary")
+@validate_response(AccountDigestResponse)
+@document_headers(RHSessionIdHeader)
+async def summary(
+    account_digest_service: injector.Inject[AccountDigestCore],
+) -> AccountDigestResponse:
+    """
+    Answers "how is my account doing" in one turn: critical advisor recommendations, top CVEs, subscriptions and
+    OpenShift advisor recommendations, leaving out the sections whose backend is not available.
+    """
+    digest = await account_digest_service.get_digest()
+
+    return AccountDigestResponse(
+        response=await render_template(
+            "general/account_digest/summary.txt.jinja",
+            digest=digest,
+            vulnerability_limit=DIGEST_VULNERABILITY_LIMIT,
+        ),
+        has_errors=digest.has_errors,
+    )
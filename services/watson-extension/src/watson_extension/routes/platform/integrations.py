@@ -1,12 +1,18 @@
 import enum
 import injector
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List
 
 from quart import Blueprint, render_template
-from quart_schema import validate_response, validate_querystring, document_headers
+from quart_schema import (
+    validate_response,
+    validate_querystring,
+    validate_request,
+    document_headers,
+)
 
 from watson_extension.core.platform.integrations import (
+    IntegrationAction as CoreIntegrationAction,
     IntegrationType as CoreIntegrationType,
     IntegrationsCore,
 )
@@ -87,6 +93,21 @@ class IntegrationActionsResponse(BaseModel):
     response: str
 
 
+class IntegrationBulkActionItem(BaseModel):
+    integration_type: CoreIntegrationType
+    integration_id: str
+    action: CoreIntegrationAction
+    new_value: Optional[str] = None
+
+
+class IntegrationBulkActionsRequest(BaseModel):
+    actions: List[IntegrationBulkActionItem] = Field(min_length=1, max_length=50)
+
+
+class IntegrationBulkActionsResponse(BaseModel):
+    response: str
+
+
 class IntegrationUpdateTypes(enum.Enum):
     """
     The type of integration info being updated: name/url/secret
@@ -271,6 +292,30 @@ async def integration_actions(
     )
 
 
+@blueprint.post("/bulk_actions")
+@validate_request(IntegrationBulkActionsRequest)
+@validate_response(IntegrationBulkActionsResponse)
+@document_headers(RHSessionIdHeader)
+async def integration_bulk_actions(
+    data: IntegrationBulkActionsRequest,
+    integrations_service: injector.Inject[IntegrationsCore],
+) -> IntegrationBulkActionsResponse:
+    results = await integrations_service.integration_bulk_actions(
+        [
+            (item.integration_type, item.integration_id, item.action, item.new_value)
+            for item in data.actions
+        ]
+    )
+
+    return IntegrationBulkActionsResponse(
+        response=await render_template(
+            "platform/integrations/integration_bulk_actions_summary.txt.jinja",
+            results=results,
+            failed=[result for result in results if not result.success],
+        )
+    )
+
+
 @blueprint.post("/update")
 @validate_querystring(IntegrationUpdateRequestQuery)
 @validate_response(IntegrationUpdateResponse)
@@ -0,0 +1,28 @@
+from typing import Dict
+
+import injector
+from pydantic import BaseModel
+from quart import Blueprint
+from quart_schema import validate_response, document_headers
+
+from watson_extension.core.prefetch import PrefetchCore
+from watson_extension.routes import RHSessionIdHeader
+
+blueprint = Blueprint("prefetch", __name__, url_prefix="/prefetch")
+
+
+class PrefetchResponse(BaseModel):
+    prefetched: Dict[str, bool]
+
+
+@blueprint.post("")
+@validate_response(PrefetchResponse)
+@document_headers(RHSessionIdHeader)
+async def prefetch(
+    prefetch_service: injector.Inject[PrefetchCore],
+) -> PrefetchResponse:
+    """
+    Called by virtual-assistant when a session starts, loads the data of the user that is likely to be needed soon
+    into the prefetch cache.
+    """
+    return PrefetchResponse(prefetched=await prefetch_service.prefetch())
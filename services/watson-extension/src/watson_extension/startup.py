@@ -3,6 +3,7 @@ import injector
 import quart
 import quart_injector
 from quart import Quart, Blueprint
+from redis.asyncio import StrictRedis
 
 from common.providers import (
     make_redis_session_storage_provider,
@@ -50,6 +51,11 @@ from watson_extension.clients.platform.chrome import (
     ChromeServiceClient,
     ChromeServiceClientHttp,
 )
+from watson_extension.clients.platform.chrome_catalog import ChromeServicesCatalog
+from watson_extension.clients.conversation_cache import ConversationCache
+from watson_extension.clients.org_cache import OrgCache
+from watson_extension.clients.prefetch_cache import PrefetchCache
+from watson_extension.clients.reference_data import ReferenceDataRegistry
 from watson_extension.clients.platform.sources import (
     SourcesClient,
     SourcesClientHttp,
@@ -76,9 +82,23 @@ from watson_extension.clients.platform.rbac import (
 from watson_extension.clients.general.redhat_status import (
     RedhatStatusClient,
     RedhatStatusClientHttp,
+    RedhatStatusPoller,
 )
 
 
+from common.fanout import FanOut
+from common import flight_recorder, heavy_hitters, memory_tracer, profiler, tracing
+from common.flight_recorder import FlightRecorder, get_flight_recorder
+from common.heavy_hitters import (
+    HeavyHitterTracker,
+    get_heavy_hitters,
+    record_request_key,
+)
+from common.memory_tracer import MemoryTracer
+from common.profiler import SamplingProfiler
+from common.timing import phase
+from common.tracing import Tracer, get_tracer
+from common.metrics.quart import get_registry
 from common.platform_request import (
     AbstractPlatformRequest,
 )
@@ -87,6 +107,7 @@ from watson_extension.routes import insights
 from watson_extension.routes import openshift
 from watson_extension.routes import platform
 from watson_extension.routes import general
+from watson_extension.routes import prefetch
 
 import watson_extension.config as config
 
@@ -117,6 +138,89 @@ def quart_user_identity_provider(
     return QuartWatsonExtensionUserIdentityProvider(quart.request, session_storage)
 
 
+@injector.provider
+def chrome_services_catalog_provider(
+    chrome_url: injector.Inject[ChromeServiceURL],
+    platform_request: injector.Inject[AbstractPlatformRequest],
+) -> ChromeServicesCatalog:
+    return ChromeServicesCatalog(
+        chrome_url, platform_request, config.chrome_services_catalog_refresh_interval
+    )
+
+
+@injector.provider
+def reference_data_registry_provider(
+    app: injector.Inject[Quart],
+) -> ReferenceDataRegistry:
+    return ReferenceDataRegistry(
+        get_registry(app),
+        config.name,
+        refresh_interval=config.reference_data_refresh_interval,
+    )
+
+
+@injector.provider
+def org_cache_provider(app: injector.Inject[Quart]) -> OrgCache:
+    return OrgCache(config.org_cache_ttls, get_registry(app), config.name)
+
+
+@injector.provider
+def conversation_cache_provider(app: injector.Inject[Quart]) -> ConversationCache:
+    return ConversationCache(
+        config.conversation_cache_ttl,
+        metrics_registry=get_registry(app),
+        app_name=config.name,
+    )
+
+
+@injector.provider
+def prefetch_cache_provider(app: injector.Inject[Quart]) -> PrefetchCache:
+    return PrefetchCache(
+        StrictRedis(host=config.redis_hostname, port=config.redis_port)
+        if config.prefetch_cache_enabled
+        else None,
+        ttl=config.prefetch_cache_ttl,
+        metrics_registry=get_registry(app),
+        app_name=config.name,
+    )
+
+
+@injector.provider
+def fan_out_provider(app: injector.Inject[Quart]) -> FanOut:
+    return FanOut(get_registry(app), config.name, timeouts=config.fan_out_timeouts)
+
+
+@injector.provider
+def redhat_status_poller_provider(
+    session: injector.Inject[aiohttp.ClientSession],
+    app: injector.Inject[Quart],
+) -> RedhatStatusPoller:
+    return RedhatStatusPoller(
+        session,
+        poll_interval=config.redhat_status_poll_interval,
+        redis=StrictRedis(host=config.redis_hostname, port=config.redis_port)
+        if config.redhat_status_redis_mirror
+        else None,
+        metrics_registry=get_registry(app),
+        app_name=config.name,
+    )
+
+
+@injector.provider
+def flight_recorder_provider(app: injector.Inject[Quart]) -> FlightRecorder:
+    return get_flight_recorder(app)
+
+
+@injector.provider
+def tracer_provider(app: injector.Inject[Quart]) -> Tracer:
+    return get_tracer(app)
+
+
+@injector.provider
+def heavy_hitters_provider(app: injector.Inject[Quart]) -> HeavyHitterTracker:
+    return get_heavy_hitters(app)
+
+
 def injector_from_config(binder: injector.Binder) -> None:
     # Read configuration and assemble our dependencies
     if config.session_storage == "redis":
@@ -125,13 +229,16 @@ def injector_from_config(binder: injector.Binder) -> None:
             to=make_redis_session_storage_provider(
                 hostname=config.redis_hostname,
                 port=config.redis_port,
+                app_name=config.name,
             ),
             scope=injector.singleton,
         )
     elif config.session_storage == "file":
         binder.bind(
             SessionStorage,
-            to=make_file_session_storage_provider(".va-session-storage"),
+            to=make_file_session_storage_provider(
+                ".va-session-storage", app_name=config.name
+            ),
             scope=injector.singleton,
         )
 
@@ -246,6 +353,43 @@ def injector_from_config(binder: injector.Binder) -> None:
     )
     binder.bind(RbacURL, to=config.rbac_url, scope=injector.singleton)
 
+    binder.bind(
+        ChromeServicesCatalog,
+        to=chrome_services_catalog_provider,
+        scope=injector.singleton,
+    )
+    binder.bind(
+        ReferenceDataRegistry,
+        to=reference_data_registry_provider,
+        scope=injector.singleton,
+    )
+    binder.bind(OrgCache, to=org_cache_provider, scope=injector.singleton)
+    binder.bind(FanOut, to=fan_out_provider, scope=injector.singleton)
+    binder.bind(
+        ConversationCache, to=conversation_cache_provider, scope=injector.singleton
+    )
+    binder.bind(PrefetchCache, to=prefetch_cache_provider, scope=injector.singleton)
+    binder.bind(
+        RedhatStatusPoller,
+        to=redhat_status_poller_provider,
+        scope=injector.singleton,
+    )
+    binder.bind(FlightRecorder, to=flight_recorder_provider, scope=injector.singleton)
+    binder.bind(Tracer, to=tracer_provider, scope=injector.singleton)
+    binder.bind(HeavyHitterTracker, to=heavy_hitters_provider, scope=injector.singleton)
+    binder.bind(
+        SamplingProfiler,
+        to=SamplingProfiler(
+            enabled=config.profiler_enabled, max_duration=config.profiler_max_duration
+        ),
+        scope=injector.singleton,
+    )
+    binder.bind(
+        MemoryTracer,
+        to=MemoryTracer(enabled=config.memory_tracer_enabled),
+        scope=injector.singleton,
+    )
+
 
 def injector_defaults(binder: injector.Binder) -> None:
     # clients
@@ -282,12 +426,56 @@ def injector_defaults(binder: injector.Binder) -> None:
     )
 
 
+def wire_lifecycle(app: Quart) -> None:
+    # Must happen after the injector is wired
+    container: injector.Injector = app.extensions["injector"]
+
+    @app.before_serving
+    async def start_chrome_services_catalog():
+        await container.get(ChromeServicesCatalog).start()
+
+    @app.after_serving
+    async def stop_chrome_services_catalog():
+        await container.get(ChromeServicesCatalog).stop()
+
+    @app.before_serving
+    async def start_redhat_status_poller():
+        await container.get(RedhatStatusPoller).start()
+
+    @app.after_serving
+    async def stop_redhat_status_poller():
+        await container.get(RedhatStatusPoller).stop()
+
+
+async def record_session_org(
+    user_identity_provider: injector.Inject[AbstractUserIdentityProvider],
+):
+    """
+    Counts the request under the org of its session, see `common.heavy_hitters`. The session is the one the identity
+    provider of the request loads, the handler reuses it.
+    """
+    if not isinstance(
+        user_identity_provider, QuartWatsonExtensionUserIdentityProvider
+    ) or ("x-rh-session-id" not in quart.request.headers):
+        return
+
+    session = await user_identity_provider.get_session()
+    if session is not None:
+        record_request_key("org", session.user_id.split("/", 1)[0])
+
+
 def wire_routes(app: Quart) -> None:
     public_root = Blueprint("public_root", __name__, url_prefix=config.base_url)
     private_root = Blueprint("private_root", __name__)
 
     # Connecting private routes (/)
     private_root.register_blueprint(health.blueprint)
+    private_root.register_blueprint(flight_recorder.blueprint)
+    private_root.register_blueprint(profiler.make_blueprint(config.name))
+    private_root.register_blueprint(memory_tracer.blueprint)
+    private_root.register_blueprint(tracing.blueprint)
+    private_root.register_blueprint(heavy_hitters.blueprint)
+    private_root.register_blueprint(prefetch.blueprint)
 
     # Connect public routes ({config.base_url})
     public_root.register_blueprint(platform.blueprint)
@@ -297,7 +485,11 @@ def wire_routes(app: Quart) -> None:
 
     @public_root.before_request
     async def authentication_check(authentication: injector.Inject[Authentication]):
-        await authentication.check_auth(quart.request)
+        with phase("auth"):
+            await authentication.check_auth(quart.request)
+
+    # Only on the routes that resolve the identity of the session
+    public_root.before_request(record_session_org)
 
     app.register_blueprint(public_root)
     app.register_blueprint(private_root)
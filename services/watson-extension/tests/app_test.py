@@ -12,6 +12,7 @@ from openapi_spec_validator import validate
 
 import pytest
 
+from common.heavy_hitters import HeavyHitter, get_heavy_hitters
 from common.session_storage import Session
 from watson_extension.routes.health import StatusResponse, Status
 from redis.asyncio import StrictRedis
@@ -175,6 +176,7 @@ async def test_app_advisor(default_app, aiohttp_mock, session_storage):
     )
 
     assert response.status == "200 OK"
+    assert get_heavy_hitters(default_app).top()["org"].top == [HeavyHitter("theorg", 1)]
 
 
 async def test_app_advisor_openshift(default_app, aiohttp_mock, session_storage):
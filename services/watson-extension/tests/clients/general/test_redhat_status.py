@@ -0,0 +1,122 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aioprometheus import Registry
+from aioresponses import aioresponses
+from pytest_mock_resources import create_redis_fixture, RedisConfig
+from redis.asyncio import StrictRedis
+
+from watson_extension.clients.general.redhat_status import (
+    UNRESOLVED_INCIDENTS_URL,
+    RedhatStatusClientHttp,
+    RedhatStatusPoller,
+)
+
+redis_fixture = create_redis_fixture()
+
+INCIDENTS = {"incidents": [{"name": "Degraded console", "status": "investigating"}]}
+
+
+@pytest.fixture(scope="session")
+def pmr_redis_config() -> RedisConfig:
+    return RedisConfig(image="docker.io/valkey/valkey:8.1.4")
+
+
+@pytest.fixture
+def redis(redis_fixture):
+    return StrictRedis(**redis_fixture.pmr_credentials.as_redis_kwargs())
+
+
+@pytest.fixture
+async def aiohttp_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+async def test_check_services_offline_from_memory(session, aiohttp_mock):
+    aiohttp_mock.get(UNRESOLVED_INCIDENTS_URL, payload=INCIDENTS)
+    poller = RedhatStatusPoller(session)
+    client = RedhatStatusClientHttp(poller)
+
+    assert await client.check_services_offline() == INCIDENTS
+    assert await client.check_services_offline() == INCIDENTS
+    assert len(aiohttp_mock.requests) == 1
+
+
+async def test_poll_keeps_stale_snapshot_on_errors(session, aiohttp_mock):
+    aiohttp_mock.get(UNRESOLVED_INCIDENTS_URL, payload=INCIDENTS)
+    aiohttp_mock.get(UNRESOLVED_INCIDENTS_URL, status=503)
+    metrics = Registry()
+    poller = RedhatStatusPoller(session, metrics_registry=metrics, app_name="test")
+
+    await poller.poll()
+    snapshot = poller.snapshot
+    await poller.poll()
+
+    assert poller.snapshot is snapshot
+    polls = metrics.get("redhat_status_polls_total")
+    assert polls.get({"source": "upstream", "result": "success"}) == 1
+    assert polls.get({"source": "upstream", "result": "error"}) == 1
+    assert metrics.get("redhat_status_snapshot_timestamp_seconds").get({}) == (
+        snapshot.fetched_at
+    )
+
+
+async def test_check_services_offline_unavailable(session, aiohttp_mock):
+    aiohttp_mock.get(UNRESOLVED_INCIDENTS_URL, exception=aiohttp.ClientError())
+    client = RedhatStatusClientHttp(RedhatStatusPoller(session))
+
+    assert await client.check_services_offline() is None
+
+
+async def test_poll_shares_snapshot_through_redis(session, aiohttp_mock, redis):
+    aiohttp_mock.get(UNRESOLVED_INCIDENTS_URL, payload=INCIDENTS)
+    polling = RedhatStatusPoller(session, redis=redis)
+    mirroring = RedhatStatusPoller(session, redis=redis)
+
+    await polling.poll()
+    await mirroring.poll()
+
+    # Only the first replica reached status.redhat.com
+    assert len(aiohttp_mock.requests) == 1
+    assert mirroring.snapshot == polling.snapshot
+
+
+async def test_start_stop(session, aiohttp_mock):
+    aiohttp_mock.get(UNRESOLVED_INCIDENTS_URL, payload=INCIDENTS)
+    poller = RedhatStatusPoller(session, poll_interval=3600)
+
+    await poller.start()
+    # Nothing loaded yet, requests fall back instead of polling inline
+    assert await poller.get() is None
+    assert len(aiohttp_mock.requests) == 0
+
+    while poller.snapshot is None:
+        await asyncio.sleep(0.01)
+    assert poller.snapshot.content == INCIDENTS
+    await poller.stop()
+    assert len(aiohttp_mock.requests) == 1
+
+
+async def test_concurrent_gets_poll_once_while_unavailable(session, aiohttp_mock):
+    aiohttp_mock.get(
+        UNRESOLVED_INCIDENTS_URL, exception=aiohttp.ClientError(), repeat=True
+    )
+    metrics = Registry()
+    poller = RedhatStatusPoller(session, metrics_registry=metrics, app_name="test")
+
+    results = await asyncio.gather(*(poller.get() for _ in range(5)))
+
+    assert results == [None] * 5
+    # Retries are left to the periodic poll
+    assert await poller.get() is None
+    polls = metrics.get("redhat_status_polls_total")
+    assert polls.get({"source": "upstream", "result": "error"}) == 1
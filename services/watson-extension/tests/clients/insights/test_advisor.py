@@ -11,6 +11,9 @@ from watson_extension.clients.insights.advisor import (
     FindRuleSort,
 )
 from common.platform_request import PlatformRequest
+from watson_extension.clients.org_cache import OrgCache
+from watson_extension.clients.prefetch_cache import PrefetchCache
+from watson_extension.clients.reference_data import ReferenceDataRegistry
 
 
 @pytest.fixture
@@ -29,7 +32,12 @@ async def session():
 @pytest.fixture
 async def client(session) -> AdvisorClient:
     return AdvisorClientHttp(
-        AdvisorURL(""), FixedUserIdentityProvider(), PlatformRequest(session)
+        AdvisorURL(""),
+        FixedUserIdentityProvider(),
+        PlatformRequest(session),
+        ReferenceDataRegistry(),
+        OrgCache({}),
+        PrefetchCache(),
     )
 
 
@@ -54,6 +62,19 @@ async def test_find_rule_category_by_name_unknown_rule(client, aiohttp_mock) ->
         await client.find_rule_category_by_name("unknown")
 
 
+async def test_find_rule_category_by_name_loads_categories_once(
+    client, aiohttp_mock
+) -> None:
+    aiohttp_mock.get(
+        "/api/insights/v1/rulecategory/",
+        status=200,
+        body=get_resource_contents("requests/insights/advisor/categories.json"),
+    )
+    assert (await client.find_rule_category_by_name("performance")).id == 4
+    assert (await client.find_rule_category_by_name("Security")).name == "Security"
+    assert len(aiohttp_mock.requests) == 1
+
+
 async def test_find_rules(client, aiohttp_mock) -> None:
     aiohttp_mock.get(
         "/api/insights/v1/rule?impacting=true&rule_status=enabled&limit=3",
@@ -1,15 +1,19 @@
+import base64
+import json
+
 import aiohttp
 import pytest
 from aioresponses import aioresponses
 
 from ... import get_resource_contents
 from watson_extension.clients import AdvisorOpenshiftURL
-from common.identity import FixedUserIdentityProvider
+from common.identity import AbstractUserIdentityProvider, FixedUserIdentityProvider
 from watson_extension.clients.openshift.advisor import (
     AdvisorClient,
     AdvisorClientHttp,
 )
 from common.platform_request import PlatformRequest
+from watson_extension.clients.org_cache import OrgCache
 
 
 @pytest.fixture
@@ -28,7 +32,10 @@ async def session():
 @pytest.fixture
 async def client(session) -> AdvisorClient:
     return AdvisorClientHttp(
-        AdvisorOpenshiftURL(""), FixedUserIdentityProvider(), PlatformRequest(session)
+        AdvisorOpenshiftURL(""),
+        FixedUserIdentityProvider(),
+        PlatformRequest(session),
+        OrgCache({}),
     )
 
 
@@ -120,3 +127,61 @@ async def test_clusters(client, aiohttp_mock) -> None:
     assert clusters[2].id == "98ed1b12-08f2-11f0-9801-525400fdfea5"
     assert clusters[2].name == "iqe-ocp-vulnerability-stage-test-mar24"
     assert clusters[2].last_checked_at is None
+
+
+async def test_workloads_invalid_status(client, aiohttp_mock) -> None:
+    aiohttp_mock.get(
+        "/api/insights-results-aggregator/v2/namespaces/dvo",
+        status=200,
+        body='{"workloads": [], "status": "error"}',
+    )
+    with pytest.raises(RuntimeError):
+        await client.get_workloads()
+
+
+class OrgUserIdentityProvider(AbstractUserIdentityProvider):
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+
+    async def get_user_identity(self) -> str:
+        return base64.b64encode(
+            json.dumps(
+                {
+                    "identity": {
+                        "org_id": "org123",
+                        "type": "User",
+                        "user": {"user_id": self.user_id},
+                    }
+                }
+            ).encode("utf8")
+        ).decode("utf8")
+
+
+async def test_clusters_are_not_shared_between_users_of_the_org(
+    session, aiohttp_mock
+) -> None:
+    org_cache = OrgCache({"openshift_advisor": 60})
+    aiohttp_mock.get(
+        "/api/insights-results-aggregator/v2/clusters",
+        status=200,
+        body=get_resource_contents("requests/openshift/advisor/clusters.json"),
+    )
+    aiohttp_mock.get("/api/insights-results-aggregator/v2/clusters", status=403)
+
+    with_access = AdvisorClientHttp(
+        AdvisorOpenshiftURL(""),
+        OrgUserIdentityProvider("with-access"),
+        PlatformRequest(session),
+        org_cache,
+    )
+    without_access = AdvisorClientHttp(
+        AdvisorOpenshiftURL(""),
+        OrgUserIdentityProvider("without-access"),
+        PlatformRequest(session),
+        org_cache,
+    )
+
+    assert len(await with_access.get_clusters()) == 3
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        await without_access.get_clusters()
+    assert error.value.status == 403
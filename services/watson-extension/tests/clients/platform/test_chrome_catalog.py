@@ -0,0 +1,187 @@
+import json
+
+import aiohttp
+import pytest
+import yarl
+from aioresponses import aioresponses
+
+from common.platform_request import PlatformRequest
+from watson_extension.clients import ChromeServiceURL
+from watson_extension.clients.platform.chrome_catalog import (
+    GENERATED_SERVICES_PATH,
+    CatalogCategory,
+    CatalogService,
+    ChromeServicesCatalog,
+    ServicesIndex,
+)
+
+SERVICES_URL = f"http://chrome{GENERATED_SERVICES_PATH}"
+
+GENERATED_SERVICES = [
+    {
+        "id": "foo",
+        "title": "foo",
+        "href": "/insights/foo",
+        "links": [
+            {
+                "title": "barGroup",
+                "isGroup": True,
+                "links": [
+                    {
+                        "appId": "bar1",
+                        "href": "/insights/bar1",
+                        "title": "bar1",
+                        "altTitle": ["bar one"],
+                    },
+                    {
+                        "href": "https://example.com",
+                        "isExternal": True,
+                        "title": "external",
+                    },
+                ],
+            },
+            {"title": "not a group", "href": "/insights/baz"},
+        ],
+    }
+]
+
+
+@pytest.fixture
+async def aiohttp_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+@pytest.fixture
+async def catalog(session) -> ChromeServicesCatalog:
+    return ChromeServicesCatalog(
+        ChromeServiceURL("http://chrome"), PlatformRequest(session)
+    )
+
+
+async def test_get_loads_catalog_once(catalog, aiohttp_mock):
+    aiohttp_mock.get(SERVICES_URL, body=json.dumps(GENERATED_SERVICES))
+
+    services_catalog = await catalog.get()
+    assert services_catalog.categories == (
+        CatalogCategory(title="foo", href="/insights/foo"),
+    )
+    assert services_catalog.services == (
+        CatalogService(
+            group="barGroup",
+            title="bar1",
+            href="/insights/bar1",
+            app_id="bar1",
+            alt_title=("bar one",),
+        ),
+    )
+
+    assert await catalog.get() is services_catalog
+    assert len(aiohttp_mock.requests) == 1
+
+
+async def test_refresh_revalidates_with_etag(catalog, aiohttp_mock):
+    aiohttp_mock.get(
+        SERVICES_URL,
+        body=json.dumps(GENERATED_SERVICES),
+        headers={"ETag": '"v1"'},
+    )
+    aiohttp_mock.get(SERVICES_URL, status=304)
+    aiohttp_mock.get(
+        SERVICES_URL,
+        body=json.dumps([{"title": "new", "href": "/new"}]),
+        headers={"ETag": '"v2"'},
+    )
+
+    assert await catalog.refresh() is True
+    first = catalog.current
+    assert first.etag == '"v1"'
+
+    assert await catalog.refresh() is False
+    assert catalog.current is first
+    requests = aiohttp_mock.requests[("GET", yarl.URL(SERVICES_URL))]
+    assert requests[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    assert await catalog.refresh() is True
+    assert catalog.current.etag == '"v2"'
+    assert catalog.current.categories == (CatalogCategory(title="new", href="/new"),)
+    # Snapshots already handed out are left untouched
+    assert first.categories[0].title == "foo"
+
+
+async def test_start_keeps_serving_when_load_fails(catalog, aiohttp_mock):
+    aiohttp_mock.get(SERVICES_URL, status=500)
+    aiohttp_mock.get(SERVICES_URL, body=json.dumps(GENERATED_SERVICES))
+
+    await catalog.start()
+    try:
+        assert catalog.current is None
+        # Loaded on first use instead
+        assert len((await catalog.get()).services) == 1
+    finally:
+        await catalog.stop()
+
+
+async def test_refresh_failure_keeps_current_catalog(catalog, aiohttp_mock):
+    aiohttp_mock.get(SERVICES_URL, body=json.dumps(GENERATED_SERVICES))
+    aiohttp_mock.get(SERVICES_URL, status=500)
+
+    await catalog.refresh()
+    current = catalog.current
+    with pytest.raises(aiohttp.ClientResponseError):
+        await catalog.refresh()
+    assert catalog.current is current
+
+
+def service(title: str, **kwargs) -> CatalogService:
+    return CatalogService(
+        group=kwargs.get("group", "group"),
+        title=title,
+        href=kwargs.get("href", f"/{title.replace(' ', '-')}"),
+        app_id=kwargs.get("app_id"),
+        alt_title=kwargs.get("alt_title", ()),
+    )
+
+
+def test_index_exact_match():
+    advisor = service("Advisor", app_id="insights-advisor", alt_title=("Insights",))
+    index = ServicesIndex([advisor, service("Advisor", href="/other")])
+
+    assert index.find("advisor") is advisor
+    assert index.find("  ADVISOR ") is advisor
+    assert index.find("insights") is advisor
+    assert index.find("insights-advisor") is advisor
+    assert index.find("/Advisor") is advisor
+    assert index.find_by_href("/Advisor") is advisor
+    assert index.find("") is None
+
+
+def test_index_near_miss():
+    vulnerability = service("Vulnerability")
+    index = ServicesIndex(
+        [
+            vulnerability,
+            service("Image builder", alt_title=("Image builder app",)),
+            service("bar1"),
+            service("bar3"),
+            service("rhel"),
+        ]
+    )
+
+    assert index.find("vulnerabilty") is vulnerability
+    assert index.find("vulnreability") is vulnerability
+    assert index.find("image  buidler").title == "Image builder"
+    # More typos than allowed
+    assert index.find("vlnrbility") is None
+    # Equally close to several services
+    assert index.find("bar2") is None
+    # Short names need to match exactly
+    assert index.find("rh") is None
+    assert index.find("rhe").title == "rhel"
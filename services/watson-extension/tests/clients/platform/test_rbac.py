@@ -0,0 +1,79 @@
+import json
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from common.identity import FixedUserIdentityProvider
+from common.platform_request import PlatformRequest
+from watson_extension.clients import RbacURL
+from watson_extension.clients.platform.rbac import RBACClient, RBACClientHttp
+
+
+@pytest.fixture
+async def aiohttp_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+@pytest.fixture
+async def client(session) -> RBACClient:
+    return RBACClientHttp(
+        RbacURL(""), FixedUserIdentityProvider(), PlatformRequest(session)
+    )
+
+
+def role(name: str) -> dict:
+    return {
+        "uuid": f"uuid-{name}",
+        "name": name,
+        "display_name": name.title(),
+        "description": f"{name} role",
+        "created": "2024-01-01T00:00:00Z",
+        "modified": "2024-01-01T00:00:00Z",
+        "policyCount": 1,
+        "groups_in_count": 2,
+        "accessCount": 3,
+        "applications": ["rbac"],
+        "system": True,
+        "platform_default": False,
+        "admin_default": False,
+    }
+
+
+async def test_get_roles_for_tam_follows_pages(client, aiohttp_mock) -> None:
+    query = "add_fields=groups_in_count&order_by=display_name&system=true"
+    aiohttp_mock.get(
+        f"/api/rbac/v1/roles/?{query}&limit=100&offset=0",
+        status=200,
+        body=json.dumps(
+            {
+                "meta": {"count": 2},
+                "links": {"next": f"/api/rbac/v1/roles/?{query}&limit=100&offset=1"},
+                "data": [role("viewer")],
+            }
+        ),
+    )
+    aiohttp_mock.get(
+        f"/api/rbac/v1/roles/?{query}&limit=100&offset=1",
+        status=200,
+        body=json.dumps(
+            {
+                "meta": {"count": 2},
+                "links": {"next": None},
+                "data": [role("admin")],
+            }
+        ),
+    )
+
+    roles = await client.get_roles_for_tam()
+    assert [r.name for r in roles] == ["viewer", "admin"]
+    assert roles[0].groups_in_count == 2
+    assert roles[0].external_role_id is None
@@ -0,0 +1,242 @@
+import asyncio
+import json
+import re
+
+import aiohttp
+import pytest
+from aioprometheus import Registry
+from aioresponses import aioresponses
+from quart import Quart
+
+from common.fanout import FanOut
+from common.identity import FixedUserIdentityProvider
+from common.platform_request import PlatformRequest
+from watson_extension.clients import ChromeServiceURL, PlatformNotificationsURL
+from watson_extension.clients.conversation_cache import ConversationCache
+from watson_extension.clients.platform.chrome import ChromeServiceClientHttp
+from watson_extension.clients.platform.integrations import IntegrationsClientHttp
+from watson_extension.clients.prefetch_cache import PrefetchCache
+from watson_extension.core.platform.integrations import (
+    IntegrationsCore,
+    IntegrationType,
+)
+
+app = Quart(__name__)
+
+
+def conversation(session_id: str = "session-1"):
+    return app.test_request_context("/", headers={"x-rh-session-id": session_id})
+
+
+class Loader:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+@pytest.fixture
+async def aiohttp_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+async def test_get_or_load_within_a_conversation():
+    cache = ConversationCache()
+    loader = Loader("first", "second")
+
+    async with conversation():
+        assert await cache.get_or_load("resource", 1, loader) == "first"
+        assert await cache.get_or_load("resource", 1, loader) == "first"
+    async with conversation():
+        assert await cache.get_or_load("resource", 1, loader) == "first"
+    async with conversation("session-2"):
+        assert await cache.get_or_load("resource", 1, loader) == "second"
+
+    assert loader.calls == 2
+
+
+async def test_get_or_load_without_session_is_not_cached():
+    cache = ConversationCache()
+    loader = Loader("value")
+
+    await cache.get_or_load("resource", 1, loader)
+    async with app.test_request_context("/"):
+        await cache.get_or_load("resource", 1, loader)
+        await cache.get_or_load("resource", 1, loader)
+
+    assert loader.calls == 3
+
+
+async def test_get_or_load_does_not_cache_none():
+    cache = ConversationCache()
+    loader = Loader(None, "value")
+
+    async with conversation():
+        assert await cache.get_or_load("resource", 1, loader) is None
+        assert await cache.get_or_load("resource", 1, loader) == "value"
+
+
+async def test_session_expires():
+    cache = ConversationCache(ttl=0.01)
+    loader = Loader("first", "second")
+
+    async with conversation():
+        await cache.get_or_load("resource", 1, loader)
+    # Other sessions prune the expired ones
+    await asyncio.sleep(0.02)
+    async with conversation("session-2"):
+        await cache.get_or_load("resource", 1, Loader("other"))
+    assert len(cache._sessions) == 1
+
+    async with conversation():
+        assert await cache.get_or_load("resource", 1, loader) == "second"
+
+
+async def test_put_and_invalidate():
+    cache = ConversationCache()
+
+    async with conversation():
+        cache.put("resource", 1, "one")
+        cache.put("resource", 2, "two")
+        cache.put("other", 1, "other")
+
+        cache.invalidate("resource", 1)
+        assert await cache.get_or_load("resource", 1, Loader("reloaded")) == "reloaded"
+        assert await cache.get_or_load("resource", 2, Loader("unused")) == "two"
+
+        cache.invalidate("resource")
+        assert await cache.get_or_load("resource", 2, Loader("reloaded")) == "reloaded"
+        assert await cache.get_or_load("other", 1, Loader("unused")) == "other"
+
+
+async def test_metrics():
+    metrics = Registry()
+    cache = ConversationCache(metrics_registry=metrics, app_name="test-app")
+
+    async with conversation():
+        await cache.get_or_load("resource", 1, Loader("value"))
+        await cache.get_or_load("resource", 1, Loader("value"))
+
+    requests = metrics.get("conversation_cache_requests_total")
+    assert requests.get({"resource": "resource", "result": "miss"}) == 1
+    assert requests.get({"resource": "resource", "result": "hit"}) == 1
+
+
+async def test_chrome_favorites_flow(session, aiohttp_mock):
+    user = {
+        "data": {
+            "accountId": "1",
+            "firstLogin": False,
+            "dayOne": False,
+            "lastLogin": "",
+            "lastVisitedPages": [],
+            "favoritePages": [],
+        }
+    }
+    aiohttp_mock.get("/api/chrome-service/v1/user", body=json.dumps(user), repeat=True)
+    aiohttp_mock.post("/api/chrome-service/v1/favorite-pages", body="")
+    client = ChromeServiceClientHttp(
+        ChromeServiceURL(""),
+        FixedUserIdentityProvider(),
+        PlatformRequest(session),
+        ConversationCache(),
+        PrefetchCache(),
+    )
+
+    def user_requests():
+        return sum(
+            len(calls)
+            for key, calls in aiohttp_mock.requests.items()
+            if key[0] == "GET"
+        )
+
+    async with conversation():
+        await client.get_user()
+        await client.get_user()
+        assert user_requests() == 1
+
+        await client.modify_favorite_service("/insights/advisor")
+        await client.get_user()
+        assert user_requests() == 2
+
+
+async def test_integrations_update_flow(session, aiohttp_mock):
+    endpoint = {
+        "id": "1234",
+        "name": "old name",
+        "enabled": True,
+        "type": "webhook",
+        "sub_type": None,
+        "properties": {"url": "https://example.com"},
+    }
+    aiohttp_mock.get(
+        re.compile(r"^/api/integrations/v1.0/endpoints\?.*"),
+        body=json.dumps({"data": [endpoint]}),
+    )
+    aiohttp_mock.get(
+        "/api/integrations/v1.0/endpoints/1234",
+        body=json.dumps(endpoint),
+        repeat=True,
+    )
+    aiohttp_mock.put("/api/integrations/v1.0/endpoints/1234", status=500)
+    aiohttp_mock.put("/api/integrations/v1.0/endpoints/1234", repeat=True)
+    conversation_cache = ConversationCache()
+    core = IntegrationsCore(
+        IntegrationsClientHttp(
+            PlatformNotificationsURL(""),
+            FixedUserIdentityProvider(),
+            PlatformRequest(session),
+        ),
+        sources_client=None,
+        fan_out=FanOut(),
+        conversation_cache=conversation_cache,
+    )
+
+    def endpoint_requests():
+        return sum(
+            len(calls)
+            for key, calls in aiohttp_mock.requests.items()
+            if key[0] == "GET"
+            and str(key[1]) == "/api/integrations/v1.0/endpoints/1234"
+        )
+
+    async with conversation():
+        # Listed payloads are not the full endpoint, they are never reused
+        await core.integrations_client.fetch_integrations()
+        assert not await core.integration_update_name(
+            IntegrationType.NOTIFICATIONS, "1234", "new name"
+        )
+        assert endpoint_requests() == 1
+
+        # The failed update kept the retrieved payload for the retry
+        assert await core.integration_update_name(
+            IntegrationType.NOTIFICATIONS, "1234", "new name"
+        )
+        assert endpoint_requests() == 1
+
+        # The update invalidated it
+        assert await core.integration_update_url(
+            IntegrationType.NOTIFICATIONS, "1234", "https://example.org"
+        )
+        assert endpoint_requests() == 2
+
+    put_bodies = [
+        call.kwargs["json"]
+        for key, calls in aiohttp_mock.requests.items()
+        if key[0] == "PUT"
+        for call in calls
+    ]
+    assert [body["name"] for body in put_bodies[:2]] == ["new name", "new name"]
+    assert put_bodies[2]["properties"]["url"] == "https://example.org"
+    assert put_bodies[2]["type"] == "webhook"
@@ -9,6 +9,7 @@ import quart
 from .. import async_value
 
 from common.identity import QuartWatsonExtensionUserIdentityProvider
+from common.timing import ensure_phase_timer
 
 
 async def test_quart_user_identity_provider():
@@ -34,3 +35,34 @@ async def test_quart_user_identity_fails_on_missing_header():
     testee = QuartWatsonExtensionUserIdentityProvider(request, MagicMock())
     with pytest.raises(BadRequest):
         await testee.get_user_identity()
+
+
+async def test_quart_user_identity_provider_loads_the_session_once():
+    request = MagicMock(quart.Request)
+    request.headers = {"x-rh-session-id": "123456"}
+
+    session = Session(key="123456", user_id="org/user-id", user_identity="identity")
+    session_storage = MagicMock(SessionStorage)
+    session_storage.get = MagicMock(return_value=async_value(session))
+
+    testee = QuartWatsonExtensionUserIdentityProvider(request, session_storage)
+    assert await testee.get_session() is session
+    assert await testee.get_user_identity() == "identity"
+    session_storage.get.assert_called_once_with("123456")
+
+
+async def test_quart_user_identity_provider_times_the_session_lookup():
+    request = MagicMock(quart.Request)
+    request.headers = {"x-rh-session-id": "123456"}
+
+    session_storage = MagicMock(SessionStorage)
+    session_storage.get = MagicMock(
+        return_value=async_value(
+            Session(key="123456", user_id="user-id", user_identity="identity")
+        )
+    )
+
+    timer = ensure_phase_timer()
+    testee = QuartWatsonExtensionUserIdentityProvider(request, session_storage)
+    await testee.get_user_identity()
+    assert "session" in timer.breakdown()
@@ -0,0 +1,51 @@
+import json
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+
+from watson_extension.clients.json_stream import stream_json_items, top_k
+
+
+@pytest.fixture
+async def aiohttp_mock():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+async def session():
+    session = aiohttp.ClientSession()
+    yield session
+    await session.close()
+
+
+async def async_iter(items):
+    for item in items:
+        yield item
+
+
+async def test_stream_json_items(session, aiohttp_mock) -> None:
+    aiohttp_mock.get(
+        "http://service/items",
+        body=json.dumps(
+            {
+                "status": "ok",
+                "meta": {"count": 3},
+                "data": [{"id": 1, "tags": ["a"]}, {"id": 2, "nested": {"x": 1.5}}, 3],
+            }
+        ),
+    )
+    response = await session.get("http://service/items")
+
+    top_level = {}
+    items = [item async for item in stream_json_items(response, "data", top_level)]
+    assert items == [{"id": 1, "tags": ["a"]}, {"id": 2, "nested": {"x": 1.5}}, 3]
+    assert top_level == {"status": "ok"}
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 10])
+async def test_top_k_matches_sorted(k) -> None:
+    items = [{"id": i, "risk": i % 4} for i in range(20)]
+    expected = sorted(items, key=lambda i: i["risk"], reverse=True)[:k]
+    assert await top_k(async_iter(items), k, key=lambda i: i["risk"]) == expected
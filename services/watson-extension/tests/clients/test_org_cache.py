@@ -0,0 +1,195 @@
+import asyncio
+import base64
+import json
+from unittest import mock
+
+import pytest
+from aioprometheus import Registry
+
+from watson_extension.clients.org_cache import OrgCache
+
+
+def identity(org_id: str, user_id: str) -> str:
+    return base64.b64encode(
+        json.dumps(
+            {
+                "identity": {
+                    "org_id": org_id,
+                    "type": "User",
+                    "user": {"user_id": user_id},
+                }
+            }
+        ).encode("utf8")
+    ).decode("utf8")
+
+
+class Loader:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+async def test_get_or_load_caches_per_org():
+    cache = OrgCache({"rhsm": 60})
+    loader = Loader("org1", "org2")
+
+    assert await cache.get_or_load("rhsm", identity("1", "a"), (), loader) == "org1"
+    # Same org, different user
+    assert await cache.get_or_load("rhsm", identity("1", "b"), (), loader) == "org1"
+    assert await cache.get_or_load("rhsm", identity("2", "a"), (), loader) == "org2"
+    assert loader.calls == 2
+
+
+async def test_get_or_load_caches_per_user():
+    cache = OrgCache({"advisor": 60})
+    loader = Loader("user a", "user b")
+
+    for _ in range(2):
+        assert (
+            await cache.get_or_load(
+                "advisor", identity("1", "a"), (), loader, per_user=True
+            )
+            == "user a"
+        )
+    assert (
+        await cache.get_or_load(
+            "advisor", identity("1", "b"), (), loader, per_user=True
+        )
+        == "user b"
+    )
+    assert loader.calls == 2
+
+
+async def test_get_or_load_keys_by_client_and_arguments():
+    cache = OrgCache({"rhsm": 60, "advisor": 60})
+    loader = Loader(1, 2, 3)
+
+    assert await cache.get_or_load("rhsm", identity("1", "a"), ("x",), loader) == 1
+    assert await cache.get_or_load("rhsm", identity("1", "a"), ("y",), loader) == 2
+    assert await cache.get_or_load("advisor", identity("1", "a"), ("x",), loader) == 3
+    assert await cache.get_or_load("rhsm", identity("1", "a"), ("x",), loader) == 1
+
+
+async def test_get_or_load_expires():
+    cache = OrgCache({"rhsm": 60})
+    loader = Loader("old", "new")
+
+    with mock.patch(
+        "watson_extension.clients.org_cache.time.monotonic", return_value=100.0
+    ) as monotonic:
+        assert await cache.get_or_load("rhsm", identity("1", "a"), (), loader) == "old"
+        monotonic.return_value = 159.0
+        assert await cache.get_or_load("rhsm", identity("1", "a"), (), loader) == "old"
+        monotonic.return_value = 160.0
+        assert await cache.get_or_load("rhsm", identity("1", "a"), (), loader) == "new"
+
+
+@pytest.mark.parametrize("ttls", [{}, {"rhsm": 0}])
+async def test_get_or_load_without_ttl_is_not_cached(ttls):
+    cache = OrgCache(ttls)
+    loader = Loader("value")
+
+    await cache.get_or_load("rhsm", identity("1", "a"), (), loader)
+    await cache.get_or_load("rhsm", identity("1", "a"), (), loader)
+    assert loader.calls == 2
+
+
+async def test_get_or_load_with_invalid_identity_is_not_cached():
+    cache = OrgCache({"rhsm": 60})
+    loader = Loader("value")
+
+    await cache.get_or_load("rhsm", "not an identity", (), loader)
+    await cache.get_or_load("rhsm", "not an identity", (), loader)
+    assert loader.calls == 2
+
+
+async def test_concurrent_misses_share_the_load():
+    cache = OrgCache({"rhsm": 60})
+    loader = Loader("value")
+
+    results = await asyncio.gather(
+        *[cache.get_or_load("rhsm", identity("1", "a"), (), loader) for _ in range(5)]
+    )
+    assert results == ["value"] * 5
+    assert loader.calls == 1
+
+
+async def test_errors_are_not_cached():
+    cache = OrgCache({"rhsm": 60})
+    loader = Loader(ValueError("boom"), "value")
+
+    with pytest.raises(ValueError):
+        await cache.get_or_load("rhsm", identity("1", "a"), (), loader)
+    assert await cache.get_or_load("rhsm", identity("1", "a"), (), loader) == "value"
+
+
+async def test_evicts_least_recently_used():
+    cache = OrgCache({"rhsm": 60}, max_entries=2)
+    loader = Loader(1, 2, 3, 4)
+
+    await cache.get_or_load("rhsm", identity("1", "a"), (), loader)
+    await cache.get_or_load("rhsm", identity("2", "a"), (), loader)
+    await cache.get_or_load("rhsm", identity("1", "a"), (), loader)
+    await cache.get_or_load("rhsm", identity("3", "a"), (), loader)
+
+    # Org 2 was the least recently used
+    assert await cache.get_or_load("rhsm", identity("1", "a"), (), loader) == 1
+    assert await cache.get_or_load("rhsm", identity("2", "a"), (), loader) == 4
+
+
+async def test_invalidate():
+    cache = OrgCache({"rhsm": 60, "advisor": 60})
+    rhsm = Loader("rhsm old", "rhsm new")
+    advisor = Loader("advisor old", "advisor new")
+    user_advisor = Loader("user old", "user new")
+
+    await cache.get_or_load("rhsm", identity("1", "a"), (), rhsm)
+    await cache.get_or_load("advisor", identity("1", "a"), (), advisor)
+    await cache.get_or_load(
+        "advisor", identity("1", "a"), ("user",), user_advisor, per_user=True
+    )
+
+    cache.invalidate(identity("1", "b"), "rhsm")
+    assert await cache.get_or_load("rhsm", identity("1", "a"), (), rhsm) == "rhsm new"
+    assert (
+        await cache.get_or_load("advisor", identity("1", "a"), (), advisor)
+        == "advisor old"
+    )
+
+    # Invalidating the org drops the entries of its users as well
+    cache.invalidate(identity("1", "b"))
+    assert (
+        await cache.get_or_load("advisor", identity("1", "a"), (), advisor)
+        == "advisor new"
+    )
+    assert (
+        await cache.get_or_load(
+            "advisor", identity("1", "a"), ("user",), user_advisor, per_user=True
+        )
+        == "user new"
+    )
+
+
+async def test_metrics():
+    metrics = Registry()
+    cache = OrgCache({"rhsm": 60}, metrics, "test-app")
+    loader = Loader("value")
+
+    await asyncio.gather(
+        cache.get_or_load("rhsm", identity("1", "a"), (), loader),
+        cache.get_or_load("rhsm", identity("1", "a"), (), loader),
+    )
+    await cache.get_or_load("rhsm", identity("1", "a"), (), loader)
+
+    requests = metrics.get("org_cache_requests_total")
+    assert requests.get({"client": "rhsm", "result": "miss"}) == 1
+    assert requests.get({"client": "rhsm", "result": "coalesced"}) == 1
+    assert requests.get({"client": "rhsm", "result": "hit"}) == 1
@@ -0,0 +1,110 @@
+import pytest
+from aioprometheus import Registry
+from pytest_mock_resources import create_redis_fixture, RedisConfig
+from quart import Quart
+from redis.asyncio import StrictRedis
+
+from watson_extension.clients.prefetch_cache import PrefetchCache, warming
+
+redis_fixture = create_redis_fixture()
+
+app = Quart(__name__)
+
+
+def conversation(session_id: str = "session-1"):
+    return app.test_request_context("/", headers={"x-rh-session-id": session_id})
+
+
+class Fetch:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.payload
+
+
+@pytest.fixture(scope="session")
+def pmr_redis_config() -> RedisConfig:
+    return RedisConfig(image="docker.io/valkey/valkey:8.1.4")
+
+
+@pytest.fixture
+def redis(redis_fixture):
+    return StrictRedis(**redis_fixture.pmr_credentials.as_redis_kwargs())
+
+
+async def test_prefetched_payload_is_served_once(redis):
+    cache = PrefetchCache(redis)
+    warm = Fetch({"data": "prefetched"})
+    fetch = Fetch({"data": "fetched"})
+
+    async with conversation():
+        with warming():
+            assert await cache.fetch_json("resource", warm) == {"data": "prefetched"}
+
+        assert await cache.fetch_json("resource", fetch) == {"data": "prefetched"}
+        assert await cache.fetch_json("resource", fetch) == {"data": "fetched"}
+
+    assert warm.calls == 1
+    assert fetch.calls == 1
+
+
+async def test_prefetched_payload_belongs_to_the_session(redis):
+    cache = PrefetchCache(redis)
+
+    async with conversation():
+        with warming():
+            await cache.fetch_json("resource", Fetch("session-1"))
+    async with conversation("session-2"):
+        assert await cache.fetch_json("resource", Fetch("fetched")) == "fetched"
+
+
+async def test_invalidate(redis):
+    cache = PrefetchCache(redis)
+
+    async with conversation():
+        with warming():
+            await cache.fetch_json("resource", Fetch("prefetched"))
+        await cache.invalidate("resource")
+        assert await cache.fetch_json("resource", Fetch("fetched")) == "fetched"
+
+
+async def test_without_redis_goes_upstream():
+    cache = PrefetchCache()
+    fetch = Fetch("fetched")
+
+    async with conversation():
+        with warming():
+            await cache.fetch_json("resource", fetch)
+        await cache.fetch_json("resource", fetch)
+
+    assert fetch.calls == 2
+
+
+async def test_redis_errors_go_upstream():
+    # Nothing listens on this port
+    cache = PrefetchCache(StrictRedis(port=1))
+
+    async with conversation():
+        assert await cache.fetch_json("resource", Fetch("fetched")) == "fetched"
+        with warming():
+            assert await cache.fetch_json("resource", Fetch("fetched")) == "fetched"
+
+
+async def test_metrics(redis):
+    metrics = Registry()
+    cache = PrefetchCache(redis, metrics_registry=metrics, app_name="test-app")
+
+    async with conversation():
+        with warming():
+            await cache.fetch_json("resource", Fetch("prefetched"))
+        await cache.fetch_json("resource", Fetch("fetched"))
+        await cache.fetch_json("resource", Fetch("fetched"))
+
+    writes = metrics.get("prefetch_cache_writes_total")
+    reads = metrics.get("prefetch_cache_reads_total")
+    assert writes.get({"resource": "resource", "result": "success"}) == 1
+    assert reads.get({"resource": "resource", "result": "hit"}) == 1
+    assert reads.get({"resource": "resource", "result": "miss"}) == 1
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from aioprometheus import Registry
+
+from common.deadline import deadline_scope, get_deadline
+from watson_extension.clients.reference_data import ReferenceDataRegistry
+
+
+class Loader:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+        self.deadlines = []
+
+    async def __call__(self):
+        self.calls += 1
+        self.deadlines.append(get_deadline())
+        await asyncio.sleep(0)
+        result = self.results.pop(0) if len(self.results) > 1 else self.results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def name_of(item: dict) -> str:
+    return item["name"]
+
+
+async def test_get_loads_once_and_indexes_by_name():
+    registry = ReferenceDataRegistry()
+    loader = Loader([{"name": "Security", "id": 1}, {"name": "Performance", "id": 4}])
+
+    first, second = await asyncio.gather(
+        registry.get("categories", loader, name_of),
+        registry.get("categories", loader, name_of),
+    )
+    assert first is second
+    assert loader.calls == 1
+
+    assert first.get("performance") == {"name": "Performance", "id": 4}
+    assert first.get("SECURITY")["id"] == 1
+    assert first.get("unknown") is None
+    assert len(first) == 2
+
+
+async def test_get_load_error_is_not_cached():
+    registry = ReferenceDataRegistry()
+    loader = Loader(ValueError("boom"), [{"name": "a"}])
+
+    with pytest.raises(ValueError):
+        await registry.get("dataset", loader, name_of)
+
+    assert (await registry.get("dataset", loader, name_of)).get("a") is not None
+
+
+async def test_get_serves_stale_while_refreshing():
+    metrics = Registry()
+    registry = ReferenceDataRegistry(metrics, "test-app", refresh_interval=0)
+    loader = Loader([{"name": "old"}], [{"name": "new"}])
+
+    old = await registry.get("dataset", loader, name_of)
+    with deadline_scope(10):
+        # Stale, served as is and refreshed in the background without the deadline of the request
+        assert await registry.get("dataset", loader, name_of) is old
+    await asyncio.sleep(0.01)
+
+    assert loader.calls == 2
+    assert loader.deadlines[1] is None
+    assert (await registry.get("dataset", loader, name_of)).get("new") is not None
+
+    lookups = metrics.get("reference_data_lookups_total")
+    assert lookups.get({"dataset": "dataset", "freshness": "loaded"}) == 1
+    assert lookups.get({"dataset": "dataset", "freshness": "stale"}) == 2
+    assert metrics.get("reference_data_items").get({"dataset": "dataset"}) == 1
+    assert (
+        metrics.get("reference_data_refresh_total").get(
+            {"dataset": "dataset", "result": "success"}
+        )
+        >= 2
+    )
+
+
+async def test_get_keeps_dataset_when_refresh_fails():
+    metrics = Registry()
+    registry = ReferenceDataRegistry(
+        metrics, "test-app", refresh_interval=0, retry_interval=60
+    )
+    loader = Loader([{"name": "old"}], RuntimeError("unavailable"))
+
+    old = await registry.get("dataset", loader, name_of)
+    assert await registry.get("dataset", loader, name_of) is old
+    await asyncio.sleep(0.01)
+
+    # Not retried until retry_interval passed
+    assert await registry.get("dataset", loader, name_of) is old
+    await asyncio.sleep(0.01)
+    assert loader.calls == 2
+    assert (
+        metrics.get("reference_data_refresh_total").get(
+            {"dataset": "dataset", "result": "error"}
+        )
+        == 1
+    )
+
+
+async def test_invalidate():
+    registry = ReferenceDataRegistry()
+    loader = Loader([{"name": "old"}], [{"name": "new"}])
+
+    await registry.get("dataset", loader, name_of)
+    await registry.get("dataset", loader, name_of)
+    assert loader.calls == 1
+
+    registry.invalidate("dataset")
+    await registry.get("dataset", loader, name_of)
+    await asyncio.sleep(0.01)
+    assert (await registry.get("dataset", loader, name_of)).get("new") is not None
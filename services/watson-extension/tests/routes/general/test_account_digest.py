@@ -0,0 +1,172 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import injector
+import pytest
+from quart.typing import TestClientProtocol
+
+from common.fanout import FanOut
+from watson_extension.clients.insights.advisor import (
+    AdvisorClient,
+    FindRulesResponse,
+    Rule,
+)
+from watson_extension.clients.insights.rhsm import RhsmClient, SubscriptionInfo
+from watson_extension.clients.insights.vulnerability import CVEInfo, VulnerabilityClient
+from watson_extension.clients.openshift.advisor import (
+    AdvisorClient as OpenshiftAdvisorClient,
+    Recommendation,
+)
+from ..common import app_with_blueprint
+
+from watson_extension.routes.general.account_digest import blueprint
+from ... import async_value
+
+
+@pytest.fixture
+async def advisor_client() -> MagicMock:
+    return MagicMock(AdvisorClient)
+
+
+@pytest.fixture
+async def vulnerability_client() -> MagicMock:
+    return MagicMock(VulnerabilityClient)
+
+
+@pytest.fixture
+async def rhsm_client() -> MagicMock:
+    return MagicMock(RhsmClient)
+
+
+@pytest.fixture
+async def openshift_advisor_client() -> MagicMock:
+    return MagicMock(OpenshiftAdvisorClient)
+
+
+@pytest.fixture
+async def test_client(
+    advisor_client, vulnerability_client, rhsm_client, openshift_advisor_client
+) -> TestClientProtocol:
+    def injector_binder(binder: injector.Binder):
+        binder.bind(AdvisorClient, advisor_client)
+        binder.bind(VulnerabilityClient, vulnerability_client)
+        binder.bind(RhsmClient, rhsm_client)
+        binder.bind(OpenshiftAdvisorClient, openshift_advisor_client)
+        binder.bind(
+            FanOut,
+            FanOut(timeouts={"account_digest.vulnerability": 0.1}, default_timeout=1),
+        )
+
+    return app_with_blueprint(blueprint, injector_binder).test_client()
+
+
+@pytest.fixture
+def all_backends(
+    advisor_client, vulnerability_client, rhsm_client, openshift_advisor_client
+):
+    advisor_client.find_rules = MagicMock(
+        return_value=async_value(
+            FindRulesResponse(
+                rules=[
+                    Rule(
+                        id="rule-1",
+                        description="Critical rule",
+                        link="/insights/advisor/recommendations/rule-1",
+                    )
+                ],
+                link="/insights/advisor/recommendations",
+            )
+        )
+    )
+    vulnerability_client.find_cves = MagicMock(
+        return_value=async_value(
+            [
+                CVEInfo(
+                    id="CVE-1337-7331",
+                    systems_affected="1234",
+                    impact="Critical",
+                    link="/insights/vulnerability/cves/CVE-1337-7331",
+                )
+            ]
+        )
+    )
+    rhsm_client.check_subscriptions = MagicMock(
+        return_value=async_value(
+            [
+                SubscriptionInfo(number=10, category="active"),
+                SubscriptionInfo(number=2, category="expiring"),
+            ]
+        )
+    )
+    openshift_advisor_client.get_recommendations = MagicMock(
+        return_value=async_value(
+            [Recommendation(description="recommendation 1", total_risk=3, id="my-id")]
+        )
+    )
+
+
+async def test_summary(
+    test_client, all_backends, advisor_client, vulnerability_client, snapshot
+) -> None:
+    response = await test_client.get("/account_digest/summary")
+
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert data["has_errors"] is False
+    assert data["response"] == snapshot
+    advisor_client.find_rules.assert_called_once_with(
+        category_id=None, total_risk=4, sort=None, only_workloads=None
+    )
+    vulnerability_client.find_cves.assert_called_once_with(5)
+
+
+async def test_summary_empty(
+    test_client,
+    advisor_client,
+    vulnerability_client,
+    rhsm_client,
+    openshift_advisor_client,
+    snapshot,
+) -> None:
+    advisor_client.find_rules = MagicMock(
+        return_value=async_value(FindRulesResponse(rules=[], link=""))
+    )
+    vulnerability_client.find_cves = MagicMock(return_value=async_value([]))
+    rhsm_client.check_subscriptions = MagicMock(return_value=async_value([]))
+    openshift_advisor_client.get_recommendations = MagicMock(
+        return_value=async_value([])
+    )
+
+    response = await test_client.get("/account_digest/summary")
+
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert data["has_errors"] is False
+    assert data["response"] == snapshot
+
+
+async def test_summary_degrades_per_section(
+    test_client,
+    all_backends,
+    vulnerability_client,
+    openshift_advisor_client,
+    snapshot,
+) -> None:
+    async def slow_cves(vulnerability_limit):
+        await asyncio.sleep(10)
+        return []
+
+    vulnerability_client.find_cves = slow_cves
+    openshift_advisor_client.get_recommendations = MagicMock(
+        side_effect=ValueError("openshift advisor is down")
+    )
+
+    response = await test_client.get("/account_digest/summary")
+
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert data["has_errors"] is True
+    assert "I couldn't get your CVEs right now." in data["response"]
+    assert "I couldn't get your OpenShift recommendations" in data["response"]
+    assert "Critical rule" in data["response"]
+    assert data["response"] == snapshot
@@ -8,8 +8,10 @@ from watson_extension.clients.platform.chrome import (
     ChromeServiceClient,
     Favorite,
     User,
-    Service,
-    parse_links_into_obj,
+)
+from watson_extension.clients.platform.chrome_catalog import (
+    ChromeServicesCatalog,
+    ServicesCatalog,
 )
 from ..common import app_with_blueprint
 
@@ -60,72 +62,74 @@ async def chrome_client() -> MagicMock:
         )
     )
 
-    chrome_client.get_generated_services = MagicMock(
+    return chrome_client
+
+
+@pytest.fixture
+async def services_catalog() -> MagicMock:
+    services_catalog = MagicMock(ChromeServicesCatalog)
+    services_catalog.get = MagicMock(
         return_value=async_value(
-            Service(
-                description=service.get("description", ""),
-                id=service.get("id", ""),
-                links=parse_links_into_obj(service.get("links", [])),
-                title=service.get("title", ""),
-                href=service.get("href", ""),
+            ServicesCatalog.from_generated_services(
+                [
+                    {
+                        "description": "foo",
+                        "id": "str",
+                        "links": [
+                            {
+                                "title": "barGroup",
+                                "isGroup": True,
+                                "href": "/insights/bar",
+                                "group": "insights",
+                                "id": "barGroup",
+                                "links": [
+                                    {
+                                        "appId": "bar1",
+                                        "description": "barring this test from passing",
+                                        "filterable": False,
+                                        "href": "/insights/bar1/run-damnit",
+                                        "icon": "AITechnologyIcon",
+                                        "id": "bar1",
+                                        "title": "bar1",
+                                    },
+                                    {
+                                        "appId": "bar2",
+                                        "description": "barring this test from passing",
+                                        "filterable": False,
+                                        "href": "/insights/bar2/run-damnit",
+                                        "icon": "AITechnologyIcon",
+                                        "id": "bar2",
+                                        "isExternal": True,
+                                        "title": "bar2",
+                                    },
+                                    {
+                                        "appId": "bar3",
+                                        "description": "barring this test from passing",
+                                        "filterable": False,
+                                        "href": "/insights/bar3/run-damnit",
+                                        "icon": "AITechnologyIcon",
+                                        "id": "bar3",
+                                        "title": "bar3",
+                                    },
+                                ],
+                            }
+                        ],
+                        "title": "foo",
+                        "href": "/insights/foo",
+                        "group": "insights",
+                    }
+                ]
             )
-            for service in [
-                {
-                    "description": "foo",
-                    "id": "str",
-                    "links": [
-                        {
-                            "title": "barGroup",
-                            "isGroup": True,
-                            "href": "/insights/bar",
-                            "group": "insights",
-                            "id": "barGroup",
-                            "links": [
-                                {
-                                    "appId": "bar1",
-                                    "description": "barring this test from passing",
-                                    "filterable": False,
-                                    "href": "/insights/bar1/run-damnit",
-                                    "icon": "AITechnologyIcon",
-                                    "id": "bar1",
-                                    "title": "bar1",
-                                },
-                                {
-                                    "appId": "bar2",
-                                    "description": "barring this test from passing",
-                                    "filterable": False,
-                                    "href": "/insights/bar2/run-damnit",
-                                    "icon": "AITechnologyIcon",
-                                    "id": "bar2",
-                                    "isExternal": True,
-                                    "title": "bar2",
-                                },
-                                {
-                                    "appId": "bar3",
-                                    "description": "barring this test from passing",
-                                    "filterable": False,
-                                    "href": "/insights/bar3/run-damnit",
-                                    "icon": "AITechnologyIcon",
-                                    "id": "bar3",
-                                    "title": "bar3",
-                                },
-                            ],
-                        }
-                    ],
-                    "title": "foo",
-                    "href": "/insights/foo",
-                    "group": "insights",
-                }
-            ]
         )
     )
-    return chrome_client
+    return services_catalog
 
 
 @pytest.fixture
-async def test_client(chrome_client) -> TestClientProtocol:
+async def test_client(chrome_client, services_catalog) -> TestClientProtocol:
     def injector_binder(binder: injector.Binder):
         binder.bind(ChromeServiceClient, chrome_client)
+        binder.bind(ChromeServicesCatalog, services_catalog)
 
     return app_with_blueprint(blueprint, injector_binder).test_client()
 
@@ -161,6 +165,17 @@ async def test_favoriting_external_service(
     assert data["response"] == snapshot
 
 
+async def test_favoriting_misspelled_title(
+    test_client, chrome_client, snapshot
+) -> None:
+    response = await test_client.post(
+        "/chrome/favorites", query_string={"favoriting": True, "title": "BRA1"}
+    )
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert data["response"] == snapshot
+
+
 async def test_favoriting_already_favorited(
     test_client, chrome_client, snapshot
 ) -> None:
@@ -199,3 +214,10 @@ async def test_favoriting_remove_service_not_favorited(
     assert response.status == "200 OK"
     data = await response.get_json()
     assert data["response"] == snapshot
+
+
+async def test_favorite_options(test_client) -> None:
+    response = await test_client.get("/chrome/favorites/options")
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert data["response"] == [{"title": "foo", "href": "/insights/foo"}]
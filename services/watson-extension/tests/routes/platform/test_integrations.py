@@ -1,14 +1,17 @@
+import asyncio
 from unittest.mock import MagicMock, AsyncMock
 
 import injector
 import pytest
 from quart.typing import TestClientProtocol
 
+from common.fanout import FanOut
 from watson_extension.clients.platform import IntegrationInfo
 from watson_extension.clients.platform.integrations import IntegrationsClient
 from watson_extension.clients.platform.sources import SourcesClient
 from ..common import app_with_blueprint
 
+from watson_extension.core.platform.integrations import MAX_CONCURRENT_BULK_ACTIONS
 from watson_extension.routes.platform.integrations import blueprint
 from ... import async_value, get_test_template
 
@@ -28,6 +31,9 @@ async def test_client(integrations_client, sources_client) -> TestClientProtocol
     def injector_binder(binder: injector.Binder):
         binder.bind(IntegrationsClient, integrations_client)
         binder.bind(SourcesClient, sources_client)
+        binder.bind(
+            FanOut, FanOut(timeouts={"integrations.sources": 0.1}, default_timeout=1)
+        )
 
     return app_with_blueprint(blueprint, injector_binder).test_client()
 
@@ -148,6 +154,72 @@ async def test_fetch_integrations_error(
     }
 
 
+async def test_fetch_integrations_backend_failure(
+    test_client, integrations_client, sources_client
+) -> None:
+    integrations_client.fetch_integrations = MagicMock(
+        side_effect=ValueError("notifications is down")
+    )
+    sources_client.get_sources = MagicMock(
+        return_value=async_value(
+            (
+                True,
+                [
+                    IntegrationInfo(
+                        enabled=False,
+                        group="",
+                        id="5678",
+                        name="test sources",
+                        type="red_hat",
+                    )
+                ],
+            )
+        )
+    )
+
+    response = await test_client.get("/integrations/options")
+
+    assert response.status == "200 OK"
+    data = await response.get_json()
+    assert data["has_errors"] is True
+    assert [i["id"] for i in data["integrations"]] == ["5678"]
+
+
+async def test_fetch_integrations_backend_timeout(
+    test_client, integrations_client, sources_client
+) -> None:
+    async def slow_sources(**kwargs):
+        await asyncio.sleep(10)
+        return True, []
+
+    integrations_client.fetch_integrations = MagicMock(
+        return_value=async_value(
+            (
+                True,
+                [
+                    IntegrationInfo(
+                        enabled=True,
+                        group="webhook",
+                        id="1234",
+                        name="test integration",
+                        type="notifications",
+                    )
+                ],
+            )
+        )
+    )
+    sources_client.get_sources = slow_sources
+
+    start = asyncio.get_running_loop().time()
+    response = await test_client.get("/integrations/options")
+
+    # Answers with what notifications returned once sources runs out of time
+    assert asyncio.get_running_loop().time() - start < 5
+    data = await response.get_json()
+    assert data["has_errors"] is True
+    assert [i["id"] for i in data["integrations"]] == ["1234"]
+
+
 async def test_integration_actions(test_client, integrations_client) -> None:
     integration_pause_response = AsyncMock()
     integration_pause_response.ok = True
@@ -216,6 +288,98 @@ async def test_integration_actions_error(test_client, integrations_client) -> No
     )
 
 
+async def test_integration_bulk_actions(
+    test_client, integrations_client, sources_client
+) -> None:
+    ok_response = AsyncMock()
+    ok_response.ok = True
+    failed_response = AsyncMock()
+    failed_response.ok = False
+    integrations_client.integration_pause = MagicMock(
+        return_value=async_value(ok_response)
+    )
+    sources_client.sources_delete_integration = MagicMock(
+        return_value=async_value(failed_response)
+    )
+    integrations_client.retrieve_notification_endpoint = MagicMock(
+        side_effect=ValueError("notifications is down")
+    )
+
+    response = await test_client.post(
+        "/integrations/bulk_actions",
+        json={
+            "actions": [
+                {
+                    "integration_type": "notifications",
+                    "integration_id": "1234",
+                    "action": "pause",
+                },
+                {
+                    "integration_type": "red_hat",
+                    "integration_id": "5678",
+                    "action": "delete",
+                },
+                {
+                    "integration_type": "notifications",
+                    "integration_id": "9012",
+                    "action": "update_name",
+                    "new_value": "new name",
+                },
+            ]
+        },
+    )
+
+    assert response.status == "200 OK"
+    integrations_client.integration_pause.assert_called_once_with("1234")
+    sources_client.sources_delete_integration.assert_called_once_with("5678")
+
+    data = await response.get_json()
+    assert data["response"] == get_test_template(
+        "platform/integrations/integration_bulk_actions_summary.txt"
+    )
+
+
+async def test_integration_bulk_actions_bounded_concurrency(
+    test_client, integrations_client
+) -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def integration_resume(integration_id):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        response = AsyncMock()
+        response.ok = True
+        return response
+
+    integrations_client.integration_resume = integration_resume
+
+    response = await test_client.post(
+        "/integrations/bulk_actions",
+        json={
+            "actions": [
+                {
+                    "integration_type": "notifications",
+                    "integration_id": str(i),
+                    "action": "resume",
+                }
+                for i in range(10)
+            ]
+        },
+    )
+
+    assert response.status == "200 OK"
+    assert max_in_flight == MAX_CONCURRENT_BULK_ACTIONS
+
+    data = await response.get_json()
+    assert data["response"].startswith(
+        "Got it. All 10 changes to your integrations were made."
+    )
+
+
 async def test_integration_update(test_client, integrations_client) -> None:
     integration_retrieve_endpoint = AsyncMock()
     integration_retrieve_endpoint.ok = True
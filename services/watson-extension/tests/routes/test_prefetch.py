@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import injector
+import pytest
+from quart.typing import TestClientProtocol
+
+from watson_extension.clients.insights.advisor import AdvisorClient, FindRulesResponse
+from watson_extension.clients.insights.rhsm import RhsmClient
+from watson_extension.clients.platform.chrome import ChromeServiceClient
+from watson_extension.routes.prefetch import blueprint
+from .common import app_with_blueprint
+from .. import async_value
+
+
+@pytest.fixture
+async def chrome_service_client() -> MagicMock:
+    return MagicMock(ChromeServiceClient)
+
+
+@pytest.fixture
+async def advisor_client() -> MagicMock:
+    return MagicMock(AdvisorClient)
+
+
+@pytest.fixture
+async def rhsm_client() -> MagicMock:
+    return MagicMock(RhsmClient)
+
+
+@pytest.fixture
+async def test_client(
+    chrome_service_client, advisor_client, rhsm_client
+) -> TestClientProtocol:
+    def injector_binder(binder: injector.Binder):
+        binder.bind(ChromeServiceClient, chrome_service_client)
+        binder.bind(AdvisorClient, advisor_client)
+        binder.bind(RhsmClient, rhsm_client)
+
+    return app_with_blueprint(blueprint, injector_binder).test_client()
+
+
+async def test_prefetch(
+    test_client, chrome_service_client, advisor_client, rhsm_client
+) -> None:
+    chrome_service_client.get_user = MagicMock(side_effect=ValueError("chrome is down"))
+    advisor_client.find_rules = MagicMock(
+        return_value=async_value(FindRulesResponse(rules=[], link=""))
+    )
+    rhsm_client.check_subscriptions = MagicMock(return_value=async_value([]))
+
+    response = await test_client.post(
+        "/prefetch", headers={"x-rh-session-id": "session-1"}
+    )
+
+    assert response.status == "200 OK"
+    assert await response.get_json() == {
+        "prefetched": {
+            "chrome_user": False,
+            "advisor_recommendations": True,
+            "subscriptions": True,
+        }
+    }
+    advisor_client.find_rules.assert_called_once_with(
+        category_id=None, total_risk=4, sort=None, only_workloads=None
+    )
+    rhsm_client.check_subscriptions.assert_called_once_with(None)